@@ -6,9 +6,16 @@ AWS Bedrock API 호출 샘플 코드 (Claude 3 전용)
 """
 
 import json
+import threading
+import zlib
+
 import boto3
 import requests
+from botocore.config import Config
+from requests.adapters import HTTPAdapter
 
+from agents.disclosure_agent.utils.cache_utils import SqliteLRUCache, make_cache_key
+from agents.disclosure_agent.utils.path_utils import ensure_cache_directory
 from config.api_config import (
     AWS_REGION,
     AWS_BEARER_TOKEN_BEDROCK,
@@ -16,11 +23,71 @@ from config.api_config import (
     ANTHROPIC_SMALL_FAST_MODEL
 )
 
+# 동시에 여러 공시를 변환할 때 재사용할 연결 수
+BEDROCK_MAX_POOL_CONNECTIONS = 16
+# 연결 타임아웃 (초)
+BEDROCK_CONNECT_TIMEOUT = 10
+# 8000 토큰 생성은 수 분이 걸릴 수 있으므로 읽기 타임아웃을 넉넉하게 설정 (초)
+BEDROCK_READ_TIMEOUT = 300
+# 스로틀링/일시적 오류에 대한 botocore 재시도 횟수 (최초 호출 포함)
+BEDROCK_MAX_ATTEMPTS = 4
+
+# LLM 응답 캐시 최대 크기 (초과 시 가장 오래 사용하지 않은 응답부터 삭제)
+LLM_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# False로 바꾸면 모든 호출이 캐시를 사용하지 않음 (set_llm_cache_enabled 참고)
+LLM_CACHE_ENABLED = True
+
+# 프로세스 전체에서 공유하는 클라이언트 (boto3 클라이언트는 스레드 간 공유가 안전함)
+_shared_client = None
+_shared_http_session = None
+_shared_llm_cache = None
+_client_lock = threading.Lock()
+
+# 프로세스 전체 토큰 사용량 (프롬프트 캐시 적중 확인용)
+_usage_totals = {
+    'calls': 0,
+    'input_tokens': 0,
+    'output_tokens': 0,
+    'cache_read_input_tokens': 0,
+    'cache_creation_input_tokens': 0,
+}
+_usage_lock = threading.Lock()
+
+
+def create_bedrock_config(max_pool_connections=BEDROCK_MAX_POOL_CONNECTIONS, read_timeout=BEDROCK_READ_TIMEOUT,
+                          connect_timeout=BEDROCK_CONNECT_TIMEOUT, max_attempts=BEDROCK_MAX_ATTEMPTS):
+    """
+    Bedrock 클라이언트용 botocore 설정을 생성합니다.
+
+    Args:
+        max_pool_connections (int): 커넥션 풀 크기
+        read_timeout (int): 응답 읽기 타임아웃 (초)
+        connect_timeout (int): 연결 타임아웃 (초)
+        max_attempts (int): adaptive 모드 재시도 횟수 (최초 호출 포함)
+
+    Returns:
+        botocore.config.Config: 클라이언트 설정
+    """
+    return Config(
+        region_name=AWS_REGION,
+        max_pool_connections=max_pool_connections,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        retries={'max_attempts': max_attempts, 'mode': 'adaptive'},
+        tcp_keepalive=True,
+    )
 
-def create_bedrock_client():
+
+def create_bedrock_client(config=None):
     """
     AWS Bedrock 클라이언트를 생성합니다.
-    
+
+    호출할 때마다 새 클라이언트와 새 연결이 만들어지므로, 일반적인 호출에는
+    공유 클라이언트를 반환하는 get_bedrock_client()를 사용합니다.
+
+    Args:
+        config (botocore.config.Config, optional): 클라이언트 설정 (기본값: create_bedrock_config())
+
     Returns:
         boto3.client: AWS Bedrock 클라이언트 인스턴스
     """
@@ -29,25 +96,218 @@ def create_bedrock_client():
         region_name=AWS_REGION,
         aws_access_key_id='',  # AWS IAM 사용자 설정이 필요하다면 입력
         aws_secret_access_key='',  # AWS IAM 사용자 설정이 필요하다면 입력
+        config=config or create_bedrock_config(),
     )
 
 
-def invoke_claude_with_boto3(prompt, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature=0.5):
+def get_bedrock_client():
+    """
+    프로세스 전체에서 공유하는 Bedrock 클라이언트를 반환합니다. 최초 호출 시 생성됩니다.
+
+    Returns:
+        boto3.client: 공유 AWS Bedrock 클라이언트 인스턴스
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _client_lock:
+            if _shared_client is None:
+                _shared_client = create_bedrock_client()
+    return _shared_client
+
+
+def configure_bedrock_client(**kwargs):
+    """
+    주어진 설정으로 공유 Bedrock 클라이언트를 교체합니다.
+
+    Args:
+        **kwargs: create_bedrock_config()에 전달할 인자 (예: max_pool_connections=32)
+
+    Returns:
+        boto3.client: 새 공유 클라이언트 인스턴스
+    """
+    global _shared_client
+    with _client_lock:
+        _shared_client = create_bedrock_client(create_bedrock_config(**kwargs))
+    return _shared_client
+
+
+def _get_http_session():
+    """직접 API 호출에 사용할 keep-alive HTTP 세션을 반환합니다."""
+    global _shared_http_session
+    if _shared_http_session is None:
+        with _client_lock:
+            if _shared_http_session is None:
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(pool_maxsize=BEDROCK_MAX_POOL_CONNECTIONS))
+                _shared_http_session = session
+    return _shared_http_session
+
+
+class LLMResponseCache:
+    """
+    Bedrock 응답을 디스크에 저장하는 캐시입니다.
+
+    (model_id, 프롬프트, max_tokens, temperature)의 해시를 키로 사용하며,
+    크기 제한을 넘으면 가장 오래 사용하지 않은 응답부터 삭제합니다.
+    오류 응답은 저장하지 않습니다.
+    """
+
+    def __init__(self, db_path=None, max_bytes=LLM_CACHE_MAX_BYTES):
+        """
+        Args:
+            db_path: SQLite 데이터베이스 경로 (기본값: download/.cache/llm_responses.sqlite3)
+            max_bytes: 캐시 최대 크기 (바이트)
+        """
+        self.store = SqliteLRUCache(db_path or ensure_cache_directory() / 'llm_responses.sqlite3', max_bytes)
+
+    @staticmethod
+    def key_for(model_id, prompt, max_tokens, temperature):
+        """캐시 키를 생성합니다. 대화 메시지 목록도 프롬프트로 사용할 수 있습니다."""
+        if not isinstance(prompt, str):
+            prompt = json.dumps(prompt, sort_keys=True, ensure_ascii=False)
+        return make_cache_key(model_id, prompt, max_tokens, temperature)
+
+    def get(self, model_id, prompt, max_tokens, temperature):
+        """저장된 응답을 반환합니다. 없으면 None을 반환합니다."""
+        value = self.store.get(self.key_for(model_id, prompt, max_tokens, temperature))
+        if value is None:
+            return None
+        return zlib.decompress(value).decode('utf-8')
+
+    def set(self, model_id, prompt, max_tokens, temperature, text):
+        """응답을 저장합니다."""
+        value = zlib.compress(text.encode('utf-8'))
+        self.store.set(self.key_for(model_id, prompt, max_tokens, temperature), value)
+
+    def stats(self):
+        """적중/실패 횟수와 캐시 크기를 반환합니다."""
+        return self.store.stats()
+
+    def clear(self):
+        """저장된 모든 응답을 삭제합니다."""
+        self.store.clear()
+
+
+def get_llm_cache():
+    """
+    프로세스 전체에서 공유하는 LLM 응답 캐시를 반환합니다. 최초 호출 시 생성됩니다.
+
+    Returns:
+        LLMResponseCache: 공유 캐시 인스턴스
+    """
+    global _shared_llm_cache
+    if _shared_llm_cache is None:
+        with _client_lock:
+            if _shared_llm_cache is None:
+                _shared_llm_cache = LLMResponseCache()
+    return _shared_llm_cache
+
+
+def set_llm_cache_enabled(enabled):
+    """
+    LLM 응답 캐시 사용 여부를 전역으로 설정합니다.
+
+    Args:
+        enabled (bool): False면 use_cache를 지정하지 않은 모든 호출이 항상 Bedrock을 호출
+    """
+    global LLM_CACHE_ENABLED
+    LLM_CACHE_ENABLED = bool(enabled)
+
+
+def get_llm_cache_stats():
+    """
+    LLM 응답 캐시의 적중/실패 횟수와 크기를 반환합니다.
+
+    Returns:
+        dict: hits, misses, entries, size_bytes
+    """
+    return get_llm_cache().stats()
+
+
+def _cache_for(use_cache):
+    """호출에 사용할 캐시를 반환합니다. 캐시를 사용하지 않으면 None을 반환합니다."""
+    if use_cache is None:
+        use_cache = LLM_CACHE_ENABLED
+    if not use_cache:
+        return None
+    try:
+        return get_llm_cache()
+    except Exception as e:
+        print(f"LLM 응답 캐시를 열 수 없습니다 (캐시 없이 호출): {str(e)}")
+        return None
+
+
+def _cache_get(cache, model_id, prompt, max_tokens, temperature):
+    """
+    캐시에서 응답을 읽습니다. 캐시가 없거나 읽기에 실패하면 None을 반환합니다.
+
+    캐시 DB가 잠겨 있거나 손상되어도 변환은 Bedrock 호출로 계속 진행합니다.
+    """
+    if cache is None:
+        return None
+    try:
+        return cache.get(model_id, prompt, max_tokens, temperature)
+    except Exception as e:
+        print(f"LLM 응답 캐시 읽기 실패 (캐시 없이 호출): {str(e)}")
+        return None
+
+
+def _cache_set(cache, model_id, prompt, max_tokens, temperature, text):
+    """응답을 캐시에 저장합니다. 저장에 실패해도 이미 받은 응답은 그대로 사용합니다."""
+    if cache is None:
+        return
+    try:
+        cache.set(model_id, prompt, max_tokens, temperature, text)
+    except Exception as e:
+        print(f"LLM 응답 캐시 저장 실패: {str(e)}")
+
+
+def _record_usage(usage):
+    """응답의 토큰 사용량을 누적하고 출력합니다."""
+    if not usage:
+        return
+    with _usage_lock:
+        _usage_totals['calls'] += 1
+        for key in ('input_tokens', 'output_tokens', 'cache_read_input_tokens', 'cache_creation_input_tokens'):
+            _usage_totals[key] += usage.get(key) or 0
+    print(f"토큰 사용량 - 입력: {usage.get('input_tokens') or 0:,}, 출력: {usage.get('output_tokens') or 0:,}, "
+          f"캐시 읽기: {usage.get('cache_read_input_tokens') or 0:,}, "
+          f"캐시 쓰기: {usage.get('cache_creation_input_tokens') or 0:,}")
+
+
+def get_usage_stats():
+    """
+    이 프로세스에서 Bedrock 호출에 사용한 토큰 수를 반환합니다.
+
+    Returns:
+        dict: calls, input_tokens, output_tokens, cache_read_input_tokens, cache_creation_input_tokens
+    """
+    with _usage_lock:
+        return dict(_usage_totals)
+
+
+def invoke_claude_with_boto3(prompt, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature=0.5, use_cache=None):
     """
     boto3 클라이언트를 사용하여 Claude 모델을 호출합니다.
     
     Args:
-        prompt (str): 모델에게 전달할 프롬프트
+        prompt (str or list): 모델에게 전달할 프롬프트 (문자열 또는 content 블록 목록)
         model_id (str): 사용할 Claude 모델 ID
         max_tokens (int): 생성할 최대 토큰 수
         temperature (float): 생성 텍스트의 무작위성 정도 (0.0~1.0)
+        use_cache (bool, optional): 응답 캐시 사용 여부 (기본값: LLM_CACHE_ENABLED)
     
     Returns:
         str: 모델이 생성한 응답
     
     """
     
-    client = create_bedrock_client()
+    cache = _cache_for(use_cache)
+    cached = _cache_get(cache, model_id, prompt, max_tokens, temperature)
+    if cached is not None:
+        return cached
+
+    client = get_bedrock_client()
     
     # Claude 3 모델용 페이로드
     payload = {
@@ -71,28 +331,107 @@ def invoke_claude_with_boto3(prompt, model_id=ANTHROPIC_MODEL, max_tokens=1000,
         
         # 응답 처리
         response_body = json.loads(response['body'].read().decode('utf-8'))
-        return response_body['content'][0]['text']
+        _record_usage(response_body.get('usage'))
+        text = response_body['content'][0]['text']
+        _cache_set(cache, model_id, prompt, max_tokens, temperature, text)
+        return text
     
     except Exception as e:
         print(f"오류 발생: {str(e)}")
         return f"오류: {str(e)}"
 
 
-def invoke_claude_with_direct_api(prompt, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature=0.5):
+def stream_claude_with_boto3(prompt, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature=0.5, use_cache=None):
+    """
+    응답 스트림 API(invoke_model_with_response_stream)로 Claude 모델을 호출하고
+    생성되는 텍스트 조각을 도착하는 즉시 반환하는 제너레이터입니다.
+
+    첫 텍스트가 전체 생성이 끝나기 전에 도착하므로 긴 변환에서도 바로 결과를
+    쓰기 시작할 수 있습니다. 캐시에 있는 응답은 한 번에 반환합니다.
+
+    Args:
+        prompt (str or list): 모델에게 전달할 프롬프트 (문자열 또는 content 블록 목록)
+        model_id (str): 사용할 Claude 모델 ID
+        max_tokens (int): 생성할 최대 토큰 수
+        temperature (float): 생성 텍스트의 무작위성 정도 (0.0~1.0)
+        use_cache (bool, optional): 응답 캐시 사용 여부 (기본값: LLM_CACHE_ENABLED)
+
+    Yields:
+        str: 생성된 텍스트 조각. 오류가 발생하면 "오류: ..." 텍스트를 마지막 조각으로 반환
+    """
+    cache = _cache_for(use_cache)
+    cached = _cache_get(cache, model_id, prompt, max_tokens, temperature)
+    if cached is not None:
+        yield cached
+        return
+
+    payload = {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "messages": [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    }
+
+    parts = []
+    usage = {}
+    try:
+        response = get_bedrock_client().invoke_model_with_response_stream(
+            modelId=model_id,
+            body=json.dumps(payload)
+        )
+
+        for event in response['body']:
+            chunk = event.get('chunk')
+            if not chunk:
+                continue
+            data = json.loads(chunk['bytes'].decode('utf-8'))
+            if data.get('type') == 'content_block_delta' and data['delta'].get('type') == 'text_delta':
+                parts.append(data['delta']['text'])
+                yield data['delta']['text']
+            elif data.get('type') == 'message_start':
+                # 입력/캐시 토큰은 시작 이벤트에, 출력 토큰은 message_delta 이벤트에 포함됨
+                usage.update(data['message'].get('usage') or {})
+            elif data.get('type') == 'message_delta':
+                usage.update(data.get('usage') or {})
+
+    except Exception as e:
+        print(f"오류 발생: {str(e)}")
+        yield ('\n\n' if parts else '') + f"오류: {str(e)}"
+        return
+
+    _record_usage(usage)
+
+    # 끝까지 받은 응답만 캐시에 저장
+    _cache_set(cache, model_id, prompt, max_tokens, temperature, ''.join(parts))
+
+
+def invoke_claude_with_direct_api(prompt, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature=0.5,
+                                  use_cache=None):
     """
     직접 API 호출을 통해 Claude 모델을 호출합니다.
     
     Args:
-        prompt (str): 모델에게 전달할 프롬프트
+        prompt (str or list): 모델에게 전달할 프롬프트 (문자열 또는 content 블록 목록)
         model_id (str): 사용할 Claude 모델 ID
         max_tokens (int): 생성할 최대 토큰 수
         temperature (float): 생성 텍스트의 무작위성 정도 (0.0~1.0)
+        use_cache (bool, optional): 응답 캐시 사용 여부 (기본값: LLM_CACHE_ENABLED)
     
     Returns:
         str: 모델이 생성한 응답
     
     """
     
+    cache = _cache_for(use_cache)
+    cached = _cache_get(cache, model_id, prompt, max_tokens, temperature)
+    if cached is not None:
+        return cached
+    
     # API 엔드포인트
     url = f"https://bedrock-runtime.{AWS_REGION}.amazonaws.com/model/{model_id}/invoke"
     
@@ -117,12 +456,16 @@ def invoke_claude_with_direct_api(prompt, model_id=ANTHROPIC_MODEL, max_tokens=1
     
     try:
         # API 호출
-        response = requests.post(url, headers=headers, json=payload)
+        response = _get_http_session().post(url, headers=headers, json=payload,
+                                            timeout=(BEDROCK_CONNECT_TIMEOUT, BEDROCK_READ_TIMEOUT))
         
         # 응답 처리
         if response.status_code == 200:
             response_json = response.json()
-            return response_json['content'][0]['text']
+            _record_usage(response_json.get('usage'))
+            text = response_json['content'][0]['text']
+            _cache_set(cache, model_id, prompt, max_tokens, temperature, text)
+            return text
         else:
             return f"오류: {response.status_code} - {response.text}"
     
@@ -131,7 +474,7 @@ def invoke_claude_with_direct_api(prompt, model_id=ANTHROPIC_MODEL, max_tokens=1
         return f"오류: {str(e)}"
 
 
-def claude_chat(messages, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature=0.5):
+def claude_chat(messages, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature=0.5, use_cache=None):
     """
     대화 형식으로 Claude 모델과 상호작용할 수 있는 함수입니다.
     
@@ -140,6 +483,7 @@ def claude_chat(messages, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature
         model_id (str): 사용할 Claude 모델 ID
         max_tokens (int): 생성할 최대 토큰 수
         temperature (float): 생성 텍스트의 무작위성 정도 (0.0~1.0)
+        use_cache (bool, optional): 응답 캐시 사용 여부 (기본값: LLM_CACHE_ENABLED)
     
     Returns:
         str: 모델이 생성한 응답
@@ -153,7 +497,12 @@ def claude_chat(messages, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature
         response = claude_chat(messages)
     """
     
-    client = create_bedrock_client()
+    cache = _cache_for(use_cache)
+    cached = _cache_get(cache, model_id, messages, max_tokens, temperature)
+    if cached is not None:
+        return cached
+
+    client = get_bedrock_client()
     
     # Claude 3 모델용 페이로드
     payload = {
@@ -172,7 +521,10 @@ def claude_chat(messages, model_id=ANTHROPIC_MODEL, max_tokens=1000, temperature
         
         # 응답 처리
         response_body = json.loads(response['body'].read().decode('utf-8'))
-        return response_body['content'][0]['text']
+        _record_usage(response_body.get('usage'))
+        text = response_body['content'][0]['text']
+        _cache_set(cache, model_id, messages, max_tokens, temperature, text)
+        return text
     
     except Exception as e:
         print(f"오류 발생: {str(e)}")
@@ -1,9 +1,19 @@
 import os
+import itertools
 import requests
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from agents.disclosure_agent.utils.file_utils import DEFAULT_SPOOL_THRESHOLD, DisclosureArchive
 from agents.disclosure_agent.utils.path_utils import ensure_download_directory
 from config.api_config import API_KEY
+from .rate_limiter import QuotaExceededError, get_default_rate_limiter
+from .resilience import CircuitOpenError, get_default_resilience_policy
+from .response_cache import get_default_response_cache
 
 # OpenDART API status codes
 DART_STATUS_CODES = {
@@ -21,183 +31,714 @@ DART_STATUS_CODES = {
 # Base URL for all API calls
 BASE_URL = 'https://opendart.fss.or.kr/api'
 
+# Connection pool defaults for the shared HTTP session
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_TIMEOUT = 10
+
+# Seconds a successful API key validation is trusted before probing again
+API_KEY_VALIDATION_TTL = 3600
+
+# Failures worth retrying: OpenDART maintenance/system error statuses and overloaded HTTP responses
+RETRYABLE_STATUSES = ('800', '900')
+RETRYABLE_HTTP_STATUSES = (429, 500, 502, 503, 504)
+
 class DartAPIError(Exception):
     """Custom exception for OpenDART API errors"""
     pass
 
-# 고유번호 개발가이드
-# https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS001&apiId=2019018
-def validate_api_key():
+
+class DartQuotaExceededError(DartAPIError):
+    """Raised when the daily OpenDART usage limit is reached (status 011)"""
+    pass
+
+
+class DartTransientError(DartAPIError):
+    """Raised for failures that may succeed when retried (status 800/900, HTTP 429/5xx, timeouts)"""
+    pass
+
+
+class DartCircuitOpenError(DartAPIError):
+    """Raised when requests are halted because OpenDART kept failing"""
+    pass
+
+
+def is_retryable_error(error):
+    """Retry predicate used with the resilience policy"""
+    return isinstance(error, DartTransientError)
+
+
+def check_dart_status(data):
+    """
+    Raise DartAPIError if an OpenDART JSON response carries a non-normal status
+
+    Args:
+        data: Parsed JSON response body
+
+    Returns:
+        dict: The same response body for chaining
+    """
+    if data['status'] != '000':
+        error_desc = DART_STATUS_CODES.get(data['status'], 'Unknown error')
+        if data['status'] == '011':
+            raise DartQuotaExceededError(f"API Error [011]: {data.get('message', error_desc)}")
+        if data['status'] in RETRYABLE_STATUSES:
+            raise DartTransientError(f"API Error [{data['status']}]: {data.get('message', error_desc)}")
+        raise DartAPIError(f"API Error [{data['status']}]: {data.get('message', error_desc)}")
+    return data
+
+
+class DartClient:
+    """
+    OpenDART API client backed by a pooled, keep-alive HTTP session.
+
+    A single client reuses TCP/TLS connections to opendart.fss.or.kr across
+    calls, so iterating over many date windows or companies only pays the
+    handshake once per pooled connection.
+
+    Example:
+        with DartClient(pool_maxsize=32) as client:
+            disclosures = client.get_disclosure_list('00126380', '20250701', '20250707')
+    """
+
+    def __init__(self, api_key=API_KEY, base_url=BASE_URL,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 keep_alive=True, gzip=True, timeout=DEFAULT_TIMEOUT, rate_limiter=None, use_rate_limiter=True,
+                 response_cache=None, use_cache=True, resilience_policy=None, use_retry=True):
+        """
+        Args:
+            api_key: OpenDART API key (default: API_KEY from config)
+            base_url: Base URL for all API calls (default: BASE_URL)
+            pool_connections: Number of connection pools to cache (one per host)
+            pool_maxsize: Maximum number of connections kept alive per host
+            keep_alive: Whether to keep connections open between requests
+            gzip: Whether to request gzip/deflate compressed responses
+            timeout: Default request timeout in seconds
+            rate_limiter: DartRateLimiter applied before every request
+                (default: the process-wide limiter shared with other workers)
+            use_rate_limiter: Set to False to send requests without rate limiting
+            response_cache: DartResponseCache for JSON endpoints (default: the shared on-disk cache)
+            use_cache: Set to False to always query the API
+            resilience_policy: ResiliencePolicy retrying transient failures of every request
+                (default: the process-wide policy and circuit breaker)
+            use_retry: Set to False to fail on the first error
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self._key_validated_at = None
+        if use_retry:
+            self.resilience_policy = resilience_policy or get_default_resilience_policy()
+        else:
+            self.resilience_policy = None
+        if use_rate_limiter:
+            self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        else:
+            self.rate_limiter = None
+        if use_cache:
+            self.response_cache = response_cache or get_default_response_cache()
+        else:
+            self.response_cache = None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate' if gzip else 'identity',
+            'Connection': 'keep-alive' if keep_alive else 'close',
+        })
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying session and release pooled connections"""
+        self.session.close()
+
+    def _send(self, endpoint, params=None, timeout=None, stream=False):
+        """
+        Send a single GET request to an OpenDART endpoint with the API key attached
+
+        Args:
+            endpoint: Endpoint file name (e.g. 'list.json')
+            params: Query parameters without crtfc_key
+            timeout: Request timeout in seconds (default: client timeout)
+            stream: Whether to stream the response body
+
+        Returns:
+            requests.Response
+
+        Raises:
+            DartTransientError: On timeouts, connection errors and HTTP 429/5xx responses
+        """
+        url = f'{self.base_url}/{endpoint}'
+        query = {'crtfc_key': self.api_key}
+        if params:
+            query.update(params)
+
+        if self.rate_limiter is not None:
+            try:
+                self.rate_limiter.acquire()
+            except QuotaExceededError as e:
+                raise DartQuotaExceededError(str(e))
+
+        try:
+            response = self.session.get(url, params=query, timeout=timeout or self.timeout, stream=stream)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            raise DartTransientError(f'Network error on {endpoint}: {str(e)}')
+
+        if response.status_code in RETRYABLE_HTTP_STATUSES:
+            response.close()
+            raise DartTransientError(f'HTTP {response.status_code} from {endpoint}')
+        return response
+
+    def _with_retry(self, attempt, max_attempts=None):
+        """
+        Run one request attempt under the resilience policy
+
+        Args:
+            attempt: Callable without arguments performing the request
+            max_attempts: Override of the policy's number of attempts
+
+        Returns:
+            The return value of attempt
+        """
+        if self.resilience_policy is None:
+            return attempt()
+        try:
+            return self.resilience_policy.call(attempt, is_retryable=is_retryable_error, max_attempts=max_attempts)
+        except CircuitOpenError as e:
+            raise DartCircuitOpenError(str(e))
+
+    def _get(self, endpoint, params=None, timeout=None, stream=False):
+        """
+        Send a GET request, retrying transient failures
+
+        Returns:
+            requests.Response
+        """
+        return self._with_retry(lambda: self._send(endpoint, params, timeout=timeout, stream=stream))
+
+    @staticmethod
+    def _iter_body(response, chunk_size):
+        """Iterate over a streamed response body, treating a broken transfer as transient"""
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
+        except requests.exceptions.RequestException as e:
+            raise DartTransientError(f'Transfer interrupted: {str(e)}')
+
+    def _get_json(self, endpoint, params, max_attempts=None):
+        """
+        Fetch a JSON endpoint, serving and storing responses through the response cache
+
+        Maintenance (800) and system error (900) bodies are retried like
+        HTTP-level failures.
+
+        Args:
+            endpoint: Endpoint file name (e.g. 'list.json')
+            params: Query parameters without crtfc_key
+            max_attempts: Override of the policy's number of attempts
+
+        Returns:
+            tuple: (http_status, data) where data is None for non-200 responses
+        """
+        if self.response_cache is not None:
+            cached = self.response_cache.get(endpoint, params)
+            if cached is not None:
+                return 200, cached
+
+        def attempt():
+            response = self._send(endpoint, params)
+            if response.status_code != 200:
+                return response.status_code, None
+            try:
+                data = response.json()
+            except ValueError as e:
+                # A truncated or HTML error body during an incident
+                raise DartTransientError(f'Invalid JSON from {endpoint}: {str(e)}')
+            if data.get('status') in RETRYABLE_STATUSES:
+                check_dart_status(data)
+            return 200, data
+
+        status_code, data = self._with_retry(attempt, max_attempts=max_attempts)
+        if status_code == 200 and self.response_cache is not None:
+            self.response_cache.set(endpoint, params, data)
+        return status_code, data
+
+    def _check_status(self, data):
+        """
+        Check an OpenDART response status, stopping all workers for the day on status 011
+
+        Returns:
+            dict: The same response body for chaining
+        """
+        try:
+            return check_dart_status(data)
+        except DartQuotaExceededError:
+            if self.rate_limiter is not None:
+                self.rate_limiter.mark_exhausted()
+            raise
+
+    def validate_api_key(self, force=False):
+        """
+        Validate that the API key is working correctly
+
+        The key is probed with a one-row list.json request instead of the
+        multi-megabyte corpCode.xml archive, and a successful result is cached
+        on the client for API_KEY_VALIDATION_TTL seconds.
+
+        Args:
+            force: Ignore the cached result and probe the API again
+
+        Returns:
+            bool: True if API key is valid, False otherwise
+        """
+        now = time.time()
+        if not force and self._key_validated_at and now - self._key_validated_at < API_KEY_VALIDATION_TTL:
+            return True
+
+        today = datetime.now().strftime('%Y%m%d')
+        try:
+            response = self._get('list.json', {'bgn_de': today, 'end_de': today, 'page_count': 1})
+            if response.status_code != 200:
+                return False
+
+            data = response.json()
+            status = data.get('status')
+            if status == '011':
+                # Marks the daily quota as exhausted and raises DartQuotaExceededError
+                self._check_status(data)
+
+            # '013' only means there were no filings today, the key itself is fine
+            if status in ('000', '013'):
+                self._key_validated_at = now
+                return True
+
+            print(f"API key rejected: [{status}] {DART_STATUS_CODES.get(status, 'Unknown error')}")
+            return False
+        except DartQuotaExceededError:
+            print("API key usage limit exceeded for today")
+            return False
+        except Exception as e:
+            print(f"Error validating API key: {str(e)}")
+            return False
+
+    # 고유번호 개발가이드
+    # https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS001&apiId=2019018
+    def get_corp_code_archive(self):
+        """
+        Download the corpCode.xml archive listing every company registered in DART
+
+        Returns:
+            bytes: Zip archive containing CORPCODE.xml
+        """
+        response = self._get('corpCode.xml', timeout=60)
+
+        if response.status_code != 200:
+            raise DartAPIError(f'Failed to load corp code archive: {response.status_code}')
+
+        # Errors are reported as JSON/XML status bodies instead of a zip archive
+        if not response.content.startswith(b'PK'):
+            raise DartAPIError(f'Unexpected corp code response: {response.content[:200]!r}')
+
+        return response.content
+
+    # 공시검색 개발가이드
+    # https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS001&apiId=2019001
+    def get_disclosure_page(self, corp_code, start_date, end_date, page_no=1, page_count=100, pblntf_ty=None):
+        """
+        Fetch a single page of the disclosure list
+
+        Args:
+            corp_code: Company code (optional, None searches all companies)
+            start_date: Start date in YYYYMMDD format
+            end_date: End date in YYYYMMDD format
+            page_no: Page number, starting at 1
+            page_count: Number of results per page (max 100)
+            pblntf_ty: 공시 유형
+        Returns:
+            dict: Response body with 'list', 'page_no', 'page_count', 'total_count' and 'total_page'.
+                A window without filings (status 013) is returned as an empty page.
+        """
+        params = {
+            'bgn_de': start_date,
+            'end_de': end_date,
+            'page_no': page_no,
+            'page_count': page_count
+        }
+
+        if corp_code:
+            params['corp_code'] = corp_code
+        if pblntf_ty:
+            params['pblntf_ty'] = pblntf_ty
+
+        status_code, data = self._get_json('list.json', params)
+
+        if status_code != 200:
+            raise DartAPIError(f'Failed to load disclosure list: {status_code}')
+
+        if data.get('status') == '013':
+            return {'list': [], 'page_no': page_no, 'page_count': page_count, 'total_count': 0, 'total_page': 0}
+
+        data = self._check_status(data)
+        data.setdefault('list', [])
+        return data
+
+    def iter_disclosure_list(self, corp_code, start_date, end_date, page_count=100, pblntf_ty=None, max_workers=1):
+        """
+        Stream disclosures page by page, following page_no until total_page is reached
+
+        Disclosures are yielded as soon as each page arrives, so callers can
+        stop early without fetching the remaining pages. With max_workers > 1
+        the remaining pages are fetched in parallel once total_page is known,
+        while still being yielded in page order.
+
+        Args:
+            corp_code: Company code (optional, None searches all companies)
+            start_date: Start date in YYYYMMDD format
+            end_date: End date in YYYYMMDD format
+            page_count: Number of results per page (max 100)
+            pblntf_ty: 공시 유형
+            max_workers: Number of pages fetched concurrently after the first page
+
+        Yields:
+            dict: One disclosure document at a time
+        """
+        first_page = self.get_disclosure_page(corp_code, start_date, end_date, page_no=1,
+                                              page_count=page_count, pblntf_ty=pblntf_ty)
+        yield from first_page['list']
+
+        total_page = int(first_page.get('total_page') or 0)
+        if total_page <= 1:
+            return
+
+        def fetch(page_no):
+            return self.get_disclosure_page(corp_code, start_date, end_date, page_no=page_no,
+                                            page_count=page_count, pblntf_ty=pblntf_ty)
+
+        if max_workers <= 1:
+            for page_no in range(2, total_page + 1):
+                yield from fetch(page_no)['list']
+            return
+
+        # Keep at most max_workers pages in flight so an early stop wastes little work
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque()
+        next_page = 2
+        try:
+            while next_page <= total_page or pending:
+                while next_page <= total_page and len(pending) < max_workers:
+                    pending.append(executor.submit(fetch, next_page))
+                    next_page += 1
+                yield from pending.popleft().result()['list']
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_disclosure_list(self, corp_code, start_date=20250901, end_date=20250931, page_count=100, pblntf_ty=None,
+                            max_workers=1):
+        """
+        Fetch the full list of disclosures for a specific company, across all result pages
+
+        Args:
+            corp_code: Company code
+            start_date: Start date in YYYYMMDD format
+            end_date: End date in YYYYMMDD format
+            page_count: Number of results per page (max 100)
+            pblntf_ty: 공시 유형
+            max_workers: Number of pages fetched concurrently after the first page
+        Returns:
+            List of disclosure documents
+        """
+        disclosures = list(self.iter_disclosure_list(corp_code, start_date, end_date, page_count=page_count,
+                                                     pblntf_ty=pblntf_ty, max_workers=max_workers))
+        if not disclosures:
+            print("No disclosure documents found in the specified date range.")
+        return disclosures
+
+    # 단일회사 전체 재무제표 개발가이드
+    # https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019020
+    def get_financial_statement(self, corp_code, bsns_year, reprt_code, fs_div='CFS', max_retries=3):
+        """
+        Fetch financial statement information for a company
+
+        Args:
+            corp_code: Company code
+            bsns_year: Business year (e.g., '2023')
+            reprt_code: Report code
+                - '11011': Annual report
+                - '11012': Half-yearly report
+                - '11013': Q1 report
+                - '11014': Q3 report
+            fs_div: Financial statement division (default: 'CFS')
+                - CFS: Consolidated Financial Statement (연결재무제표)
+                - OFS: Separate Financial Statement (별도재무제표)
+            max_retries: Maximum number of attempts for transient failures (default: 3)
+
+        Returns:
+            Dictionary containing financial statement information
+        """
+        # Map report codes to correct values according to API documentation
+        report_code_mapping = {
+            # Original code: API expected code
+            '11011': '11011',  # Annual report
+            '11012': '11012',  # Half-yearly report
+            '11013': '11013',  # Q1 report
+            '11014': '11014',  # Q3 report
+        }
+
+        # Use the mapped report code if available, otherwise use the original
+        api_reprt_code = report_code_mapping.get(reprt_code, reprt_code)
+
+        params = {
+            'corp_code': corp_code,
+            'bsns_year': bsns_year,
+            'reprt_code': api_reprt_code,
+            'fs_div': fs_div
+        }
+
+        # Print request details for debugging
+        print(f"Request URL: {self.base_url}/fnlttSinglAcntAll.json")
+        print(f"Parameters: corp_code={corp_code}, year={bsns_year}, report_code={api_reprt_code}, fs_div={fs_div}")
+
+        # Transient failures (429, 5xx, 800/900, timeouts) are retried by the resilience policy
+        status_code, data = self._get_json('fnlttSinglAcntAll.json', params, max_attempts=max_retries)
+        if status_code != 200:
+            raise DartAPIError(f"HTTP Error: {status_code}")
+
+        data = self._check_status(data)
+        if 'list' not in data or not data['list']:
+            raise DartAPIError("API returned empty result set")
+        return data['list']
+
+    def download_document(self, rcept_no, save_path=None):
+        """
+        Download the original disclosure document as a zip file
+
+        Args:
+            rcept_no: The receipt number of the disclosure document
+            save_path: Path to save the downloaded file (optional)
+
+        Returns:
+            Path to the saved file or None if download failed
+        """
+        # Create a default filename if not provided
+        if not save_path:
+            save_path = ensure_download_directory() / f"disclosure_{rcept_no}.zip"
+        else:
+            # If save_path is provided but it's just a filename, add Downloads path
+            save_path = Path(save_path)
+            if not save_path.is_absolute():
+                save_path = ensure_download_directory() / save_path
+
+        def attempt():
+            response = self._send('document.xml', {'rcept_no': rcept_no}, timeout=30, stream=True)
+            with response:
+                if response.status_code != 200:
+                    print(f"Failed to download document: HTTP {response.status_code}")
+                    return None
+
+                # Create parent directories if they don't exist
+                save_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # Save the file; an interrupted transfer is retried from the start
+                with open(save_path, 'wb') as f:
+                    for chunk in self._iter_body(response, 8192):
+                        f.write(chunk)
+
+                return str(save_path)
+
+        try:
+            return self._with_retry(attempt)
+        except (DartQuotaExceededError, DartCircuitOpenError):
+            raise
+        except Exception as e:
+            print(f"Error downloading document: {str(e)}")
+            return None
+
+    def open_document(self, rcept_no, spool_threshold=DEFAULT_SPOOL_THRESHOLD):
+        """
+        Download a disclosure document into memory without touching the disk
+
+        The response body is spooled into memory (spilling to a temporary
+        file above spool_threshold bytes) and the XML members can then be
+        read lazily from the returned archive.
+
+        Args:
+            rcept_no: The receipt number of the disclosure document
+            spool_threshold: Size in bytes above which the archive is spilled to a temporary file
+
+        Returns:
+            DisclosureArchive: Archive to be closed by the caller
+        """
+        def attempt():
+            response = self._send('document.xml', {'rcept_no': rcept_no}, timeout=30, stream=True)
+
+            with response:
+                if response.status_code != 200:
+                    raise DartAPIError(f'Failed to download document: HTTP {response.status_code}')
+
+                chunks = self._iter_body(response, 65536)
+                first_chunk = next(chunks, b'')
+                # Errors are reported as an XML/JSON status body instead of a zip archive
+                if not first_chunk.startswith(b'PK'):
+                    raise DartAPIError(f'Unexpected document response for {rcept_no}: {first_chunk[:200]!r}')
+
+                return DisclosureArchive.from_chunks(itertools.chain([first_chunk], chunks),
+                                                     spool_threshold=spool_threshold)
+
+        return self._with_retry(attempt)
+
+
+# Shared client used by the module-level functions below
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client():
+    """
+    Return the process-wide DartClient, creating it on first use
+
+    Returns:
+        DartClient: Shared client instance
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = DartClient()
+    return _default_client
+
+
+def configure_default_client(**kwargs):
+    """
+    Replace the process-wide DartClient with one built from the given options
+
+    Args:
+        **kwargs: Keyword arguments passed to DartClient (e.g. pool_maxsize=32)
+
+    Returns:
+        DartClient: The new shared client instance
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is not None:
+            _default_client.close()
+        _default_client = DartClient(**kwargs)
+    return _default_client
+
+
+def get_resilience_stats():
+    """
+    Return retry and circuit breaker counters of the process-wide client
+
+    Returns:
+        dict: Counters from ResiliencePolicy.stats(), or an empty dict if retries are disabled
+    """
+    policy = get_default_client().resilience_policy
+    return policy.stats() if policy is not None else {}
+
+
+def validate_api_key(force=False):
     """
     Validate that the API key is working correctly
-    
+
+    Args:
+        force: Ignore the cached result and probe the API again
+
     Returns:
         bool: True if API key is valid, False otherwise
     """
-    url = f'{BASE_URL}/corpCode.xml'
-    
-    params = {
-        'crtfc_key': API_KEY
-    }
-    
-    try:
-        # Print the API key being used (first few and last few characters)
-        key_start = API_KEY[:4] 
-        key_end = API_KEY[-4:]
-        # print(f"Using API key: {key_start}...{key_end}")
-        
-        # Try a simple API request to validate the key
-        response = requests.get(url, params=params, timeout=10)
-        # print(f"API response status code: {response.status_code}")
-        
-        if response.status_code == 200:
-            # The corpCode.xml endpoint returns XML data, not JSON
-            # Just check if we got a successful response without errors
-            return True
-            
-        return False
-    except Exception as e:
-        print(f"Error validating API key: {str(e)}")
-        return False
+    return get_default_client().validate_api_key(force=force)
+
+
+def get_corp_code_archive():
+    """
+    Download the corpCode.xml archive listing every company registered in DART
+
+    Returns:
+        bytes: Zip archive containing CORPCODE.xml
+    """
+    return get_default_client().get_corp_code_archive()
+
+
+def get_disclosure_page(corp_code, start_date, end_date, page_no=1, page_count=100, pblntf_ty=None):
+    """
+    Fetch a single page of the disclosure list
+
+    Args:
+        corp_code: Company code (optional, None searches all companies)
+        start_date: Start date in YYYYMMDD format
+        end_date: End date in YYYYMMDD format
+        page_no: Page number, starting at 1
+        page_count: Number of results per page (max 100)
+        pblntf_ty: 공시 유형
+    Returns:
+        dict: Response body with 'list', 'total_count' and 'total_page'
+    """
+    return get_default_client().get_disclosure_page(
+        corp_code, start_date, end_date, page_no=page_no, page_count=page_count, pblntf_ty=pblntf_ty)
 
 
-# 공시검색 개발가이드
-# https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS001&apiId=2019001
-def get_disclosure_list(corp_code, start_date=20250901, end_date=20250931, page_count=100, pblntf_ty=None):
+def iter_disclosure_list(corp_code, start_date, end_date, page_count=100, pblntf_ty=None, max_workers=1):
     """
-    Fetch a list of recent disclosures for a specific company
-    
+    Stream disclosures page by page, following page_no until total_page is reached
+
+    Args:
+        corp_code: Company code (optional, None searches all companies)
+        start_date: Start date in YYYYMMDD format
+        end_date: End date in YYYYMMDD format
+        page_count: Number of results per page (max 100)
+        pblntf_ty: 공시 유형
+        max_workers: Number of pages fetched concurrently after the first page
+    Yields:
+        dict: One disclosure document at a time
+    """
+    return get_default_client().iter_disclosure_list(
+        corp_code, start_date, end_date, page_count=page_count, pblntf_ty=pblntf_ty, max_workers=max_workers)
+
+
+def get_disclosure_list(corp_code, start_date=20250901, end_date=20250931, page_count=100, pblntf_ty=None,
+                        max_workers=1):
+    """
+    Fetch the full list of disclosures for a specific company, across all result pages
+
     Args:
         corp_code: Company code
-        days_back: How many days back to search (default: 30)
+        start_date: Start date in YYYYMMDD format
+        end_date: End date in YYYYMMDD format
+        page_count: Number of results per page (max 100)
         pblntf_ty: 공시 유형
+        max_workers: Number of pages fetched concurrently after the first page
     Returns:
         List of disclosure documents
     """
-    url = f'{BASE_URL}/list.json'
-    
-    # Calculate date range (from X days ago until today)
-    # end_date = date_utils.get_current_date()  # Today in YYYYMMDD format
-    # start_date = date_utils.get_date_before(days_back)
-    
-    params = {
-        'crtfc_key': API_KEY,
-        'corp_code': corp_code,
-        'bgn_de': start_date,
-        'end_de': end_date,
-        'page_count': page_count  # Allow up to 100 results
-    }
-    
-    if pblntf_ty:
-        params['pblntf_ty'] = pblntf_ty
-
-    # print(f"Fetching disclosures from {start_date} to {end_date}...")
-    
-    response = requests.get(url, params=params, timeout=10)
-    
-    if response.status_code == 200:
-        data = response.json()
-        if data['status'] == '000':
-            if 'list' in data and data['list']:
-                return data['list']
-            else:
-                print("No disclosure documents found in the specified date range.")
-                return []
-        else:
-            error_desc = DART_STATUS_CODES.get(data['status'], 'Unknown error')
-            raise DartAPIError(f"API Error [{data['status']}]: {data.get('message', error_desc)}")
-    else:
-        raise DartAPIError(f'Failed to load disclosure list: {response.status_code}')
+    return get_default_client().get_disclosure_list(
+        corp_code, start_date=start_date, end_date=end_date, page_count=page_count, pblntf_ty=pblntf_ty,
+        max_workers=max_workers)
 
 
-# 단일회사 전체 재무제표 개발가이드
-# https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019020
 def get_financial_statement(corp_code, bsns_year, reprt_code, fs_div='CFS', max_retries=3):
     """
     Fetch financial statement information for a company
-    
+
     Args:
         corp_code: Company code
         bsns_year: Business year (e.g., '2023')
-        reprt_code: Report code
-            - '11011': Annual report
-            - '11012': Half-yearly report
-            - '11013': Q1 report
-            - '11014': Q3 report
-        fs_div: Financial statement division (default: 'CFS')
-            - CFS: Consolidated Financial Statement (연결재무제표)
-            - OFS: Separate Financial Statement (별도재무제표)
-        max_retries: Maximum number of retry attempts (default: 3)
-        
+        reprt_code: Report code ('11011', '11012', '11013', '11014')
+        fs_div: Financial statement division, 'CFS' or 'OFS' (default: 'CFS')
+        max_retries: Maximum number of attempts for transient failures (default: 3)
+
     Returns:
         Dictionary containing financial statement information
     """
-    url = f'{BASE_URL}/fnlttSinglAcntAll.json'
-    
-    # Map report codes to correct values according to API documentation
-    report_code_mapping = {
-        # Original code: API expected code
-        '11011': '11011',  # Annual report
-        '11012': '11012',  # Half-yearly report
-        '11013': '11013',  # Q1 report
-        '11014': '11014',  # Q3 report
-    }
-    
-    # Use the mapped report code if available, otherwise use the original
-    api_reprt_code = report_code_mapping.get(reprt_code, reprt_code)
-    
-    params = {
-        'crtfc_key': API_KEY,
-        'corp_code': corp_code,
-        'bsns_year': bsns_year,
-        'reprt_code': api_reprt_code,
-        'fs_div': fs_div
-    }
-    
-    # Print request details for debugging
-    print(f"Request URL: {url}")
-    print(f"Parameters: corp_code={corp_code}, year={bsns_year}, report_code={api_reprt_code}, fs_div={fs_div}")
-    
-    # Retry mechanism for temporary failures
-    retries = 0
-    while retries < max_retries:
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data['status'] == '000':
-                    if 'list' not in data or not data['list']:
-                        raise DartAPIError("API returned empty result set")
-                    return data['list']
-                else:
-                    # Get more descriptive error message based on status code
-                    error_desc = DART_STATUS_CODES.get(data['status'], 'Unknown error')
-                    error_msg = data.get('message', error_desc)
-                    raise DartAPIError(f"API Error [{data['status']}]: {error_msg}")
-            elif response.status_code == 429:  # Too Many Requests
-                retries += 1
-                if retries < max_retries:
-                    # Exponential backoff (wait 1s, then 2s, then 4s, etc.)
-                    wait_time = 2 ** (retries - 1)
-                    print(f"Rate limit reached, retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise DartAPIError(f"API rate limit exceeded after {max_retries} attempts")
-            else:
-                raise DartAPIError(f"HTTP Error: {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            retries += 1
-            if retries < max_retries:
-                wait_time = 2 ** (retries - 1)
-                print(f"Network error, retrying in {wait_time} seconds... Error: {str(e)}")
-                time.sleep(wait_time)
-            else:
-                raise DartAPIError(f"Network error after {max_retries} attempts: {str(e)}")
-    
-    raise DartAPIError(f"Failed to load business report after {max_retries} attempts")
-
+    return get_default_client().get_financial_statement(
+        corp_code, bsns_year, reprt_code, fs_div=fs_div, max_retries=max_retries)
 
 
 def download_document(rcept_no, save_path=None):
@@ -211,43 +752,18 @@ def download_document(rcept_no, save_path=None):
     Returns:
         Path to the saved file or None if download failed
     """
+    return get_default_client().download_document(rcept_no, save_path=save_path)
 
-    url = f'{BASE_URL}/document.xml'
-    
-    params = {
-        'crtfc_key': API_KEY,
-        'rcept_no': rcept_no
-    }
-    
-    try:
-        response = requests.get(url, params=params, timeout=30, stream=True)
-        
-        if response.status_code == 200:
-            # Create a default filename if not provided
-            if not save_path:
-                download_dir = ensure_download_directory()
-                filename = f"disclosure_{rcept_no}.zip"
-                save_path = download_dir / filename
-            else:
-                # If save_path is provided but it's just a filename, add Downloads path
-                save_path = Path(save_path)
-                if not save_path.is_absolute():
-                    save_path = ensure_download_directory() / save_path
-            
-            # Create parent directories if they don't exist
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-                
-            # Save the file
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        
-            # print(f"Document successfully downloaded to: {save_path}")
-            return str(save_path)
-        else:
-            print(f"Failed to download document: HTTP {response.status_code}")
-            return None
-    except Exception as e:
-        print(f"Error downloading document: {str(e)}")
-        return None
+
+def open_document(rcept_no, spool_threshold=DEFAULT_SPOOL_THRESHOLD):
+    """
+    Download a disclosure document into memory without touching the disk
+
+    Args:
+        rcept_no: The receipt number of the disclosure document
+        spool_threshold: Size in bytes above which the archive is spilled to a temporary file
+
+    Returns:
+        DisclosureArchive: Archive to be closed by the caller
+    """
+    return get_default_client().open_document(rcept_no, spool_threshold=spool_threshold)
@@ -0,0 +1,343 @@
+"""
+Asynchronous OpenDART API Client
+
+This module is the asyncio counterpart of dart_api. It uses aiohttp so that
+many list/financial statement/document requests can be in flight at once,
+bounded by a semaphore to stay polite towards the OpenDART servers.
+"""
+
+import asyncio
+from pathlib import Path
+
+import aiohttp
+
+from agents.disclosure_agent.utils.path_utils import ensure_download_directory
+from config.api_config import API_KEY
+from .dart_api import (BASE_URL, DEFAULT_TIMEOUT, RETRYABLE_HTTP_STATUSES, RETRYABLE_STATUSES, DartAPIError,
+                       DartCircuitOpenError, DartQuotaExceededError, DartTransientError, check_dart_status,
+                       is_retryable_error)
+from .rate_limiter import QuotaExceededError, get_default_rate_limiter
+from .resilience import CircuitOpenError, get_default_resilience_policy
+from .response_cache import get_default_response_cache
+
+# Default number of concurrent in-flight requests
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Block size read from the response and written to disk per thread hop when downloading documents
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class AsyncDartClient:
+    """
+    Asyncio OpenDART API client with bounded concurrency.
+
+    The client must be used from a running event loop. The underlying
+    aiohttp session is created lazily and reused for every request.
+
+    Example:
+        async with AsyncDartClient(max_concurrency=4) as client:
+            disclosures = await client.get_disclosure_list('00126380', '20250701', '20250707')
+    """
+
+    def __init__(self, api_key=API_KEY, base_url=BASE_URL, max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 timeout=DEFAULT_TIMEOUT, rate_limiter=None, use_rate_limiter=True, response_cache=None, use_cache=True,
+                 resilience_policy=None, use_retry=True):
+        """
+        Args:
+            api_key: OpenDART API key (default: API_KEY from config)
+            base_url: Base URL for all API calls (a local stub server can be used here)
+            max_concurrency: Maximum number of concurrent in-flight requests
+            timeout: Default request timeout in seconds
+            rate_limiter: DartRateLimiter applied before every request
+                (default: the process-wide limiter shared with other workers)
+            use_rate_limiter: Set to False to send requests without rate limiting
+            response_cache: DartResponseCache for JSON endpoints (default: the shared on-disk cache)
+            use_cache: Set to False to always query the API
+            resilience_policy: ResiliencePolicy retrying transient failures
+                (default: the process-wide policy shared with DartClient)
+            use_retry: Set to False to fail on the first error
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session = None
+        if use_rate_limiter:
+            self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        else:
+            self.rate_limiter = None
+        if use_cache:
+            self.response_cache = response_cache or get_default_response_cache()
+        else:
+            self.response_cache = None
+        if use_retry:
+            self.resilience_policy = resilience_policy or get_default_resilience_policy()
+        else:
+            self.resilience_policy = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying aiohttp session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'Accept-Encoding': 'gzip, deflate'},
+            )
+        return self._session
+
+    def _build_request(self, endpoint, params=None):
+        url = f'{self.base_url}/{endpoint}'
+        query = {'crtfc_key': self.api_key}
+        if params:
+            query.update({key: str(value) for key, value in params.items()})
+        return url, query
+
+    async def _acquire(self):
+        if self.rate_limiter is None:
+            return
+        try:
+            await self.rate_limiter.acquire_async()
+        except QuotaExceededError as e:
+            raise DartQuotaExceededError(str(e))
+
+    async def _check_status(self, data):
+        try:
+            return check_dart_status(data)
+        except DartQuotaExceededError:
+            if self.rate_limiter is not None:
+                # SQLite write, kept off the event loop like the limiter's own calls
+                await asyncio.to_thread(self.rate_limiter.mark_exhausted)
+            raise
+
+    async def _with_retry(self, attempt, max_attempts=None):
+        """Run one request attempt (a coroutine function) under the resilience policy"""
+        if self.resilience_policy is None:
+            return await attempt()
+        try:
+            return await self.resilience_policy.call_async(attempt, is_retryable=is_retryable_error,
+                                                           max_attempts=max_attempts)
+        except CircuitOpenError as e:
+            raise DartCircuitOpenError(str(e))
+
+    async def _get_json(self, endpoint, params=None, max_attempts=None):
+        """
+        Send a GET request and return the HTTP status and parsed JSON body
+
+        Timeouts, connection errors, HTTP 429/5xx and status 800/900 bodies
+        are retried by the resilience policy.
+
+        Returns:
+            tuple: (http_status, data) where data is None for non-200 responses
+        """
+        if self.response_cache is not None:
+            # Cache lookups hit SQLite and zlib, so they run in a worker thread
+            cached = await asyncio.to_thread(self.response_cache.get, endpoint, params)
+            if cached is not None:
+                return 200, cached
+
+        url, query = self._build_request(endpoint, params)
+
+        async def attempt():
+            # The semaphore is held per attempt so backoff sleeps do not block other requests
+            async with self._semaphore:
+                await self._acquire()
+                try:
+                    async with self._get_session().get(url, params=query) as response:
+                        if response.status in RETRYABLE_HTTP_STATUSES:
+                            raise DartTransientError(f'HTTP {response.status} from {endpoint}')
+                        if response.status != 200:
+                            return response.status, None
+                        data = await response.json(content_type=None)
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    raise DartTransientError(f'Network error on {endpoint}: {str(e)}')
+
+            if data.get('status') in RETRYABLE_STATUSES:
+                check_dart_status(data)
+            return 200, data
+
+        status, data = await self._with_retry(attempt, max_attempts=max_attempts)
+        if status == 200 and self.response_cache is not None:
+            await asyncio.to_thread(self.response_cache.set, endpoint, params, data)
+        return status, data
+
+    async def get_disclosure_page(self, corp_code, start_date, end_date, page_no=1, page_count=100, pblntf_ty=None):
+        """
+        Fetch a single page of the disclosure list
+
+        Args:
+            corp_code: Company code (optional, None searches all companies)
+            start_date: Start date in YYYYMMDD format
+            end_date: End date in YYYYMMDD format
+            page_no: Page number, starting at 1
+            page_count: Number of results per page (max 100)
+            pblntf_ty: 공시 유형
+
+        Returns:
+            dict: Response body with 'list', 'total_count' and 'total_page'
+        """
+        params = {
+            'bgn_de': start_date,
+            'end_de': end_date,
+            'page_no': page_no,
+            'page_count': page_count
+        }
+        if corp_code:
+            params['corp_code'] = corp_code
+        if pblntf_ty:
+            params['pblntf_ty'] = pblntf_ty
+
+        status, data = await self._get_json('list.json', params)
+        if status != 200:
+            raise DartAPIError(f'Failed to load disclosure list: {status}')
+
+        if data.get('status') == '013':
+            return {'list': [], 'page_no': page_no, 'page_count': page_count, 'total_count': 0, 'total_page': 0}
+
+        data = await self._check_status(data)
+        data.setdefault('list', [])
+        return data
+
+    async def iter_disclosure_list(self, corp_code, start_date, end_date, page_count=100, pblntf_ty=None):
+        """
+        Stream disclosures page by page. Once total_page is known the remaining
+        pages are requested concurrently (bounded by the client semaphore) and
+        yielded in page order.
+
+        Yields:
+            dict: One disclosure document at a time
+        """
+        first_page = await self.get_disclosure_page(corp_code, start_date, end_date, page_no=1,
+                                                    page_count=page_count, pblntf_ty=pblntf_ty)
+        for disclosure in first_page['list']:
+            yield disclosure
+
+        total_page = int(first_page.get('total_page') or 0)
+        if total_page <= 1:
+            return
+
+        tasks = [
+            asyncio.ensure_future(self.get_disclosure_page(corp_code, start_date, end_date, page_no=page_no,
+                                                           page_count=page_count, pblntf_ty=pblntf_ty))
+            for page_no in range(2, total_page + 1)
+        ]
+        try:
+            for task in tasks:
+                page = await task
+                for disclosure in page['list']:
+                    yield disclosure
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_disclosure_list(self, corp_code, start_date, end_date, page_count=100, pblntf_ty=None):
+        """
+        Fetch the full list of disclosures for a specific company, across all result pages
+
+        Args:
+            corp_code: Company code
+            start_date: Start date in YYYYMMDD format
+            end_date: End date in YYYYMMDD format
+            page_count: Number of results per page (max 100)
+            pblntf_ty: 공시 유형
+
+        Returns:
+            List of disclosure documents
+        """
+        return [disclosure async for disclosure in self.iter_disclosure_list(
+            corp_code, start_date, end_date, page_count=page_count, pblntf_ty=pblntf_ty)]
+
+    async def get_financial_statement(self, corp_code, bsns_year, reprt_code, fs_div='CFS', max_retries=3):
+        """
+        Fetch financial statement information for a company
+
+        Args:
+            corp_code: Company code
+            bsns_year: Business year (e.g., '2023')
+            reprt_code: Report code ('11011', '11012', '11013', '11014')
+            fs_div: Financial statement division, 'CFS' or 'OFS' (default: 'CFS')
+            max_retries: Maximum number of attempts for transient failures (default: 3)
+
+        Returns:
+            List of financial statement line items
+        """
+        params = {
+            'corp_code': corp_code,
+            'bsns_year': bsns_year,
+            'reprt_code': reprt_code,
+            'fs_div': fs_div
+        }
+
+        status, data = await self._get_json('fnlttSinglAcntAll.json', params, max_attempts=max_retries)
+        if status != 200:
+            raise DartAPIError(f"HTTP Error: {status}")
+
+        data = await self._check_status(data)
+        if not data.get('list'):
+            raise DartAPIError("API returned empty result set")
+        return data['list']
+
+    async def download_document(self, rcept_no, save_path=None):
+        """
+        Download the original disclosure document as a zip file
+
+        Args:
+            rcept_no: The receipt number of the disclosure document
+            save_path: Path to save the downloaded file (optional)
+
+        Returns:
+            Path to the saved file or None if download failed
+        """
+        url, query = self._build_request('document.xml', {'rcept_no': rcept_no})
+
+        if not save_path:
+            save_path = ensure_download_directory() / f"disclosure_{rcept_no}.zip"
+        else:
+            save_path = Path(save_path)
+            if not save_path.is_absolute():
+                save_path = ensure_download_directory() / save_path
+        await asyncio.to_thread(save_path.parent.mkdir, parents=True, exist_ok=True)
+
+        async def attempt():
+            async with self._semaphore:
+                await self._acquire()
+                try:
+                    async with self._get_session().get(url, params=query,
+                                                       timeout=aiohttp.ClientTimeout(total=30)) as response:
+                        if response.status in RETRYABLE_HTTP_STATUSES:
+                            raise DartTransientError(f'HTTP {response.status} from document.xml')
+                        if response.status != 200:
+                            print(f"Failed to download document: HTTP {response.status}")
+                            return None
+
+                        # File writes run in a worker thread so other requests keep flowing
+                        f = await asyncio.to_thread(open, save_path, 'wb')
+                        try:
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                await asyncio.to_thread(f.write, chunk)
+                        finally:
+                            await asyncio.to_thread(f.close)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    raise DartTransientError(f'Network error on document.xml: {str(e)}')
+
+            return str(save_path)
+
+        try:
+            return await self._with_retry(attempt)
+        except (DartQuotaExceededError, DartCircuitOpenError):
+            raise
+        except Exception as e:
+            print(f"Error downloading document: {str(e)}")
+            return None
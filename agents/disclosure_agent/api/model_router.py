@@ -0,0 +1,159 @@
+"""
+Model Router Module
+
+이 모듈은 변환할 공시 문서의 크기와 복잡도를 추정하여 Bedrock 호출에 사용할 Claude 모델을 고릅니다.
+단일판매·공급계약체결처럼 짧고 단순한 공시는 빠른 소형 모델(ANTHROPIC_SMALL_FAST_MODEL)로,
+긴 정기보고서나 병합 셀이 많은 복잡한 표는 대형 모델(ANTHROPIC_MODEL)로 보냅니다.
+라우팅 결정과 모델별 응답 시간은 출력하고 누적하여 조회할 수 있습니다.
+"""
+
+import re
+import threading
+
+from agents.disclosure_agent.utils.token_utils import estimate_tokens
+from config.api_config import ANTHROPIC_MODEL, ANTHROPIC_SMALL_FAST_MODEL
+
+# 소형 모델로 보낼 문서의 최대 추정 토큰 수
+SMALL_MODEL_MAX_TOKENS = 8000
+# 소형 모델로 보낼 문서의 최대 표 개수
+SMALL_MODEL_MAX_TABLES = 8
+# 소형 모델로 보낼 문서의 최대 병합 셀(COLSPAN/ROWSPAN > 1) 개수
+SMALL_MODEL_MAX_MERGED_CELLS = 40
+
+_TABLE_PATTERN = re.compile(r'<TABLE\b[^>]*>.*?</TABLE\s*>', re.S | re.I)
+_MERGED_CELL_PATTERN = re.compile(r'\b(?:COLSPAN|ROWSPAN)\s*=\s*["\']?0*(?:[2-9]|[1-9]\d+)', re.I)
+
+# 프로세스 전체에서 공유하는 라우터
+_default_router = None
+_router_lock = threading.Lock()
+
+
+def measure_complexity(content):
+    """
+    문서의 크기와 표 복잡도를 측정합니다.
+
+    Args:
+        content (str): Bedrock으로 보낼 XML 또는 텍스트
+
+    Returns:
+        dict: tokens (추정 토큰 수), tables (표 개수), merged_cells (병합 셀 개수),
+            table_ratio (표가 차지하는 문자 비율, 0.0 ~ 1.0)
+    """
+    tables = _TABLE_PATTERN.findall(content)
+    table_chars = sum(len(table) for table in tables)
+    return {
+        'tokens': estimate_tokens(content),
+        'tables': len(tables),
+        'merged_cells': len(_MERGED_CELL_PATTERN.findall(content)),
+        'table_ratio': table_chars / len(content) if content else 0.0,
+    }
+
+
+class ModelRouter:
+    """
+    문서 크기와 표 복잡도에 따라 대형/소형 모델을 고르는 스레드 안전한 라우터입니다.
+
+    세 기준(추정 토큰 수, 표 개수, 병합 셀 개수)을 모두 넘지 않는 문서만 소형 모델로
+    보냅니다. 표 비율은 판단에 쓰지 않고 기록만 합니다. 짧은 공시는 대부분 표 하나로
+    이루어져 있어 비율만으로는 복잡도를 구분할 수 없기 때문입니다.
+    """
+
+    def __init__(self, large_model=ANTHROPIC_MODEL, small_model=ANTHROPIC_SMALL_FAST_MODEL,
+                 small_max_tokens=SMALL_MODEL_MAX_TOKENS, small_max_tables=SMALL_MODEL_MAX_TABLES,
+                 small_max_merged_cells=SMALL_MODEL_MAX_MERGED_CELLS, enabled=True):
+        """
+        Args:
+            large_model (str): 길거나 복잡한 문서에 사용할 모델 ID
+            small_model (str): 짧고 단순한 문서에 사용할 모델 ID
+            small_max_tokens (int): 소형 모델로 보낼 문서의 최대 추정 토큰 수
+            small_max_tables (int): 소형 모델로 보낼 문서의 최대 표 개수
+            small_max_merged_cells (int): 소형 모델로 보낼 문서의 최대 병합 셀 개수
+            enabled (bool): False이면 모든 문서를 대형 모델로 보냄
+        """
+        self.large_model = large_model
+        self.small_model = small_model
+        self.small_max_tokens = small_max_tokens
+        self.small_max_tables = small_max_tables
+        self.small_max_merged_cells = small_max_merged_cells
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def route(self, content, label=None):
+        """
+        문서에 사용할 모델을 고르고 결정을 출력합니다.
+
+        Args:
+            content (str): Bedrock으로 보낼 XML 또는 텍스트
+            label (str, optional): 로그에 함께 출력할 이름 (예: 조각 번호)
+
+        Returns:
+            dict: model_id, tier ('small' 또는 'large'), reason 과 measure_complexity의 측정값
+        """
+        metrics = measure_complexity(content)
+        if not self.enabled or not self.small_model:
+            tier, reason = 'large', '라우팅 비활성화'
+        elif metrics['tokens'] > self.small_max_tokens:
+            tier, reason = 'large', f"토큰 {metrics['tokens']:,} > {self.small_max_tokens:,}"
+        elif metrics['tables'] > self.small_max_tables:
+            tier, reason = 'large', f"표 {metrics['tables']}개 > {self.small_max_tables}개"
+        elif metrics['merged_cells'] > self.small_max_merged_cells:
+            tier, reason = 'large', f"병합 셀 {metrics['merged_cells']}개 > {self.small_max_merged_cells}개"
+        else:
+            tier, reason = 'small', '짧고 단순한 문서'
+
+        decision = dict(metrics, tier=tier, reason=reason,
+                        model_id=self.small_model if tier == 'small' else self.large_model)
+        prefix = f"[{label}] " if label else ''
+        print(f"{prefix}모델 라우팅: {tier} ({decision['model_id']}) - {reason} "
+              f"(토큰 {metrics['tokens']:,}, 표 {metrics['tables']}개, 병합 셀 {metrics['merged_cells']}개, "
+              f"표 비율 {metrics['table_ratio']:.0%})")
+        return decision
+
+    def record_latency(self, decision, seconds, label=None):
+        """
+        라우팅된 호출의 응답 시간을 출력하고 모델별로 누적합니다.
+
+        Args:
+            decision (dict): route가 반환한 결정
+            seconds (float): 호출에 걸린 시간 (초)
+            label (str, optional): 로그에 함께 출력할 이름
+        """
+        with self._lock:
+            stats = self._stats.setdefault(decision['tier'], {
+                'model_id': decision['model_id'], 'calls': 0, 'tokens': 0, 'total_seconds': 0.0, 'max_seconds': 0.0,
+            })
+            stats['calls'] += 1
+            stats['tokens'] += decision['tokens']
+            stats['total_seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+        prefix = f"[{label}] " if label else ''
+        print(f"{prefix}{decision['tier']} 모델 응답 시간: {seconds:.1f}초")
+
+    def stats(self):
+        """
+        모델별 호출 수와 응답 시간을 반환합니다.
+
+        Returns:
+            dict: tier별 model_id, calls, tokens, total_seconds, max_seconds, avg_seconds
+        """
+        with self._lock:
+            return {
+                tier: dict(stats, avg_seconds=stats['total_seconds'] / stats['calls'])
+                for tier, stats in self._stats.items()
+            }
+
+
+def get_default_model_router():
+    """
+    프로세스 전체에서 공유하는 ModelRouter를 반환합니다.
+
+    Returns:
+        ModelRouter: 공유 라우터
+    """
+    global _default_router
+    if _default_router is None:
+        with _router_lock:
+            if _default_router is None:
+                _default_router = ModelRouter()
+    return _default_router
@@ -0,0 +1,295 @@
+"""
+OpenDART Rate Limiter Module
+
+This module provides a token-bucket rate limiter and a daily quota tracker
+for the OpenDART API. Both keep their state in a small SQLite database under
+the download cache directory, so every thread and every worker process on the
+machine draws from the same bucket and the same daily counter.
+"""
+
+import sqlite3
+import time
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+
+from agents.disclosure_agent.utils.path_utils import ensure_cache_directory
+
+# Sustained request rate (requests per second) and burst size
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 10
+
+# OpenDART allows 20,000 requests per API key per day. A reserve is kept so
+# that batches stop scheduling work before the key is actually blocked.
+DEFAULT_DAILY_LIMIT = 20000
+DEFAULT_DAILY_RESERVE = 500
+
+# OpenDART resets its daily counter at midnight Korea Standard Time
+KST = timezone(timedelta(hours=9))
+
+
+class QuotaExceededError(Exception):
+    """Raised when the persisted daily request quota has been used up"""
+    pass
+
+
+def _default_db_path():
+    return ensure_cache_directory() / 'rate_limit.sqlite3'
+
+
+def _connect(db_path):
+    """Open a SQLite connection suited to short cross-process transactions"""
+    conn = sqlite3.connect(str(db_path), timeout=30, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA busy_timeout=30000')
+    return conn
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket shared across threads and processes through SQLite.
+
+    Each acquire() takes a token from the bucket; tokens refill at `rate` per
+    second up to `capacity`. The bucket row is updated inside an IMMEDIATE
+    transaction, which serializes concurrent writers on the database lock.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, capacity=DEFAULT_BURST, db_path=None, name='opendart'):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+            db_path: SQLite database path (default: download/.cache/rate_limit.sqlite3)
+            name: Bucket name, so several independent buckets can share one database
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.db_path = db_path or _default_db_path()
+        self.name = name
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS token_bucket ('
+            ' name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)'
+        )
+        conn.execute(
+            'INSERT OR IGNORE INTO token_bucket (name, tokens, updated_at) VALUES (?, ?, ?)',
+            (self.name, self.capacity, time.time())
+        )
+
+    def _connection(self):
+        # SQLite connections must not be shared between threads
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = _connect(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    def try_acquire(self, tokens=1):
+        """
+        Take tokens from the bucket if available
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise seconds to wait before retrying
+        """
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT tokens, updated_at FROM token_bucket WHERE name = ?', (self.name,)
+            ).fetchone()
+            now = time.time()
+            available, updated_at = row if row else (self.capacity, now)
+            available = min(self.capacity, available + max(0.0, now - updated_at) * self.rate)
+
+            if available >= tokens:
+                available -= tokens
+                wait = 0.0
+            else:
+                wait = (tokens - available) / self.rate
+
+            conn.execute(
+                'INSERT OR REPLACE INTO token_bucket (name, tokens, updated_at) VALUES (?, ?, ?)',
+                (self.name, available, now)
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return wait
+
+    def acquire(self, tokens=1):
+        """Block until the requested number of tokens has been taken"""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens=1):
+        """Asyncio variant of acquire() that sleeps without blocking the event loop"""
+        while True:
+            # The SQLite transaction may wait on the busy timeout, so keep it off the event loop
+            wait = await asyncio.to_thread(self.try_acquire, tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+class DailyQuotaTracker:
+    """
+    Persisted per-day request counter for an API key.
+
+    The counter lives in SQLite and is keyed by the KST calendar day, so it
+    survives restarts and is shared by all worker processes.
+    """
+
+    def __init__(self, daily_limit=DEFAULT_DAILY_LIMIT, reserve=DEFAULT_DAILY_RESERVE, db_path=None, name='opendart'):
+        """
+        Args:
+            daily_limit: Number of requests allowed per day
+            reserve: Requests held back from scheduling as a safety margin
+            db_path: SQLite database path (default: download/.cache/rate_limit.sqlite3)
+            name: Quota name, so several API keys can share one database
+        """
+        self.daily_limit = daily_limit
+        self.reserve = reserve
+        self.db_path = db_path or _default_db_path()
+        self.name = name
+        self._local = threading.local()
+
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS daily_quota ('
+            ' name TEXT NOT NULL, day TEXT NOT NULL, used INTEGER NOT NULL,'
+            ' PRIMARY KEY (name, day))'
+        )
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = _connect(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    @property
+    def usable_limit(self):
+        """Number of requests that may be scheduled per day after the reserve"""
+        return max(0, self.daily_limit - self.reserve)
+
+    @staticmethod
+    def today():
+        """Current quota day in YYYYMMDD format (KST)"""
+        return datetime.now(KST).strftime('%Y%m%d')
+
+    def used(self):
+        """Number of requests recorded today"""
+        row = self._connection().execute(
+            'SELECT used FROM daily_quota WHERE name = ? AND day = ?', (self.name, self.today())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self):
+        """Number of requests that can still be scheduled today"""
+        return max(0, self.usable_limit - self.used())
+
+    def can_schedule(self, count=1):
+        """Check whether `count` more requests fit into today's quota"""
+        return self.remaining() >= count
+
+    def record(self, count=1):
+        """
+        Atomically reserve `count` requests from today's quota
+
+        Raises:
+            QuotaExceededError: If the requests would exceed the usable daily limit
+        """
+        conn = self._connection()
+        day = self.today()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT used FROM daily_quota WHERE name = ? AND day = ?', (self.name, day)
+            ).fetchone()
+            used = row[0] if row else 0
+            if used + count > self.usable_limit:
+                conn.execute('ROLLBACK')
+                raise QuotaExceededError(
+                    f"Daily OpenDART quota exhausted ({used}/{self.daily_limit}, reserve {self.reserve})"
+                )
+            conn.execute(
+                'INSERT OR REPLACE INTO daily_quota (name, day, used) VALUES (?, ?, ?)',
+                (self.name, day, used + count)
+            )
+            conn.execute('COMMIT')
+        except QuotaExceededError:
+            raise
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def mark_exhausted(self):
+        """Mark today's quota as used up, e.g. after OpenDART answered status 011"""
+        self._connection().execute(
+            'INSERT OR REPLACE INTO daily_quota (name, day, used) VALUES (?, ?, ?)',
+            (self.name, self.today(), self.daily_limit)
+        )
+
+
+class DartRateLimiter:
+    """
+    Combined rate limiter applied before every OpenDART request.
+
+    acquire() first reserves one request from the daily quota (failing fast
+    when it is used up) and then waits for a token from the shared bucket.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, daily_limit=DEFAULT_DAILY_LIMIT,
+                 reserve=DEFAULT_DAILY_RESERVE, db_path=None):
+        db_path = db_path or _default_db_path()
+        self.bucket = TokenBucketRateLimiter(rate=rate, capacity=burst, db_path=db_path)
+        self.quota = DailyQuotaTracker(daily_limit=daily_limit, reserve=reserve, db_path=db_path)
+
+    def acquire(self):
+        """Reserve quota for one request and wait for the rate limit"""
+        self.quota.record(1)
+        self.bucket.acquire(1)
+
+    async def acquire_async(self):
+        """Asyncio variant of acquire()"""
+        await asyncio.to_thread(self.quota.record, 1)
+        await self.bucket.acquire_async(1)
+
+    def can_schedule(self, count=1):
+        """Check whether `count` more requests fit into today's quota"""
+        return self.quota.can_schedule(count)
+
+    def remaining(self):
+        """Number of requests that can still be scheduled today"""
+        return self.quota.remaining()
+
+    def mark_exhausted(self):
+        """Stop every process from scheduling further requests today"""
+        self.quota.mark_exhausted()
+
+
+_default_rate_limiter = None
+_default_rate_limiter_lock = threading.Lock()
+
+
+def get_default_rate_limiter():
+    """
+    Return the process-wide DartRateLimiter, creating it on first use
+
+    Returns:
+        DartRateLimiter: Shared limiter instance
+    """
+    global _default_rate_limiter
+    if _default_rate_limiter is None:
+        with _default_rate_limiter_lock:
+            if _default_rate_limiter is None:
+                _default_rate_limiter = DartRateLimiter()
+    return _default_rate_limiter
@@ -0,0 +1,303 @@
+"""
+API Resilience Module
+
+This module provides the retry policy shared by every OpenDART call. Failed
+attempts are retried with decorrelated jitter backoff, and a circuit breaker
+stops sending requests while the service is down, so a DART outage fails a
+large batch within seconds instead of after minutes of timeouts. Retry and
+breaker counters are kept for monitoring.
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+# Retry defaults
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 20.0
+
+# Circuit breaker defaults
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+
+# Circuit breaker states
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker is open"""
+    pass
+
+
+def decorrelated_jitter(previous_delay, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY):
+    """
+    Next backoff delay using decorrelated jitter
+
+    The delay grows roughly threefold per attempt but is drawn at random
+    between base_delay and three times the previous delay, so concurrent
+    workers that failed together do not retry in lockstep.
+
+    Args:
+        previous_delay: Delay used before the previous attempt (base_delay for the first retry)
+        base_delay: Minimum delay in seconds
+        max_delay: Maximum delay in seconds
+
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    return min(max_delay, random.uniform(base_delay, max(base_delay, previous_delay * 3)))
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+
+    After failure_threshold consecutive failures the breaker opens and
+    rejects every call for recovery_timeout seconds. It then lets a single
+    trial call through (half open): a success closes it again, a failure
+    opens it for another recovery_timeout.
+    """
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, recovery_timeout=DEFAULT_RECOVERY_TIMEOUT):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds the breaker stays open before a trial call
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self.rejected_calls = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        """
+        Check whether a call may be sent now
+
+        Returns:
+            bool: False while the breaker is open
+        """
+        with self._lock:
+            if self.state == STATE_OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    self.rejected_calls += 1
+                    return False
+                self.state = STATE_HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == STATE_HALF_OPEN:
+                # Only one trial call at a time while probing a recovering service
+                if self._trial_in_flight:
+                    self.rejected_calls += 1
+                    return False
+                self._trial_in_flight = True
+            return True
+
+    def retry_after(self):
+        """Seconds until an open breaker lets a trial call through"""
+        with self._lock:
+            if self.state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        """Close the breaker after a successful call"""
+        with self._lock:
+            self.state = STATE_CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failed call and open the breaker once the threshold is reached"""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.state == STATE_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != STATE_OPEN:
+                    self.times_opened += 1
+                self.state = STATE_OPEN
+                self.opened_at = time.monotonic()
+
+    def reset(self):
+        """Close the breaker and forget past failures"""
+        with self._lock:
+            self.state = STATE_CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+
+class ResiliencePolicy:
+    """
+    Retry policy with decorrelated jitter backoff and a circuit breaker.
+
+    The policy does not decide which errors are transient; callers pass an
+    is_retryable predicate. Errors it rejects (e.g. an invalid parameter) are
+    raised immediately and do not count against the breaker, since they mean
+    the service itself answered.
+
+    Example:
+        policy = ResiliencePolicy(max_attempts=3)
+        data = policy.call(lambda: fetch_page(1), is_retryable=lambda e: isinstance(e, TimeoutError))
+        print(policy.stats())
+    """
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD, recovery_timeout=DEFAULT_RECOVERY_TIMEOUT,
+                 circuit_breaker=None):
+        """
+        Args:
+            max_attempts: Attempts per call, including the first one
+            base_delay: Minimum backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+            failure_threshold: Consecutive failures that open the circuit breaker
+            recovery_timeout: Seconds the circuit breaker stays open
+            circuit_breaker: CircuitBreaker to share with other policies (default: a new one)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = circuit_breaker or CircuitBreaker(failure_threshold, recovery_timeout)
+        self._counters = {'calls': 0, 'successes': 0, 'failures': 0, 'retries': 0, 'rejected': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _before_attempt(self):
+        if not self.breaker.allow_request():
+            self._count('rejected')
+            raise CircuitOpenError(
+                f'Circuit breaker open after repeated failures, retry in {self.breaker.retry_after():.0f}s'
+            )
+
+    def _after_failure(self, error, attempt, max_attempts, is_retryable):
+        """Record a failed attempt and return whether it should be retried"""
+        if not is_retryable(error):
+            # The service answered; the request itself was wrong
+            self.breaker.record_success()
+            return False
+
+        self.breaker.record_failure()
+        if attempt >= max_attempts:
+            return False
+        self._count('retries')
+        return True
+
+    def call(self, func, is_retryable, max_attempts=None):
+        """
+        Call func, retrying transient failures
+
+        Args:
+            func: Callable without arguments performing one attempt
+            is_retryable: Predicate deciding whether an exception is transient
+            max_attempts: Override of the policy's attempts for this call
+
+        Returns:
+            The return value of func
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejected the call
+            Exception: The last error raised by func
+        """
+        max_attempts = max(1, max_attempts or self.max_attempts)
+        self._count('calls')
+        delay = self.base_delay
+
+        for attempt in range(1, max_attempts + 1):
+            self._before_attempt()
+            try:
+                result = func()
+            except Exception as e:
+                if not self._after_failure(e, attempt, max_attempts, is_retryable):
+                    self._count('failures')
+                    raise
+                delay = decorrelated_jitter(delay, self.base_delay, self.max_delay)
+                print(f"Transient API error, retrying in {delay:.1f} seconds... Error: {str(e)}")
+                time.sleep(delay)
+                continue
+
+            self.breaker.record_success()
+            self._count('successes')
+            return result
+
+    async def call_async(self, func, is_retryable, max_attempts=None):
+        """
+        Async variant of call for coroutine functions
+
+        Args:
+            func: Coroutine function without arguments performing one attempt
+            is_retryable: Predicate deciding whether an exception is transient
+            max_attempts: Override of the policy's attempts for this call
+
+        Returns:
+            The result of the awaited coroutine
+        """
+        max_attempts = max(1, max_attempts or self.max_attempts)
+        self._count('calls')
+        delay = self.base_delay
+
+        for attempt in range(1, max_attempts + 1):
+            self._before_attempt()
+            try:
+                result = await func()
+            except Exception as e:
+                if not self._after_failure(e, attempt, max_attempts, is_retryable):
+                    self._count('failures')
+                    raise
+                delay = decorrelated_jitter(delay, self.base_delay, self.max_delay)
+                print(f"Transient API error, retrying in {delay:.1f} seconds... Error: {str(e)}")
+                await asyncio.sleep(delay)
+                continue
+
+            self.breaker.record_success()
+            self._count('successes')
+            return result
+
+    def stats(self):
+        """
+        Return retry and circuit breaker counters
+
+        Returns:
+            dict: calls, successes, failures, retries, rejected, breaker_state,
+                consecutive_failures and breaker_opened
+        """
+        with self._lock:
+            stats = dict(self._counters)
+        stats.update({
+            'breaker_state': self.breaker.state,
+            'consecutive_failures': self.breaker.consecutive_failures,
+            'breaker_opened': self.breaker.times_opened,
+        })
+        return stats
+
+
+_default_policy = None
+_default_policy_lock = threading.Lock()
+
+
+def get_default_resilience_policy():
+    """
+    Return the process-wide ResiliencePolicy, creating it on first use
+
+    The sync and async clients share it, so an outage seen by one of them
+    opens the breaker for both.
+
+    Returns:
+        ResiliencePolicy: Shared policy instance
+    """
+    global _default_policy
+    if _default_policy is None:
+        with _default_policy_lock:
+            if _default_policy is None:
+                _default_policy = ResiliencePolicy()
+    return _default_policy
@@ -0,0 +1,150 @@
+"""
+OpenDART Response Cache Module
+
+This module caches JSON responses of the OpenDART endpoints on disk. Entries
+are keyed on the endpoint plus the normalized query parameters (the API key
+is never part of the key) and expire according to how stable the data is:
+closed historical windows and past fiscal years do not change, while windows
+that include today are refreshed quickly.
+"""
+
+import json
+import threading
+import zlib
+from datetime import datetime
+
+from agents.disclosure_agent.utils.cache_utils import SqliteLRUCache, make_cache_key
+from agents.disclosure_agent.utils.path_utils import ensure_cache_directory
+from .rate_limiter import KST
+
+# Total size of cached responses before least recently used entries are evicted
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Time-to-live values in seconds (None = keep until evicted)
+TTL_IMMUTABLE = None
+TTL_OPEN_WINDOW = 10 * 60
+TTL_RECENT_FISCAL_YEAR = 24 * 60 * 60
+TTL_CURRENT_FISCAL_YEAR = 6 * 60 * 60
+TTL_DEFAULT = 60 * 60
+
+# Only responses that describe the data (found / not found) are cached
+CACHEABLE_STATUSES = ('000', '013')
+
+
+def normalize_params(params):
+    """
+    Normalize query parameters for use in a cache key
+
+    Args:
+        params: Query parameters (crtfc_key is dropped)
+
+    Returns:
+        str: Canonical, sorted representation of the parameters
+    """
+    normalized = {
+        key: str(value) for key, value in (params or {}).items()
+        if key != 'crtfc_key' and value is not None and value != ''
+    }
+    return json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+
+
+def ttl_for(endpoint, params):
+    """
+    Choose a time-to-live for an endpoint response
+
+    Args:
+        endpoint: Endpoint file name (e.g. 'list.json')
+        params: Query parameters of the request
+
+    Returns:
+        int or None: Seconds until expiry, None for effectively immutable data
+    """
+    params = params or {}
+    # OpenDART dates are KST days; a host ahead of KST would otherwise treat today's window as closed
+    now = datetime.now(KST)
+    today = now.strftime('%Y%m%d')
+
+    if endpoint == 'list.json':
+        end_de = str(params.get('end_de') or today)
+        # A window that ended before today can no longer receive new filings
+        return TTL_IMMUTABLE if end_de < today else TTL_OPEN_WINDOW
+
+    if endpoint == 'fnlttSinglAcntAll.json':
+        current_year = now.year
+        bsns_year = int(params.get('bsns_year') or current_year)
+        if bsns_year <= current_year - 2:
+            return TTL_IMMUTABLE
+        # Annual reports for last year are filed (and corrected) during the first months of this year
+        if bsns_year == current_year - 1:
+            return TTL_RECENT_FISCAL_YEAR
+        return TTL_CURRENT_FISCAL_YEAR
+
+    return TTL_DEFAULT
+
+
+class DartResponseCache:
+    """
+    Persistent cache for OpenDART JSON responses, shared by all processes.
+    """
+
+    def __init__(self, db_path=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            db_path: SQLite database path (default: download/.cache/dart_responses.sqlite3)
+            max_bytes: Maximum total size of cached responses
+        """
+        self.store = SqliteLRUCache(db_path or ensure_cache_directory() / 'dart_responses.sqlite3', max_bytes)
+
+    @staticmethod
+    def key_for(endpoint, params):
+        """Cache key for an endpoint and its parameters"""
+        return make_cache_key(endpoint, normalize_params(params))
+
+    def get(self, endpoint, params):
+        """
+        Return the cached JSON body for a request, or None
+        """
+        value = self.store.get(self.key_for(endpoint, params))
+        if value is None:
+            return None
+        return json.loads(zlib.decompress(value).decode('utf-8'))
+
+    def set(self, endpoint, params, data):
+        """
+        Cache a JSON body if its status describes the data rather than an error
+
+        Returns:
+            bool: True if the response was cached
+        """
+        if data.get('status') not in CACHEABLE_STATUSES:
+            return False
+        value = zlib.compress(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+        self.store.set(self.key_for(endpoint, params), value, ttl=ttl_for(endpoint, params))
+        return True
+
+    def stats(self):
+        """Hit/miss counters and size of the cache"""
+        return self.store.stats()
+
+    def clear(self):
+        """Remove every cached response"""
+        self.store.clear()
+
+
+_default_response_cache = None
+_default_response_cache_lock = threading.Lock()
+
+
+def get_default_response_cache():
+    """
+    Return the process-wide DartResponseCache, creating it on first use
+
+    Returns:
+        DartResponseCache: Shared cache instance
+    """
+    global _default_response_cache
+    if _default_response_cache is None:
+        with _default_response_cache_lock:
+            if _default_response_cache is None:
+                _default_response_cache = DartResponseCache()
+    return _default_response_cache
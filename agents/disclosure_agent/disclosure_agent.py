@@ -29,6 +29,37 @@ def search_and_download_disclosure(start_date, end_date, corp_code, filter_keywo
     return disclosure_tool.search_and_download_disclosure(start_date=start_date, end_date=end_date, corp_code=corp_code, filter_keyword=filter_keyword)
 
 
+@tool
+def find_corp_code(company_name: str) -> dict:
+    """
+    회사명으로 DART 고유번호(corp_code)를 조회합니다.
+
+    Args:
+        company_name: 회사명 (예: 삼성전자) 또는 6자리 종목코드
+
+    Returns:
+        가장 일치하는 회사의 corp_code와 후보 회사 목록을 반환합니다.
+    """
+    return disclosure_tool.find_corp_code(company_name)
+
+
+@tool
+def search_local_disclosures(query: str, corp_code: str = "", start_date: str = "", end_date: str = "") -> dict:
+    """
+    이미 다운로드한 공시 원문과 마크다운에서 검색어를 찾습니다. API나 LLM을 다시 호출하지 않으므로 즉시 응답합니다.
+
+    Args:
+        query: 공백으로 구분한 검색어 (모두 포함된 공시만 반환, 예: "공급계약 애플")
+        corp_code: 회사 고유번호로 제한 (선택)
+        start_date: 접수일 시작 YYYYMMDD (선택)
+        end_date: 접수일 끝 YYYYMMDD (선택)
+
+    Returns:
+        검색어가 강조된 발췌문과 공시 정보(rcept_no, 회사명, 보고서명, 파일 경로) 목록을 반환합니다.
+    """
+    return disclosure_tool.search_local_disclosures(query, corp_code=corp_code, start_date=start_date, end_date=end_date)
+
+
 @tool
 def read_file_content(file_path: str) -> str:
     """
@@ -59,7 +90,7 @@ def save_file_content(file_path: str, content: str) -> str:
 
 
 # Tool 로 LLM의 기능 확장
-tools = [search_and_download_disclosure, read_file_content, save_file_content]
+tools = [search_and_download_disclosure, find_corp_code, search_local_disclosures, read_file_content, save_file_content]
 tools_by_name = {tool.name: tool for tool in tools}
 llm_with_tools = llm.bind_tools(tools)
 
@@ -74,25 +105,42 @@ def load_prompt_from_file(file_path):
         return "You are a helpful assistant tasked with performing arithmetic on a set of inputs."
 
 
+# prompt.md 는 한 번만 읽어 재사용
+_system_message = None
+
+
+def get_system_message():
+    """
+    prompt.md 시스템 프롬프트를 한 번만 읽어 캐시 지점을 표시한 SystemMessage로 반환합니다.
+
+    Anthropic 프롬프트 캐시는 도구 정의와 시스템 프롬프트를 함께 캐시하므로
+    두 번째 호출부터는 이 앞부분이 캐시 읽기 토큰으로 처리됩니다.
+    """
+    global _system_message
+    if _system_message is None:
+        prompt_path = Path(__file__).parent / "prompt.md"
+        prompt_content = load_prompt_from_file(prompt_path)
+        _system_message = SystemMessage(
+            content=[{"type": "text", "text": prompt_content, "cache_control": {"type": "ephemeral"}}]
+        )
+    return _system_message
+
+
+def report_cache_usage(response):
+    """응답의 프롬프트 캐시 사용량을 출력합니다."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    print(f"토큰 사용량 - 입력: {usage.get('input_tokens', 0)}, 출력: {usage.get('output_tokens', 0)}, "
+          f"캐시 읽기: {details.get('cache_read', 0)}, 캐시 쓰기: {details.get('cache_creation', 0)}")
+
+
 def llm_call(state: MessagesState):
     """LLM decides whether to call a tool or not"""
 
-    # Load prompt from file
-    prompt_path = Path(__file__).parent / "prompt.md"
-    prompt_content = load_prompt_from_file(prompt_path)
-
-    return {
-        "messages": [
-            llm_with_tools.invoke(
-                [
-                    SystemMessage(
-                        content=prompt_content
-                    )
-                ]
-                + state["messages"]
-            )
-        ]
-    }
+    response = llm_with_tools.invoke([get_system_message()] + state["messages"])
+    report_cache_usage(response)
+
+    return {"messages": [response]}
 
 
 def tool_node(state: dict):
@@ -3,18 +3,107 @@ Analysis Service Module
 
 이 모듈은 XML 공시 문서를 읽고 분석하여 보기 편한 Markdown 형식으로 변환하는 기능을 제공합니다.
 AWS Bedrock의 Claude 모델을 사용하여 XML을 해석하고 중요 내용을 Markdown으로 요약합니다.
+표와 제목처럼 구조적인 부분은 LLM 없이 로컬에서 바로 Markdown으로 렌더링할 수도 있습니다.
 """
 
+import json
 import os
 import xml.etree.ElementTree as ET
+from collections import deque
+from itertools import chain
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import datetime
+from html.parser import HTMLParser
 from pathlib import Path
+import glob
 import re
 import sys
+import time
 
 # Add project root to path to ensure modules can be imported
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from api import bedrock_api
+from api import bedrock_api, model_router
+from utils import token_utils, xml_utils
+
+# 변환 방식
+# - single: 문서 전체를 한 번의 호출로 변환
+# - sections: SECTION 단위로 나누어 동시에 변환한 뒤 순서대로 합침
+# - hybrid: 표와 제목은 로컬에서 렌더링하고 서술형 본문만 Bedrock으로 정리
+# - local: LLM 호출 없이 로컬에서만 변환
+CONVERSION_MODES = ('single', 'sections', 'hybrid', 'local')
+
+# 문서 전체 변환용 기본 프롬프트 템플릿
+DEFAULT_PROMPT_TEMPLATE = """
+        당신은 전문적인 금융 문서 분석가입니다.
+        아래 제공된 XML 형식의 공시 문서를 분석하고 모든 내용을 추출하여
+        체계적인 마크다운 형식으로 정리해 주세요.
+
+        # 분석 요구사항
+        1. 문서의 제목, 공시 일자, 공시 주체 등 기본 정보를 포함할 것
+        2. 주요 재무 데이터는 표 형식으로 정리할 것
+        3. 공시의 중요 포인트를 강조할 것
+        4. 모든 내용이 포함될 것
+        5. 적절한 마크다운 형식(제목, 목록, 표, 코드 블록 등)을 사용하여 가독성 높게 구성할 것
+
+        # XML 문서:
+        ```xml
+        {xml_content}
+        ```
+
+        마크다운 형식으로 정리된 문서를 제공해 주세요. 분석 과정이나 설명은 필요 없습니다.
+        바로 마크다운 내용만 작성해 주세요.
+        """
+
+# 섹션 단위 변환 시 동시에 실행할 Bedrock 호출 수
+DEFAULT_SECTION_WORKERS = 4
+
+# 디렉토리 일괄 변환 시 동시에 변환할 문서 수 (문서마다 섹션 단위 호출이 추가로 병렬 실행됨)
+DEFAULT_BATCH_LLM_WORKERS = 4
+# 디렉토리 일괄 변환 결과를 기록하는 매니페스트 파일명 (출력 디렉토리에 생성)
+MARKDOWN_MANIFEST_FILENAME = 'markdown_manifest.json'
+
+# 섹션 단위 변환용 프롬프트 템플릿
+SECTION_PROMPT_TEMPLATE = """
+        당신은 전문적인 금융 문서 분석가입니다.
+        아래는 "{document_name}" ({company_name}) 공시 문서를 여러 조각으로 나눈 것 중
+        {part}번째 조각의 XML입니다. 이 조각의 모든 내용을 추출하여
+        체계적인 마크다운 형식으로 정리해 주세요.
+
+        # 작성 규칙
+        1. 문서 제목과 회사명은 이미 문서 머리말에 작성되어 있으므로 반복하지 말 것
+        2. 섹션 제목(TITLE)은 '##', 하위 섹션 제목은 '###' 이하의 제목으로 작성할 것
+        3. 앞 조각에서 이어지는 섹션이면 제목 뒤에 '(계속)'을 붙일 것
+        4. 주요 재무 데이터는 표 형식으로 정리할 것
+        5. 모든 내용이 포함될 것
+
+        # XML 조각:
+        ```xml
+        {xml_content}
+        ```
+
+        분석 과정이나 설명 없이 마크다운 내용만 작성해 주세요.
+        """
+
+# hybrid 모드에서 이보다 짧은 본문은 Bedrock에 보내지 않고 그대로 사용
+HYBRID_MIN_NARRATIVE_CHARS = 300
+
+# hybrid 모드의 서술형 본문 정리용 프롬프트 템플릿
+NARRATIVE_PROMPT_TEMPLATE = """
+        당신은 전문적인 금융 문서 분석가입니다.
+        아래는 "{document_name}" 공시 문서의 "{section_title}" 부분에 있는 본문입니다.
+        표와 제목은 이미 마크다운으로 변환되어 있으므로, 이 본문만 가독성 높은 마크다운으로 정리해 주세요.
+
+        # 작성 규칙
+        1. 내용을 빠뜨리거나 요약하지 말 것
+        2. 제목(#)은 사용하지 말고 문단, 목록, 강조만 사용할 것
+        3. 공시의 중요 포인트는 굵게 강조할 것
+
+        # 본문:
+        {text}
+
+        분석 과정이나 설명 없이 마크다운 내용만 작성해 주세요.
+        """
 
 
 def read_xml_file(file_path):
@@ -35,11 +124,8 @@ def read_xml_file(file_path):
         if not xml_path.exists():
             raise FileNotFoundError(f"XML 파일을 찾을 수 없습니다: {file_path}")
 
-        # XML 파일 내용 읽기
-        with open(xml_path, 'r', encoding='utf-8') as f:
-            xml_content = f.read()
-
-        return xml_content
+        # XML 파일 내용 읽기 (UTF-8이 아닌 EUC-KR/CP949 문서도 인코딩을 감지하여 읽음)
+        return xml_utils.read_xml_text(xml_path)
 
     except Exception as e:
         print(f"XML 파일을 읽는 중 오류 발생: {str(e)}")
@@ -47,70 +133,666 @@ def read_xml_file(file_path):
 
 
 
-def convert_to_markdown(xml_data, prompt_template=None):
+def _get_xml_content(xml_data):
     """
-    XML 데이터를 Bedrock API를 통해 Markdown으로 변환합니다.
+    convert_to_markdown에 전달된 XML 데이터를 문자열로 변환합니다.
 
-    Args:
-        xml_data (dict or str): 변환할 XML 데이터
-        prompt_template (str, optional): 사용자 정의 프롬프트 템플릿
-
-    Returns:
-        str: Markdown 형식의 문서
+    xml_data는 XML 문자열이나 {'raw_content': str}, 파일 경로를 담은 {'path': str},
+    압축 파일 멤버처럼 읽을 수 있는 바이너리 파일 객체를 담은 {'stream': file} 입니다.
     """
     # XML 데이터가 딕셔너리인 경우 문자열로 변환
     if isinstance(xml_data, dict):
         if 'raw_content' in xml_data:
-            xml_content = xml_data['raw_content']
-        else:
-            # 딕셔너리를 문자열로 변환 (간소화된 형태)
-            xml_content = str(xml_data)
-    else:
-        xml_content = xml_data
+            return xml_data['raw_content']
+        if 'path' in xml_data or 'stream' in xml_data:
+            return xml_utils.read_xml_text(xml_data.get('path') or xml_data['stream'])
+        # 딕셔너리를 문자열로 변환 (간소화된 형태)
+        return str(xml_data)
+    return xml_data
+
+
+def _iter_xml_pieces(xml_data):
+    """
+    XML 데이터를 텍스트 조각 단위로 반환합니다.
+
+    파일 경로나 파일 객체는 xml_utils.iter_xml_text로 조금씩 읽으므로 문서 전체를
+    메모리에 올리지 않습니다. 문자열은 그대로 하나의 조각으로 반환합니다.
+    """
+    if isinstance(xml_data, dict) and ('path' in xml_data or 'stream' in xml_data):
+        return xml_utils.iter_xml_text(xml_data.get('path') or xml_data['stream'])
+    return [_get_xml_content(xml_data)]
+
+
+def _iter_minified_sections(xml_data):
+    """
+    문서를 섹션 단위로 읽으면서 하나씩 최소화하여 반환하고, 끝나면 전체 크기 변화를 출력합니다.
+
+    Yields:
+        str: 최소화된 문서 조각
+    """
+    totals = {'chars_before': 0, 'chars_after': 0, 'tokens_before': 0, 'tokens_after': 0}
+    for fragment in xml_utils.iter_sections(_iter_xml_pieces(xml_data)):
+        minified = xml_utils.minify_xml(fragment)
+        stats = token_utils.compare_sizes(fragment, minified)
+        for key in totals:
+            totals[key] += stats[key]
+        if minified:
+            yield minified
+
+    reduction = 1 - totals['tokens_after'] / totals['tokens_before'] if totals['tokens_before'] else 0.0
+    print(f"XML 최소화: {totals['chars_before']:,}자 → {totals['chars_after']:,}자, "
+          f"예상 토큰 {totals['tokens_before']:,} → {totals['tokens_after']:,} ({reduction:.0%} 감소)")
+
+
+def _load_for_prompt(xml_data, minify=True):
+    """
+    프롬프트에 넣을 XML 내용을 만듭니다.
+
+    최소화할 때는 섹션 단위로 읽고 최소화하므로 원본 문서 전체가 메모리에 올라가지 않습니다.
+    """
+    if not minify:
+        return _get_xml_content(xml_data)
+    if isinstance(xml_data, dict) and ('path' in xml_data or 'stream' in xml_data):
+        return ''.join(_iter_minified_sections(xml_data))
+    minified, _ = minify_for_prompt(_get_xml_content(xml_data))
+    return minified
+
+
+def minify_for_prompt(xml_content):
+    """
+    프롬프트에 넣기 전에 XML에서 서식용 마크업을 제거하고 크기 변화를 출력합니다.
+
+    Args:
+        xml_content (str): 원본 XML 내용
+
+    Returns:
+        tuple: (minified, stats) - stats는 token_utils.compare_sizes 결과
+    """
+    minified = xml_utils.minify_xml(xml_content)
+    stats = token_utils.compare_sizes(xml_content, minified)
+    print(f"XML 최소화: {stats['chars_before']:,}자 → {stats['chars_after']:,}자, "
+          f"예상 토큰 {stats['tokens_before']:,} → {stats['tokens_after']:,} ({stats['reduction']:.0%} 감소)")
+    return minified, stats
+
+
+def _build_prompt(xml_content, prompt_template=None, minify=True):
+    """
+    문서 전체 변환(single 모드)에 사용할 프롬프트를 만듭니다.
+
+    XML 앞의 고정 지시문은 Bedrock 프롬프트 캐시의 최소 길이(약 1024 토큰)에 크게
+    못 미쳐 캐시되지 않으므로 cache_control 없이 하나의 문자열로 보냅니다.
+    """
+    if minify:
+        xml_content, _ = minify_for_prompt(xml_content)
 
     # 너무 긴 컨텐츠는 잘라내기 (Claude의 토큰 제한 고려)
     # if len(xml_content) > 20000:
     #     xml_content = xml_content[:20000] + "\n\n... (이하 내용 생략) ..."
 
-    # 기본 프롬프트 템플릿
-    if prompt_template is None:
-        prompt_template = """
-        당신은 전문적인 금융 문서 분석가입니다.
-        아래 제공된 XML 형식의 공시 문서를 분석하고 모든 내용을 추출하여
-        체계적인 마크다운 형식으로 정리해 주세요.
+    # 실제 XML 내용을 프롬프트에 삽입
+    return (prompt_template or DEFAULT_PROMPT_TEMPLATE).format(xml_content=xml_content)
 
-        # 분석 요구사항
-        1. 문서의 제목, 공시 일자, 공시 주체 등 기본 정보를 포함할 것
-        2. 주요 재무 데이터는 표 형식으로 정리할 것
-        3. 공시의 중요 포인트를 강조할 것
-        4. 모든 내용이 포함될 것
-        5. 적절한 마크다운 형식(제목, 목록, 표, 코드 블록 등)을 사용하여 가독성 높게 구성할 것
 
-        # XML 문서:
-        ```xml
-        {xml_content}
-        ```
+def _invoke_routed(prompt, content, label=None):
+    """
+    문서 크기와 복잡도에 맞는 모델로 Bedrock을 호출하고 응답 시간을 기록합니다.
 
-        마크다운 형식으로 정리된 문서를 제공해 주세요. 분석 과정이나 설명은 필요 없습니다.
-        바로 마크다운 내용만 작성해 주세요.
-        """
+    Args:
+        prompt (str or list): 모델에게 전달할 프롬프트
+        content (str): 라우팅 판단에 사용할 XML 또는 텍스트 (프롬프트에 들어가는 내용)
+        label (str, optional): 로그에 함께 출력할 이름
 
-    # 실제 XML 내용을 프롬프트에 삽입
-    formatted_prompt = prompt_template.format(xml_content=xml_content)
+    Returns:
+        str: 모델의 응답 텍스트
+    """
+    router = model_router.get_default_model_router()
+    decision = router.route(content, label)
+    started = time.perf_counter()
+    result = bedrock_api.invoke_claude_with_boto3(
+        prompt=prompt, model_id=decision['model_id'], max_tokens=8000, temperature=0.2
+    )
+    router.record_latency(decision, time.perf_counter() - started, label)
+    return result
+
+
+def _stream_routed(prompt, content, label=None):
+    """_invoke_routed와 같이 모델을 고르되, 응답 스트림의 텍스트 조각을 그대로 반환하는 제너레이터입니다."""
+    router = model_router.get_default_model_router()
+    decision = router.route(content, label)
+    started = time.perf_counter()
+    yield from bedrock_api.stream_claude_with_boto3(
+        prompt=prompt, model_id=decision['model_id'], max_tokens=8000, temperature=0.2
+    )
+    router.record_latency(decision, time.perf_counter() - started, label)
+
+
+def convert_to_markdown(xml_data, prompt_template=None, mode='single', minify=True):
+    """
+    XML 데이터를 Bedrock API를 통해 Markdown으로 변환합니다.
+
+    Args:
+        xml_data (dict or str): 변환할 XML 데이터
+        prompt_template (str, optional): 사용자 정의 프롬프트 템플릿 (single 모드에서만 사용)
+        mode (str): 변환 방식, CONVERSION_MODES 중 하나 (기본값: 'single')
+        minify (bool): Bedrock에 보내기 전에 서식용 마크업을 제거할지 여부 (기본값: True)
 
-    # Bedrock API를 사용하여 변환
+    Returns:
+        str: Markdown 형식의 문서
+    """
+    if mode not in CONVERSION_MODES:
+        raise ValueError(f"지원하지 않는 변환 방식입니다: {mode} (가능한 값: {', '.join(CONVERSION_MODES)})")
+
+    if mode == 'sections':
+        return convert_to_markdown_by_sections(xml_data, minify=minify)
+    if mode == 'hybrid':
+        return convert_to_markdown_hybrid(xml_data)
+    if mode == 'local':
+        return convert_to_markdown_locally(xml_data)
+
+    xml_content = _load_for_prompt(xml_data, minify)
+    formatted_prompt = _build_prompt(xml_content, prompt_template, minify=False)
+
+    # Bedrock API를 사용하여 변환 (짧은 공시는 소형 모델로)
     try:
-        markdown_content = bedrock_api.invoke_claude_with_boto3(
-            prompt=formatted_prompt,
-            max_tokens=8000,
-            temperature=0.2
-        )
+        markdown_content = _invoke_routed(formatted_prompt, xml_content)
         return markdown_content
     except Exception as e:
         print(f"Markdown 변환 중 오류 발생: {str(e)}")
         return f"# 변환 오류\n\n오류가 발생했습니다: {str(e)}"
 
 
+def convert_to_markdown_by_sections(xml_data, max_workers=DEFAULT_SECTION_WORKERS,
+                                    max_chunk_chars=xml_utils.DEFAULT_CHUNK_CHARS, minify=True):
+    """
+    XML 문서를 SECTION 단위 조각으로 나누어 동시에 Markdown으로 변환한 뒤 순서대로 합칩니다.
+
+    조각마다 별도의 Bedrock 호출을 사용하므로 큰 사업보고서도 컨텍스트 한도나
+    max_tokens에 잘리지 않으며, 전체 소요 시간은 가장 큰 조각의 변환 시간에 가까워집니다.
+
+    Args:
+        xml_data (dict or str): 변환할 XML 데이터
+        max_workers (int): 동시에 실행할 Bedrock 호출 수
+        max_chunk_chars (int): 한 번의 호출로 변환할 조각의 최대 문자 수
+        minify (bool): 조각으로 나누기 전에 서식용 마크업을 제거할지 여부 (기본값: True)
+
+    Returns:
+        str: Markdown 형식의 문서
+    """
+    return ''.join(iter_markdown_by_sections(xml_data, max_workers=max_workers,
+                                             max_chunk_chars=max_chunk_chars, minify=minify))
+
+
+def iter_markdown_by_sections(xml_data, max_workers=DEFAULT_SECTION_WORKERS,
+                              max_chunk_chars=xml_utils.DEFAULT_CHUNK_CHARS, minify=True):
+    """
+    convert_to_markdown_by_sections와 같이 변환하되, 앞 조각부터 변환이 끝나는 대로
+    순서대로 반환하는 제너레이터입니다.
+
+    Yields:
+        str: 머리말과 각 조각의 Markdown
+    """
+    # 문서를 섹션 단위로 읽어 조각을 만들므로 원본 전체를 메모리에 올리지 않음
+    # (최소화를 먼저 하면 조각이 작아져 호출 수도 줄어듦)
+    if minify:
+        fragments = _iter_minified_sections(xml_data)
+    else:
+        fragments = xml_utils.iter_sections(_iter_xml_pieces(xml_data))
+    chunks = xml_utils.iter_chunks(fragments, max_chars=max_chunk_chars)
+
+    first = next(chunks, '')
+    second = next(chunks, None)
+    # SECTION 구조가 없는 짧은 공시는 기존 방식으로 한 번에 변환
+    if second is None:
+        yield convert_to_markdown(first, minify=False)
+        return
+
+    # 문서명과 회사명은 문서 앞부분(첫 조각)에 있음
+    info = xml_utils.extract_document_info(first)
+    document_name = info['document_name'] or '공시 문서'
+    company_name = info['company_name'] or '회사명 미상'
+
+    def convert_chunk(index, chunk):
+        prompt = SECTION_PROMPT_TEMPLATE.format(
+            document_name=document_name,
+            company_name=company_name,
+            part=index + 1,
+            xml_content=chunk
+        )
+        try:
+            return _invoke_routed(prompt, chunk, label=f"조각 {index + 1}")
+        except Exception as e:
+            print(f"Markdown 변환 중 오류 발생 (조각 {index + 1}): {str(e)}")
+            return f"> 조각 {index + 1} 변환 오류: {str(e)}"
+
+    # 모든 조각이 공유하는 머리말
+    yield f"# {document_name}\n\n- 회사명: {company_name}\n"
+
+    print(f"섹션 단위 변환: 동시 호출 {max_workers}개")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # 변환 중이거나 순서를 기다리는 조각 수를 제한하여 메모리 사용량을 일정하게 유지
+        window = deque()
+        for index, chunk in enumerate(chain([first, second], chunks)):
+            window.append(executor.submit(convert_chunk, index, chunk))
+            if len(window) >= max_workers * 2:
+                yield '\n\n' + window.popleft().result().strip()
+        # 제출 순서대로 결과를 꺼내므로 문서 순서가 유지됨
+        while window:
+            yield '\n\n' + window.popleft().result().strip()
+
+
+def iter_markdown(xml_data, prompt_template=None, mode='single', minify=True):
+    """
+    XML 데이터를 Markdown으로 변환하면서 결과를 조각 단위로 반환하는 제너레이터입니다.
+
+    single 모드는 Bedrock 응답 스트림의 텍스트 조각을 도착하는 즉시 반환하고,
+    sections 모드는 앞 조각부터 변환이 끝나는 대로, local 모드는 블록이 렌더링되는 대로
+    반환합니다. hybrid 모드는 결과 전체를 한 번에 반환합니다.
+
+    Args:
+        xml_data (dict or str): 변환할 XML 데이터
+        prompt_template (str, optional): 사용자 정의 프롬프트 템플릿 (single 모드에서만 사용)
+        mode (str): 변환 방식, CONVERSION_MODES 중 하나 (기본값: 'single')
+        minify (bool): Bedrock에 보내기 전에 서식용 마크업을 제거할지 여부 (기본값: True)
+
+    Yields:
+        str: Markdown 텍스트 조각
+    """
+    if mode not in CONVERSION_MODES:
+        raise ValueError(f"지원하지 않는 변환 방식입니다: {mode} (가능한 값: {', '.join(CONVERSION_MODES)})")
+
+    if mode == 'single':
+        xml_content = _load_for_prompt(xml_data, minify)
+        formatted_prompt = _build_prompt(xml_content, prompt_template, minify=False)
+        yield from _stream_routed(formatted_prompt, xml_content)
+    elif mode == 'sections':
+        yield from iter_markdown_by_sections(xml_data, minify=minify)
+    elif mode == 'local':
+        # 블록이 렌더링되는 대로 반환
+        for index, text in enumerate(text for _, text, _ in iter_markdown_blocks(xml_data)):
+            yield text if index == 0 else '\n\n' + text
+    else:
+        yield convert_to_markdown(xml_data, mode=mode, minify=minify)
+
+
+class _DartMarkdownRenderer(HTMLParser):
+    """
+    DART XML을 Markdown 블록 목록으로 렌더링하는 파서입니다.
+
+    DART 문서는 닫히지 않은 P/TD 태그나 이스케이프되지 않은 '&'가 흔하므로
+    엄격한 XML 파서 대신 관대한 HTMLParser를 사용합니다. 태그 이름은 소문자로 전달됩니다.
+
+    blocks 항목은 (kind, text, section_title) 튜플이며 kind는
+    'markdown'(제목, 표 등 완성된 블록) 또는 'narrative'(서술형 문단)입니다.
+    """
+
+    CELL_TAGS = ('td', 'th', 'te', 'tu')
+    # 내용을 출력하지 않는 요소 (목차, 요약 정보, 이미지)
+    SKIP_TAGS = ('toc', 'summary', 'image', 'img', 'img-caption')
+    TITLE_TAGS = ('title', 'cover-title')
+    INFO_TAGS = ('document-name', 'company-name')
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self.document_name = ''
+        self.company_name = ''
+        self._skip_depth = 0
+        self._section_levels = []
+        self._section_title = ''
+        self._info_tag = None
+        self._title = None
+        self._paragraph = []
+        self._paragraph_before_info = []
+        self._table_depth = 0
+        self._rows = None
+        self._row = None
+        self._cell = None
+        self._cell_span = (1, 1)
+
+    # 블록 출력
+
+    def _emit(self, kind, text):
+        text = text.strip()
+        if text:
+            self.blocks.append((kind, text, self._section_title))
+
+    def _flush_paragraph(self):
+        lines = (' '.join(line.split()) for line in ''.join(self._paragraph).split('\n'))
+        self._emit('narrative', '\n'.join(line for line in lines if line))
+        self._paragraph = []
+
+    def _finish_cell(self):
+        if self._cell is not None:
+            text = ' '.join(''.join(self._cell).split()).replace('|', '\\|')
+            self._row.append((text,) + self._cell_span)
+            self._cell = None
+
+    def _finish_row(self):
+        self._finish_cell()
+        if self._row:
+            self._rows.append(self._row)
+        self._row = None
+
+    def _finish_table(self):
+        self._finish_row()
+        self._emit('markdown', _render_markdown_table(self._rows))
+        self._rows = None
+
+    # HTMLParser 콜백
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+
+        if tag in self.INFO_TAGS:
+            self._info_tag = tag
+            self._paragraph_before_info = self._paragraph
+            self._paragraph = []
+        elif tag.startswith('section-') and tag[8:].isdigit():
+            self._flush_paragraph()
+            self._section_levels.append(int(tag[8:]))
+        elif tag in self.TITLE_TAGS and self._table_depth == 0:
+            self._flush_paragraph()
+            self._title = []
+        elif tag == 'table':
+            self._table_depth += 1
+            if self._table_depth == 1:
+                self._flush_paragraph()
+                self._rows = []
+            elif self._cell is not None:
+                self._cell.append(' ')
+        elif self._table_depth == 1 and tag == 'tr':
+            self._finish_row()
+            self._row = []
+        elif self._table_depth == 1 and tag in self.CELL_TAGS:
+            if self._row is None:
+                self._row = []
+            self._finish_cell()
+            attrs = dict(attrs)
+            self._cell = []
+            self._cell_span = (_to_span(attrs.get('colspan')), _to_span(attrs.get('rowspan')))
+        elif tag in ('p', 'br'):
+            self._write('\n')
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if self._skip_depth:
+            return
+
+        if tag in self.INFO_TAGS and self._info_tag == tag:
+            value = ' '.join(''.join(self._paragraph).split())
+            self._paragraph = self._paragraph_before_info
+            self._info_tag = None
+            if tag == 'document-name':
+                self.document_name = value
+                self._emit('markdown', f'# {value}')
+            else:
+                self.company_name = value
+                self._emit('markdown', f'- 회사명: {value}')
+        elif tag.startswith('section-') and tag[8:].isdigit():
+            self._flush_paragraph()
+            if self._section_levels:
+                self._section_levels.pop()
+        elif tag in self.TITLE_TAGS and self._title is not None:
+            title = ' '.join(''.join(self._title).split())
+            self._title = None
+            if title:
+                # SECTION-1 제목은 '##', SECTION-2는 '###' ... (문서 제목이 '#')
+                level = min((self._section_levels[-1] if self._section_levels else 1) + 1, 6)
+                self._section_title = title
+                self._emit('markdown', f"{'#' * level} {title}")
+        elif tag == 'table' and self._table_depth:
+            self._table_depth -= 1
+            if self._table_depth == 0:
+                self._finish_table()
+        elif self._table_depth == 1 and tag == 'tr':
+            self._finish_row()
+        elif self._table_depth == 1 and tag in self.CELL_TAGS:
+            self._finish_cell()
+        elif tag == 'p' and self._table_depth == 0 and self._info_tag is None:
+            self._flush_paragraph()
+
+    def handle_startendtag(self, tag, attrs):
+        # <BR/>만 의미가 있고 <PGBRK/> 등 나머지 빈 요소는 무시
+        if tag == 'br' and not self._skip_depth:
+            self._write('\n')
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._write(data)
+
+    def _write(self, text):
+        if self._title is not None:
+            self._title.append(text)
+        elif self._cell is not None:
+            self._cell.append(' ' if text == '\n' else text)
+        elif self._table_depth:
+            # 셀 밖에 있는 표 내부 텍스트 (공백, 줄바꿈)
+            return
+        else:
+            self._paragraph.append(text)
+
+    def close(self):
+        super().close()
+        if self._rows is not None:
+            self._finish_table()
+        self._flush_paragraph()
+
+    def take_blocks(self):
+        """지금까지 완성된 블록을 꺼내고 비웁니다 (문서를 조금씩 feed할 때 사용)."""
+        blocks = self.blocks
+        self.blocks = []
+        return blocks
+
+
+def _to_span(value):
+    """COLSPAN/ROWSPAN 속성 값을 정수로 변환합니다."""
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 1
+
+
+def _render_markdown_table(rows):
+    """
+    (text, colspan, rowspan) 셀로 이루어진 행 목록을 Markdown 표로 렌더링합니다.
+
+    병합된 셀은 Markdown에서 표현할 수 없으므로 병합 영역의 나머지 칸은 비워 둡니다.
+    """
+    grid = []
+    pending = {}  # 열 번호 -> rowspan으로 아직 차지하고 있는 남은 행 수
+
+    def take_pending(col, out):
+        out.append('')
+        pending[col] -= 1
+        if pending[col] == 0:
+            del pending[col]
+
+    for row in rows:
+        out = []
+        col = 0
+        for text, colspan, rowspan in row:
+            while col in pending:
+                take_pending(col, out)
+                col += 1
+            out.append(text)
+            out.extend([''] * (colspan - 1))
+            if rowspan > 1:
+                for span_col in range(col, col + colspan):
+                    pending[span_col] = rowspan - 1
+            col += colspan
+        # 행 끝에 남은 rowspan 영역
+        while pending and col <= max(pending):
+            if col in pending:
+                take_pending(col, out)
+            else:
+                out.append('')
+            col += 1
+        grid.append(out)
+
+    width = max((len(row) for row in grid), default=0)
+    if width == 0:
+        return ''
+
+    lines = []
+    for index, row in enumerate(grid):
+        row = row + [''] * (width - len(row))
+        lines.append('| ' + ' | '.join(row) + ' |')
+        if index == 0:
+            lines.append('|' + ' --- |' * width)
+    return '\n'.join(lines)
+
+
+def render_markdown_blocks(xml_data):
+    """
+    XML 문서를 LLM 없이 Markdown 블록 목록으로 렌더링합니다.
+
+    Args:
+        xml_data (dict or str): 변환할 XML 데이터
+
+    Returns:
+        tuple: (blocks, document_name) - blocks는 (kind, text, section_title) 튜플 목록이며
+            kind는 'markdown' 또는 'narrative'
+    """
+    renderer = _DartMarkdownRenderer()
+    blocks = list(_render_blocks(renderer, xml_data))
+    return blocks, renderer.document_name
+
+
+def _render_blocks(renderer, xml_data):
+    """문서를 조각 단위로 renderer에 넣으면서 완성된 블록을 바로 반환합니다."""
+    for piece in _iter_xml_pieces(xml_data):
+        renderer.feed(piece)
+        yield from renderer.take_blocks()
+    renderer.close()
+    yield from renderer.take_blocks()
+
+
+def iter_markdown_blocks(xml_data):
+    """
+    render_markdown_blocks와 같이 렌더링하되, 블록이 완성되는 대로 반환하는 제너레이터입니다.
+
+    파일 경로({'path': ...})나 파일 객체({'stream': ...})를 넘기면 문서를 조금씩 읽으므로
+    메모리에는 읽고 있는 조각과 렌더링 중인 표나 문단 하나만 남습니다.
+
+    Yields:
+        tuple: (kind, text, section_title)
+    """
+    yield from _render_blocks(_DartMarkdownRenderer(), xml_data)
+
+
+def convert_to_markdown_locally(xml_data):
+    """
+    XML 문서를 LLM 호출 없이 로컬에서 Markdown으로 변환합니다.
+
+    표(TABLE/TR/TD)는 Markdown 표로, SECTION 제목(TITLE)은 제목으로, 문단(P)은
+    그대로 문단으로 렌더링합니다. 결과는 항상 같고 밀리초 단위로 끝납니다.
+
+    Args:
+        xml_data (dict or str): 변환할 XML 데이터
+
+    Returns:
+        str: Markdown 형식의 문서
+    """
+    return '\n\n'.join(text for _, text, _ in iter_markdown_blocks(xml_data))
+
+
+def convert_to_markdown_hybrid(xml_data, max_workers=DEFAULT_SECTION_WORKERS,
+                               min_narrative_chars=HYBRID_MIN_NARRATIVE_CHARS):
+    """
+    표와 제목은 로컬에서 렌더링하고, 서술형 본문만 Bedrock으로 정리하여 Markdown으로 변환합니다.
+
+    연속된 문단을 하나의 본문으로 묶어 min_narrative_chars 이상인 본문만 동시에
+    Bedrock으로 보냅니다. 호출이 실패하면 해당 본문은 로컬 렌더링 결과를 사용합니다.
+
+    Args:
+        xml_data (dict or str): 변환할 XML 데이터
+        max_workers (int): 동시에 실행할 Bedrock 호출 수
+        min_narrative_chars (int): Bedrock으로 보낼 본문의 최소 문자 수
+
+    Returns:
+        str: Markdown 형식의 문서
+    """
+    blocks, document_name = render_markdown_blocks(xml_data)
+    return _polish_narratives(blocks, document_name, max_workers, min_narrative_chars)
+
+
+def _polish_narratives(blocks, document_name, max_workers=DEFAULT_SECTION_WORKERS,
+                       min_narrative_chars=HYBRID_MIN_NARRATIVE_CHARS):
+    """render_markdown_blocks 결과의 서술형 본문을 Bedrock으로 정리하여 하나의 Markdown으로 합칩니다."""
+    # 연속된 문단을 하나의 본문으로 묶기 (한 번의 호출 크기 제한 포함)
+    parts = []
+    for kind, text, section_title in blocks:
+        previous = parts[-1] if parts else None
+        if (kind == 'narrative' and previous and previous[0] == 'narrative'
+                and previous[2] == section_title
+                and len(previous[1]) + len(text) < xml_utils.DEFAULT_CHUNK_CHARS):
+            parts[-1] = (kind, previous[1] + '\n\n' + text, section_title)
+        else:
+            parts.append((kind, text, section_title))
+
+    targets = [index for index, (kind, text, _) in enumerate(parts)
+               if kind == 'narrative' and len(text) >= min_narrative_chars]
+
+    def convert_passage(index):
+        _, text, section_title = parts[index]
+        prompt = NARRATIVE_PROMPT_TEMPLATE.format(
+            document_name=document_name or '공시 문서',
+            section_title=section_title or '본문',
+            text=text
+        )
+        try:
+            result = _invoke_routed(prompt, text, label=section_title or '본문')
+        except Exception as e:
+            result = f"오류: {str(e)}"
+        # 호출이 실패하면 로컬 렌더링 결과를 그대로 사용
+        if not result or result.startswith('오류:'):
+            print(f"본문 정리 실패, 로컬 변환 결과 사용: {result}")
+            return text
+        return result.strip()
+
+    if targets:
+        print(f"하이브리드 변환: 블록 {len(parts)}개 중 본문 {len(targets)}개를 Bedrock으로 정리")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for index, text in zip(targets, executor.map(convert_passage, targets)):
+                parts[index] = ('markdown', text, parts[index][2])
+
+    return '\n\n'.join(text for _, text, _ in parts)
+
+
+def markdown_output_path(source_xml_path, output_dir=None):
+    """
+    원본 XML 파일에 대응하는 Markdown 파일 경로를 만듭니다.
+
+    Args:
+        source_xml_path (str): 원본 XML 파일 경로
+        output_dir (str, optional): 결과물을 저장할 디렉토리 경로 (기본값: 원본 XML과 같은 디렉토리)
+
+    Returns:
+        Path: Markdown 파일 경로
+    """
+    # 소스 XML 경로를 Path 객체로 변환
+    source_path = Path(source_xml_path)
+
+    # 출력 디렉토리 설정
+    if output_dir is None:
+        # 기본값으로 원본 XML과 같은 디렉토리 사용
+        output_directory = source_path.parent
+    else:
+        output_directory = Path(output_dir)
+        # 디렉토리가 없으면 생성
+        if not output_directory.exists():
+            output_directory.mkdir(parents=True, exist_ok=True)
+
+    # 출력 파일명 생성 (원본 XML 파일명에서 .xml 확장자를 .md로 변경)
+    return output_directory / (source_path.stem + '.md')
+
+
 def save_markdown_file(markdown_content, source_xml_path, output_dir=None):
     """
     Markdown 내용을 파일로 저장합니다.
@@ -124,22 +806,7 @@ def save_markdown_file(markdown_content, source_xml_path, output_dir=None):
         str: 저장된 Markdown 파일 경로
     """
     try:
-        # 소스 XML 경로를 Path 객체로 변환
-        source_path = Path(source_xml_path)
-
-        # 출력 디렉토리 설정
-        if output_dir is None:
-            # 기본값으로 원본 XML과 같은 디렉토리 사용
-            output_directory = source_path.parent
-        else:
-            output_directory = Path(output_dir)
-            # 디렉토리가 없으면 생성
-            if not output_directory.exists():
-                output_directory.mkdir(parents=True, exist_ok=True)
-
-        # 출력 파일명 생성 (원본 XML 파일명에서 .xml 확장자를 .md로 변경)
-        output_filename = source_path.stem + '.md'
-        output_path = output_directory / output_filename
+        output_path = markdown_output_path(source_xml_path, output_dir)
 
         # Markdown 파일 저장
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -153,13 +820,313 @@ def save_markdown_file(markdown_content, source_xml_path, output_dir=None):
         return None
 
 
-def xml_to_markdown(xml_path, output_dir=None):
+def stream_markdown_to_file(markdown_chunks, output_path):
+    """
+    Markdown 조각을 도착하는 대로 파일에 이어 쓰면서 그대로 다시 반환하는 제너레이터입니다.
+
+    전체 결과를 메모리에 모으지 않으므로 긴 문서도 메모리 사용량이 일정하고,
+    변환이 끝나기 전에도 임시 파일(<name>.md.tmp)에서 앞부분을 확인할 수 있습니다.
+    임시 파일은 모든 조각을 오류 없이 받은 뒤에만 output_path로 교체하므로, 중단되거나
+    실패한 변환이 완성된 Markdown 파일처럼 남지 않습니다.
+
+    Args:
+        markdown_chunks (iterable): iter_markdown 등이 반환하는 Markdown 텍스트 조각
+        output_path (str): 저장할 Markdown 파일 경로
+
+    Yields:
+        str: 파일에 쓴 Markdown 텍스트 조각
+
+    Raises:
+        RuntimeError: Bedrock 호출 실패로 오류 메시지 조각이 포함된 경우 (모든 조각을 반환한 뒤)
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(output_path.name + '.tmp')
+
+    completed = False
+    failed = False
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for chunk in markdown_chunks:
+                failed = failed or _is_error_chunk(chunk)
+                f.write(chunk)
+                f.flush()
+                yield chunk
+        if not failed:
+            os.replace(temp_path, output_path)
+            completed = True
+    finally:
+        if not completed:
+            temp_path.unlink(missing_ok=True)
+
+    if failed:
+        raise RuntimeError("Bedrock 호출 실패로 변환 결과가 불완전합니다")
+
+
+def stream_xml_to_markdown(xml_path, output_dir=None, mode='single'):
+    """
+    XML 파일을 Markdown으로 변환하면서 결과를 파일에 이어 쓰고, 텍스트 조각을 반환하는 제너레이터입니다.
+
+    Example:
+        for delta in stream_xml_to_markdown('disclosure.xml'):
+            print(delta, end='', flush=True)
+
+    Args:
+        xml_path (str): XML 파일 경로
+        output_dir (str, optional): Markdown 파일을 저장할 디렉토리 경로
+        mode (str): 변환 방식, CONVERSION_MODES 중 하나 (기본값: 'single')
+
+    Yields:
+        str: 파일에 쓴 Markdown 텍스트 조각
+    """
+    path = Path(xml_path)
+    if not (path.is_file() and path.suffix.lower() == '.xml'):
+        raise ValueError(f"유효한 XML 파일 또는 디렉토리가 아닙니다: {xml_path}")
+
+    # 문서는 변환 방식이 필요로 하는 만큼만 조금씩 읽음
+    yield from stream_markdown_to_file(iter_markdown({'path': str(path)}, mode=mode),
+                                       markdown_output_path(path, output_dir))
+
+
+def _prepare_xml_file(xml_path, mode):
+    """
+    일괄 변환의 로컬 처리 단계 (프로세스 풀에서 실행)
+
+    파일 읽기, XML 최소화와 로컬 렌더링처럼 CPU를 쓰는 작업만 수행하고
+    Bedrock 호출이 필요한 부분은 결과로 넘깁니다.
+
+    Returns:
+        tuple: ('markdown', 변환 결과) / ('blocks', (블록 목록, 문서명)) / ('xml', 최소화된 XML)
+    """
+    xml_data = {'path': xml_path}
+    if mode == 'local':
+        return 'markdown', convert_to_markdown_locally(xml_data)
+    if mode == 'hybrid':
+        return 'blocks', render_markdown_blocks(xml_data)
+    return 'xml', _load_for_prompt(xml_data, minify=True)
+
+
+def _is_error_chunk(chunk):
+    """변환 결과 조각이 Bedrock 호출 실패로 생긴 오류 메시지인지 확인합니다."""
+    text = chunk.lstrip()
+    return text.startswith(('오류:', '# 변환 오류')) or re.match(r'> 조각 \d+ 변환 오류', text) is not None
+
+
+def _finish_conversion(prepared, output_path, mode):
+    """
+    일괄 변환의 Bedrock 호출 단계 (스레드 풀에서 실행)
+
+    변환 중 호출이 실패하면 결과 파일을 만들지 않고 예외를 발생시킵니다 (stream_markdown_to_file).
+
+    Returns:
+        str: 저장된 Markdown 파일 경로
+    """
+    kind, payload = prepared
+    if kind == 'xml':
+        chunks = iter_markdown({'raw_content': payload}, mode=mode, minify=False)
+    elif kind == 'blocks':
+        chunks = [_polish_narratives(*payload)]
+    else:
+        chunks = [payload]
+
+    for _ in stream_markdown_to_file(chunks, output_path):
+        pass
+    return str(output_path)
+
+
+def _glob_base(pattern):
+    """glob 패턴에서 와일드카드가 나오기 전까지의 디렉토리"""
+    base = Path()
+    for part in Path(pattern).parts:
+        if any(char in part for char in '*?['):
+            break
+        base /= part
+    return base
+
+
+def find_xml_files(xml_path):
+    """
+    디렉토리(하위 디렉토리 포함) 또는 glob 패턴에 해당하는 XML 파일을 찾습니다.
+
+    Args:
+        xml_path (str): 디렉토리 경로 또는 glob 패턴 (예: 'download/**/*.xml')
+
+    Returns:
+        tuple: (base_dir, files) - 상대 경로의 기준 디렉토리와 정렬된 XML 파일 경로 목록
+    """
+    path = Path(xml_path)
+    if path.is_dir():
+        base, candidates = path, []
+        for directory, dirnames, filenames in os.walk(path):
+            # .store 등 숨김 디렉토리(문서 저장소 사본)는 같은 공시를 두 번 변환하지 않도록 제외
+            dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+            candidates.extend(Path(directory) / filename for filename in filenames)
+    else:
+        base = _glob_base(xml_path)
+        candidates = [Path(match) for match in glob.glob(str(xml_path), recursive=True)]
+        candidates = [candidate for candidate in candidates
+                      if not any(part.startswith('.') and part not in ('.', '..')
+                                 for part in _relative_parts(candidate, base))]
+    files = sorted(candidate for candidate in candidates
+                   if candidate.is_file() and candidate.suffix.lower() == '.xml')
+    return base, files
+
+
+def _relative_parts(path, base):
+    """기준 디렉토리 아래의 경로 구성 요소 (파일 이름 제외)"""
+    try:
+        return path.relative_to(base).parts[:-1]
+    except ValueError:
+        return path.parts[:-1]
+
+
+def _load_manifest(manifest_path):
+    """기존 매니페스트를 읽습니다. 없거나 손상되었으면 빈 매니페스트를 반환합니다."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if isinstance(manifest.get('files'), dict):
+            return manifest
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {'files': {}}
+
+
+def _save_manifest(manifest, manifest_path):
+    """매니페스트를 임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 손상되지 않게 저장합니다."""
+    manifest_path = Path(manifest_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, manifest_path)
+
+
+def _is_converted(entry, source, output_path, mode):
+    """매니페스트 기록상 원본이 바뀐 뒤로 같은 방식의 변환에 성공했고 결과 파일이 남아 있는지 확인합니다."""
+    return (
+        entry is not None
+        and entry.get('status') == 'converted'
+        and entry.get('mode') == mode
+        and entry.get('output') == str(output_path)
+        and entry.get('source_mtime') == source.stat().st_mtime
+        and output_path.exists()
+    )
+
+
+def batch_xml_to_markdown(xml_path, output_dir=None, mode='single', force=False,
+                          parse_workers=None, llm_workers=DEFAULT_BATCH_LLM_WORKERS, manifest_path=None):
+    """
+    디렉토리 또는 glob 패턴에 해당하는 XML 파일들을 한꺼번에 Markdown으로 변환합니다.
+
+    파일 읽기와 로컬 렌더링은 프로세스 풀에서, Bedrock 호출은 llm_workers개의 스레드에서
+    실행하며, 동시에 메모리에 올리는 문서 수를 두 풀의 크기로 제한합니다. 파일별 결과
+    (converted/failed)는 매니페스트 JSON 파일에 기록하고, 같은 방식으로 변환에 성공한 기록이
+    있고 그 뒤로 원본 XML이 바뀌지 않은 파일은 건너뛰므로 다운로드 폴더를 매번 다시 변환해도
+    새 공시와 실패했던 공시만 처리됩니다.
+
+    Args:
+        xml_path (str): 디렉토리 경로 또는 glob 패턴
+        output_dir (str, optional): Markdown 파일을 저장할 디렉토리 (하위 디렉토리 구조 유지, 기본값: 원본과 같은 위치)
+        mode (str): 변환 방식, CONVERSION_MODES 중 하나 (기본값: 'single')
+        force (bool): 이미 최신인 Markdown 파일도 다시 변환할지 여부 (기본값: False)
+        parse_workers (int, optional): 로컬 처리 프로세스 수 (기본값: CPU 수)
+        llm_workers (int): 동시에 Bedrock으로 변환할 문서 수
+        manifest_path (str, optional): 매니페스트 파일 경로 (기본값: 출력 디렉토리의 MARKDOWN_MANIFEST_FILENAME)
+
+    Returns:
+        list: 최신 상태인 Markdown 파일 경로 목록 (변환 및 건너뛴 파일, 입력 순서)
+    """
+    if mode not in CONVERSION_MODES:
+        raise ValueError(f"지원하지 않는 변환 방식입니다: {mode} (가능한 값: {', '.join(CONVERSION_MODES)})")
+
+    base_dir, files = find_xml_files(xml_path)
+    manifest_path = Path(manifest_path or Path(output_dir or base_dir) / MARKDOWN_MANIFEST_FILENAME)
+    manifest = _load_manifest(manifest_path)
+
+    def record(source, output_path, status, started=None, error=None):
+        manifest['files'][str(source)] = {
+            'status': status,
+            'output': str(output_path),
+            'mode': mode,
+            'source_mtime': source.stat().st_mtime,
+            'seconds': round(time.perf_counter() - started, 2) if started else None,
+            'error': error,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+    # 변환할 파일 고르기 (하위 디렉토리 구조를 출력 디렉토리에 그대로 유지)
+    outputs = {}
+    pending = deque()
+    for source in files:
+        target_dir = None
+        if output_dir is not None:
+            target_dir = Path(output_dir) / source.parent.relative_to(base_dir)
+        output_path = markdown_output_path(source, target_dir)
+        outputs[source] = output_path
+        if not force and _is_converted(manifest['files'].get(str(source)), source, output_path, mode):
+            # 이전 변환 기록(방식, 소요 시간)은 유지하고 확인 시각만 갱신
+            manifest['files'][str(source)]['checked_at'] = datetime.now().isoformat(timespec='seconds')
+        else:
+            pending.append(source)
+
+    print(f"일괄 변환: XML {len(files)}개 중 {len(pending)}개 변환, {len(files) - len(pending)}개는 최신 상태라 건너뜀")
+
+    counts = {'converted': 0, 'failed': 0}
+    if pending:
+        parse_workers = parse_workers or os.cpu_count() or 1
+        # 처리 중인 문서 수 상한 (로컬 처리 결과가 Bedrock 호출을 기다리며 쌓이지 않도록)
+        max_in_flight = parse_workers + llm_workers * 2
+        with ProcessPoolExecutor(max_workers=parse_workers) as parsers, \
+                ThreadPoolExecutor(max_workers=llm_workers) as callers:
+            parsing = {}
+            calling = {}
+            while pending or parsing or calling:
+                while pending and len(parsing) + len(calling) < max_in_flight:
+                    source = pending.popleft()
+                    parsing[parsers.submit(_prepare_xml_file, str(source), mode)] = (source, time.perf_counter())
+
+                done, _ = wait(list(parsing) + list(calling), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = parsing if future in parsing else calling
+                    source, started = stage.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"XML 변환 중 오류 발생 ({source}): {str(e)}")
+                        counts['failed'] += 1
+                        record(source, outputs[source], 'failed', started, str(e))
+                        _save_manifest(manifest, manifest_path)
+                        continue
+
+                    if stage is parsing:
+                        calling[callers.submit(_finish_conversion, result, outputs[source], mode)] = (source, started)
+                    else:
+                        counts['converted'] += 1
+                        record(source, outputs[source], 'converted', started)
+                        # 중간에 중단되어도 완료된 파일은 기록이 남도록 파일마다 저장
+                        _save_manifest(manifest, manifest_path)
+
+    _save_manifest(manifest, manifest_path)
+    print(f"일괄 변환 완료: 변환 {counts['converted']}개, 실패 {counts['failed']}개, "
+          f"건너뜀 {len(files) - counts['converted'] - counts['failed']}개 (매니페스트: {manifest_path})")
+
+    return [str(outputs[source]) for source in files
+            if manifest['files'][str(source)]['status'] != 'failed']
+
+
+def xml_to_markdown(xml_path, output_dir=None, mode='single', stream=True):
     """
     단일 XML 파일 또는 디렉토리의 XML 파일들을 Markdown으로 변환합니다.
 
+    디렉토리나 glob 패턴은 batch_xml_to_markdown으로 일괄 변환하며, 매니페스트에 변환
+    완료로 기록되어 있고 그 뒤로 바뀌지 않은 XML은 건너뜁니다.
+
     Args:
-        xml_path (str): XML 파일 또는 디렉토리 경로
+        xml_path (str): XML 파일 또는 디렉토리 경로 (glob 패턴 가능, 예: 'download/**/*.xml')
         output_dir (str, optional): Markdown 파일을 저장할 디렉토리 경로
+        mode (str): 변환 방식, CONVERSION_MODES 중 하나 (기본값: 'single')
+        stream (bool): 변환 결과를 도착하는 대로 파일에 이어 쓸지 여부 (기본값: True)
 
     Returns:
         str or list: 변환된 Markdown 파일 경로 또는 경로 목록
@@ -170,13 +1137,22 @@ def xml_to_markdown(xml_path, output_dir=None):
 
         # 경로가 파일인 경우
         if path.is_file() and path.suffix.lower() == '.xml':
-            xml_content = read_xml_file(path)
-            if xml_content is None:
-                return None
+            xml_data = {'path': str(path)}
 
-            markdown_content = convert_to_markdown({'raw_content': xml_content})
+            if stream:
+                # 응답이 도착하는 대로 파일에 이어 씀
+                output_path = markdown_output_path(path, output_dir)
+                for _ in stream_markdown_to_file(iter_markdown(xml_data, mode=mode), output_path):
+                    pass
+                return str(output_path)
+
+            markdown_content = convert_to_markdown(xml_data, mode=mode)
             return save_markdown_file(markdown_content, path, output_dir)
 
+        # 디렉토리 또는 glob 패턴인 경우
+        elif path.is_dir() or any(char in str(xml_path) for char in '*?['):
+            return batch_xml_to_markdown(xml_path, output_dir=output_dir, mode=mode)
+
         else:
             raise ValueError(f"유효한 XML 파일 또는 디렉토리가 아닙니다: {xml_path}")
 
@@ -0,0 +1,109 @@
+"""
+Bulk Disclosure Download Service
+
+This module downloads many disclosure documents at once on a bounded thread
+pool. Every request still goes through the shared DartClient, so the
+process-wide rate limiter, daily quota and retry policy apply; when the
+quota runs out or the circuit breaker opens the remaining downloads are
+abandoned. The result feeds display.display_download_summary.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from api.dart_api import DartCircuitOpenError, DartQuotaExceededError
+from api.rate_limiter import get_default_rate_limiter
+from service.dart_service import download_disclosure_document
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def _normalize_targets(disclosures):
+    """Turn disclosure dicts or bare rcept_no values into (report_name, rcept_no) tuples"""
+    targets = []
+    seen = set()
+    for item in disclosures:
+        if isinstance(item, dict):
+            rcept_no = item['rcept_no']
+            name = item.get('report_nm') or rcept_no
+        else:
+            rcept_no = str(item)
+            name = rcept_no
+        if rcept_no not in seen:
+            seen.add(rcept_no)
+            targets.append((name.strip(), rcept_no))
+    return targets
+
+
+def download_disclosure_documents(disclosures, download_dir=None, max_workers=DEFAULT_MAX_WORKERS, on_progress=None):
+    """
+    Download many disclosure documents in parallel.
+
+    Args:
+        disclosures: Disclosure dicts (with 'rcept_no' and 'report_nm') or rcept_no strings
+        download_dir: Directory to save the zip files to (default: download directory)
+        max_workers: Number of concurrent downloads
+        on_progress: Optional callback(done, total, report_name, rcept_no, path)
+
+    Returns:
+        dict: {
+            "downloaded_files": [(report_name, file_path), ...],
+            "failed_downloads": [(report_name, rcept_no), ...],
+            "total_count": number of documents requested
+        }
+        The keys match display.display_download_summary, so the result can be
+        shown with display_download_summary(**result).
+    """
+    targets = _normalize_targets(disclosures)
+    total = len(targets)
+
+    limiter = get_default_rate_limiter()
+    if not limiter.can_schedule(total):
+        print(f"Warning: only {limiter.remaining()} OpenDART requests left today for {total} documents")
+
+    results = {}
+    done = 0
+    lock = threading.Lock()
+    halted = threading.Event()
+    halt_reason = []
+
+    def worker(name, rcept_no):
+        if halted.is_set():
+            return None
+        try:
+            # Transient failures are retried inside the client by the shared resilience policy
+            return download_disclosure_document(rcept_no=rcept_no, download_dir=download_dir)
+        except (DartQuotaExceededError, DartCircuitOpenError) as e:
+            # Stop the remaining queued downloads instead of failing them one by one
+            if not halted.is_set():
+                halt_reason.append(str(e))
+                halted.set()
+            return None
+
+    print(f"Downloading {total} disclosure documents with {max_workers} workers...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(worker, name, rcept_no): (name, rcept_no) for name, rcept_no in targets}
+        for future in as_completed(futures):
+            name, rcept_no = futures[future]
+            try:
+                path = future.result()
+            except Exception as e:
+                print(f" - Error downloading {rcept_no}: {str(e)}")
+                path = None
+
+            with lock:
+                results[rcept_no] = path
+                done += 1
+                print(f" - [{done}/{total}] {'OK' if path else 'FAILED'} {name} ({rcept_no})")
+                if on_progress:
+                    on_progress(done, total, name, rcept_no, path)
+
+    if halted.is_set():
+        print(f"Downloads halted ({halt_reason[0]}); remaining documents were not downloaded.")
+
+    # Report in the order the documents were requested
+    return {
+        "downloaded_files": [(name, results[rcept_no]) for name, rcept_no in targets if results.get(rcept_no)],
+        "failed_downloads": [(name, rcept_no) for name, rcept_no in targets if not results.get(rcept_no)],
+        "total_count": total
+    }
@@ -0,0 +1,371 @@
+"""
+Supply Contract Extractor
+
+This module reads 단일판매ㆍ공급계약체결 (single sale / supply contract)
+notices straight from their DART XML into typed records: amounts become
+integers, the revenue ratio a float and dates datetime.date values.
+
+These notices use a fixed DART form, so the form table is parsed by its
+row labels without any LLM call. Only when a document does not match the
+form is the LLM asked for the same fields.
+
+Example:
+    records = extract_supply_contracts(['download/disclosure_20250102000123/20250102000123.xml'])
+    save_supply_contracts_to_csv(records)
+"""
+
+import json
+import re
+from datetime import date
+from html.parser import HTMLParser
+from pathlib import Path
+
+from api import bedrock_api, model_router
+from utils.csv_utils import save_disclosures_to_csv
+from utils.xml_utils import extract_document_info, minify_xml, read_xml_text
+
+# Columns of an extracted record, in table order
+SUPPLY_CONTRACT_FIELDS = (
+    'rcept_no', 'corp_code', 'corp_name', 'report_nm', 'is_correction',
+    'contract_name', 'contract_amount', 'recent_revenue', 'revenue_ratio',
+    'counterparty', 'counterparty_relation', 'region',
+    'start_date', 'end_date', 'contract_date', 'conditions',
+    'source', 'path',
+)
+
+# Fields filled from the form (and requested from the LLM on fallback)
+FORM_FIELDS = (
+    'contract_name', 'contract_amount', 'recent_revenue', 'revenue_ratio', 'counterparty',
+    'counterparty_relation', 'region', 'start_date', 'end_date', 'contract_date', 'conditions',
+)
+AMOUNT_FIELDS = ('contract_amount', 'recent_revenue')
+DATE_FIELDS = ('start_date', 'end_date', 'contract_date')
+
+LLM_PROMPT_TEMPLATE = """아래는 DART 단일판매ㆍ공급계약체결 공시의 XML입니다.
+다음 키를 가진 JSON 객체 하나만 출력하세요. 값이 없으면 null로 두고, 금액은 원 단위 정수,
+비율은 숫자(%), 날짜는 YYYY-MM-DD 형식으로 작성하세요.
+
+키: contract_name(계약명), contract_amount(계약금액 총액), recent_revenue(최근 매출액),
+revenue_ratio(매출액 대비 비율), counterparty(계약상대방), counterparty_relation(회사와의 관계),
+region(판매ㆍ공급지역), start_date(계약기간 시작일), end_date(계약기간 종료일),
+contract_date(계약(수주)일자), conditions(주요 계약조건)
+
+```xml
+{xml_content}
+```"""
+
+_GROUP_LABEL_PATTERN = re.compile(r'^\s*(\d{1,2})\s*[.)]\s*')
+_LABEL_NOISE_PATTERN = re.compile(r'[\sㆍ·・\-]')
+_NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+_DATE_PATTERN = re.compile(r'(\d{4})\s*[-./년]\s*(\d{1,2})\s*[-./월]\s*(\d{1,2})')
+
+
+class _FormTableParser(HTMLParser):
+    """Collect the rows of every top-level table as lists of cell texts"""
+
+    CELL_TAGS = ('td', 'th', 'te', 'tu')
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self._table_depth = 0
+        self._row = None
+        self._cell = None
+
+    def _finish_cell(self):
+        if self._cell is not None:
+            self._row.append(' '.join(''.join(self._cell).split()))
+            self._cell = None
+
+    def _finish_row(self):
+        self._finish_cell()
+        if self._row:
+            self.rows.append(self._row)
+        self._row = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            self._table_depth += 1
+        elif self._table_depth == 1 and tag == 'tr':
+            self._finish_row()
+            self._row = []
+        elif self._table_depth == 1 and tag in self.CELL_TAGS:
+            if self._row is None:
+                self._row = []
+            self._finish_cell()
+            self._cell = []
+        elif tag in ('p', 'br') and self._cell is not None:
+            self._cell.append(' ')
+
+    def handle_endtag(self, tag):
+        if tag == 'table' and self._table_depth:
+            self._table_depth -= 1
+            if self._table_depth == 0:
+                self._finish_row()
+        elif self._table_depth == 1 and tag == 'tr':
+            self._finish_row()
+        elif self._table_depth == 1 and tag in self.CELL_TAGS:
+            self._finish_cell()
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def close(self):
+        super().close()
+        self._finish_row()
+
+
+def _normalize_label(label):
+    return _LABEL_NOISE_PATTERN.sub('', label)
+
+
+def parse_form_rows(xml_content):
+    """
+    Read the label/value rows of the form tables in a DART document
+
+    Numbered rows ('2. 계약내역') open a group; the rows below them, whose
+    group cell is merged away by ROWSPAN, carry a sub-label ('- 계약금액 총액(원)').
+
+    Args:
+        xml_content: Raw DART XML
+
+    Returns:
+        list: (group, label, value) tuples with labels normalized (no spaces, dashes or 'ㆍ')
+    """
+    parser = _FormTableParser()
+    parser.feed(xml_content)
+    parser.close()
+
+    result = []
+    group = ''
+    for cells in parser.rows:
+        match = _GROUP_LABEL_PATTERN.match(cells[0])
+        if match:
+            group = _normalize_label(cells[0][match.end():])
+            cells = cells[1:]
+        if not cells:
+            result.append((group, '', ''))
+        elif len(cells) == 1:
+            # A group row holds its value directly; a lone cell below a group is a label without value
+            result.append((group, '', cells[0]) if match else (group, _normalize_label(cells[0]), ''))
+        else:
+            result.append((group, _normalize_label(' '.join(cells[:-1])), cells[-1]))
+    return result
+
+
+def parse_amount(value):
+    """'1,234,567,890' -> 1234567890; None for '-', blanks and text without digits"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    digits = re.sub(r'[,\s원]', '', str(value))
+    match = _NUMBER_PATTERN.search(digits)
+    return int(float(match.group(0))) if match else None
+
+
+def parse_ratio(value):
+    """'12.34' or '12.34%' -> 12.34; None if there is no number"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _NUMBER_PATTERN.search(str(value).replace(',', ''))
+    return float(match.group(0)) if match else None
+
+
+def parse_date(value):
+    """'2025-01-02', '2025.01.02' or '2025년 01월 02일' -> date(2025, 1, 2); None otherwise"""
+    match = _DATE_PATTERN.search(str(value or ''))
+    if not match:
+        return None
+    try:
+        return date(*(int(part) for part in match.groups()))
+    except ValueError:
+        return None
+
+
+def _text(value):
+    value = ' '.join(str(value or '').split())
+    return None if value in ('', '-') else value
+
+
+def _assign(fields, group, label, value):
+    """Map one form row onto the record fields"""
+    if '계약내용' in group or '체결계약명' in label:
+        if not label or '체결계약명' in label:
+            fields.setdefault('contract_name', _text(value))
+    elif '계약내역' in group or group.startswith('계약금액'):
+        if '계약금액' in label and ('총액' in label or 'contract_amount' not in fields):
+            if '확정' not in label and '조건부' not in label:
+                fields['contract_amount'] = parse_amount(value)
+        elif '최근매출액' in label:
+            fields.setdefault('recent_revenue', parse_amount(value))
+        elif '매출액대비' in label:
+            fields.setdefault('revenue_ratio', parse_ratio(value))
+    elif '계약상대' in group:
+        if not label:
+            fields.setdefault('counterparty', _text(value))
+        elif '회사와의관계' in label:
+            fields.setdefault('counterparty_relation', _text(value))
+    elif '공급지역' in group:
+        if not label:
+            fields.setdefault('region', _text(value))
+    elif '계약기간' in group:
+        if '시작' in label:
+            fields.setdefault('start_date', parse_date(value))
+        elif '종료' in label:
+            fields.setdefault('end_date', parse_date(value))
+    elif '계약' in group and '일자' in group:
+        fields.setdefault('contract_date', parse_date(value))
+    elif '주요계약조건' in group:
+        if not label:
+            fields.setdefault('conditions', _text(value))
+
+
+def _new_record(xml_content, path=None):
+    info = extract_document_info(xml_content)
+    rcept_no = re.search(r'(?<!\d)(\d{14})(?!\d)', Path(path).name) if path else None
+    record = dict.fromkeys(SUPPLY_CONTRACT_FIELDS)
+    record.update(
+        rcept_no=rcept_no.group(1) if rcept_no else None,
+        corp_code=info['corp_code'] or None,
+        corp_name=info['company_name'] or None,
+        report_nm=info['document_name'] or None,
+        is_correction='정정' in info['document_name'],
+        path=str(path) if path else None,
+    )
+    return record
+
+
+def is_supply_contract(xml_content):
+    """Whether the document is a 단일판매ㆍ공급계약체결 notice"""
+    name = _normalize_label(extract_document_info(xml_content)['document_name'])
+    return '공급계약' in name or '판매계약' in name
+
+
+def parse_supply_contract(xml_content, path=None):
+    """
+    Parse a supply contract notice from its form table without an LLM
+
+    Args:
+        xml_content: Raw DART XML
+        path: Source file path, used for rcept_no and kept in the record
+
+    Returns:
+        dict: Record with SUPPLY_CONTRACT_FIELDS (source 'form'), or None if the form does not match
+    """
+    fields = {}
+    for group, label, value in parse_form_rows(xml_content):
+        _assign(fields, group, label, value)
+
+    # The form matched if it yielded the amount and who or what the contract is for
+    if fields.get('contract_amount') is None or not (fields.get('counterparty') or fields.get('contract_name')):
+        return None
+
+    record = _new_record(xml_content, path)
+    record.update({key: value for key, value in fields.items() if key in FORM_FIELDS})
+    record['source'] = 'form'
+    return record
+
+
+def _extract_with_llm(xml_content, path=None):
+    """Ask the LLM for the form fields of a document the form parser could not read"""
+    minified = minify_xml(xml_content)
+    decision = model_router.get_default_model_router().route(minified, label='공급계약 추출')
+    response = bedrock_api.invoke_claude_with_boto3(
+        prompt=LLM_PROMPT_TEMPLATE.format(xml_content=minified),
+        model_id=decision['model_id'], max_tokens=1000, temperature=0.0
+    )
+    match = re.search(r'\{.*\}', response or '', re.S)
+    if not match:
+        raise ValueError(f"LLM response is not JSON: {(response or '')[:200]}")
+    values = json.loads(match.group(0))
+
+    record = _new_record(xml_content, path)
+    for key in FORM_FIELDS:
+        value = values.get(key)
+        if key in AMOUNT_FIELDS:
+            record[key] = parse_amount(value)
+        elif key in DATE_FIELDS:
+            record[key] = parse_date(value)
+        elif key == 'revenue_ratio':
+            record[key] = parse_ratio(value)
+        else:
+            record[key] = _text(value)
+    record['source'] = 'llm'
+    return record
+
+
+def extract_supply_contract(xml_path, use_llm=True):
+    """
+    Extract a supply contract record from a notice XML file
+
+    Args:
+        xml_path: Path to the notice XML
+        use_llm: Fall back to the LLM when the form does not match
+
+    Returns:
+        dict: Record with SUPPLY_CONTRACT_FIELDS; source is 'form', 'llm' or 'unmatched'
+    """
+    xml_content = read_xml_text(xml_path)
+    record = parse_supply_contract(xml_content, path=xml_path)
+    if record is not None:
+        return record
+
+    if use_llm:
+        try:
+            return _extract_with_llm(xml_content, path=xml_path)
+        except Exception as e:
+            print(f"Error extracting supply contract with LLM ({xml_path}): {str(e)}")
+
+    record = _new_record(xml_content, path=xml_path)
+    record['source'] = 'unmatched'
+    return record
+
+
+def extract_supply_contracts(xml_paths, use_llm=True):
+    """
+    Extract supply contract records from many notices
+
+    Args:
+        xml_paths: Iterable of notice XML paths
+        use_llm: Fall back to the LLM when the form does not match
+
+    Returns:
+        list: One record per file, in input order
+    """
+    records = []
+    for xml_path in xml_paths:
+        try:
+            records.append(extract_supply_contract(xml_path, use_llm=use_llm))
+        except Exception as e:
+            print(f"Error extracting supply contract from {xml_path}: {str(e)}")
+
+    counts = {}
+    for record in records:
+        counts[record['source']] = counts.get(record['source'], 0) + 1
+    print(f"Supply contracts extracted: {len(records)} "
+          f"(form: {counts.get('form', 0)}, llm: {counts.get('llm', 0)}, unmatched: {counts.get('unmatched', 0)})")
+    return records
+
+
+def to_json_record(record):
+    """Copy of a record with dates as ISO strings, for JSON output"""
+    return {key: value.isoformat() if isinstance(value, date) else value for key, value in record.items()}
+
+
+def save_supply_contracts_to_csv(records, filename=None):
+    """
+    Save extracted records as one table in the data directory
+
+    Args:
+        records: Records from extract_supply_contracts
+        filename: Optional filename (without path or extension)
+
+    Returns:
+        str: Path to the saved CSV file
+    """
+    return save_disclosures_to_csv([to_json_record(record) for record in records],
+                                   filename=filename or 'supply_contracts')
@@ -0,0 +1,281 @@
+"""
+Corp Code Index Service
+
+This module keeps a local, indexed copy of the OpenDART corpCode.xml archive.
+The archive is downloaded at most once per day and loaded into SQLite, so that
+company names, stock codes and DART corp codes can be resolved locally:
+
+    corp_code <-> stock_code <-> Korean / English company name
+"""
+
+import difflib
+import io
+import re
+import sqlite3
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
+from datetime import datetime
+
+from api.dart_api import get_corp_code_archive
+from utils.path_utils import ensure_cache_directory
+
+# Refresh the archive when the stored copy was fetched on an earlier day
+REFRESH_DATE_FORMAT = '%Y%m%d'
+
+CORP_CODE_COLUMNS = ('corp_code', 'corp_name', 'corp_eng_name', 'stock_code', 'modify_date')
+
+# Legal entity markers that users usually leave out of company names
+# Latin suffixes are anchored on word boundaries so 'Incheon' or 'Principal' keep their letters
+_NAME_NOISE_PATTERN = re.compile(r'\(주\)|㈜|주식회사|\(유\)|유한회사|\b(?:co\.?,?\s*ltd|inc|corp)\b\.?|[\s.,()]',
+                                 re.IGNORECASE)
+
+
+def normalize_company_name(name):
+    """
+    Normalize a company name for index lookups
+
+    Args:
+        name: Company name in Korean or English
+
+    Returns:
+        str: Lower-cased name without spaces, punctuation or legal entity markers
+    """
+    return _NAME_NOISE_PATTERN.sub('', name or '').lower()
+
+
+def parse_corp_code_archive(archive_bytes):
+    """
+    Parse a corpCode.xml zip archive into company records
+
+    Args:
+        archive_bytes: Zip archive returned by the corpCode.xml endpoint
+
+    Yields:
+        dict: Company record with corp_code, corp_name, corp_eng_name, stock_code, modify_date
+    """
+    with zipfile.ZipFile(io.BytesIO(archive_bytes)) as archive:
+        xml_name = next(name for name in archive.namelist() if name.lower().endswith('.xml'))
+        with archive.open(xml_name) as xml_file:
+            for _, element in ET.iterparse(xml_file, events=('end',)):
+                if element.tag != 'list':
+                    continue
+                record = {column: (element.findtext(column) or '').strip() for column in CORP_CODE_COLUMNS}
+                element.clear()
+                if record['corp_code']:
+                    yield record
+
+
+class CorpCodeIndex:
+    """
+    SQLite-backed index over the OpenDART corp code list.
+
+    Example:
+        index = CorpCodeIndex()
+        index.resolve('삼성전자')['corp_code']  # '00126380'
+    """
+
+    def __init__(self, db_path=None, archive_loader=get_corp_code_archive):
+        """
+        Args:
+            db_path: SQLite database path (default: download/.cache/corp_codes.sqlite3)
+            archive_loader: Callable returning the corpCode.xml zip bytes
+        """
+        self.db_path = db_path or ensure_cache_directory() / 'corp_codes.sqlite3'
+        self.archive_loader = archive_loader
+        self._local = threading.local()
+        self._name_keys = None
+        self._refresh_failed_on = None
+
+        conn = self._connection()
+        conn.executescript(
+            'CREATE TABLE IF NOT EXISTS corp_codes ('
+            ' corp_code TEXT PRIMARY KEY, corp_name TEXT NOT NULL, corp_eng_name TEXT,'
+            ' stock_code TEXT, modify_date TEXT, name_key TEXT NOT NULL, eng_key TEXT);'
+            'CREATE INDEX IF NOT EXISTS idx_corp_codes_stock_code ON corp_codes (stock_code);'
+            'CREATE INDEX IF NOT EXISTS idx_corp_codes_name_key ON corp_codes (name_key);'
+            'CREATE INDEX IF NOT EXISTS idx_corp_codes_eng_key ON corp_codes (eng_key);'
+            'CREATE TABLE IF NOT EXISTS corp_code_meta (key TEXT PRIMARY KEY, value TEXT);'
+        )
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def last_refreshed(self):
+        """Date (YYYYMMDD) the archive was last downloaded, or None"""
+        row = self._connection().execute(
+            "SELECT value FROM corp_code_meta WHERE key = 'fetched_at'"
+        ).fetchone()
+        return row['value'] if row else None
+
+    def refresh(self, force=False):
+        """
+        Download and index the corpCode.xml archive if it was not fetched today
+
+        Args:
+            force: Download even if the index was refreshed today
+
+        Returns:
+            bool: True if the archive was downloaded, False if the local copy was current
+                or the download failed and the existing index is served instead
+        """
+        today = datetime.now().strftime(REFRESH_DATE_FORMAT)
+        if not force and today in (self.last_refreshed(), self._refresh_failed_on):
+            return False
+
+        conn = self._connection()
+        try:
+            records = parse_corp_code_archive(self.archive_loader())
+            rows = (
+                (r['corp_code'], r['corp_name'], r['corp_eng_name'], r['stock_code'] or None, r['modify_date'],
+                 normalize_company_name(r['corp_name']), normalize_company_name(r['corp_eng_name']))
+                for r in records
+            )
+
+            with conn:
+                conn.execute('DELETE FROM corp_codes')
+                conn.executemany('INSERT OR REPLACE INTO corp_codes VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+                conn.execute("INSERT OR REPLACE INTO corp_code_meta (key, value) VALUES ('fetched_at', ?)", (today,))
+        except Exception as e:
+            # A stale index still resolves almost every company; only fail when there is nothing to serve.
+            # The failed transaction was rolled back, so yesterday's rows are intact.
+            if not self._has_rows():
+                raise
+            print(f"Failed to refresh corp code index, using the copy from {self.last_refreshed()}: {e}")
+            # Do not retry the download on every lookup for the rest of the day
+            self._refresh_failed_on = today
+            return False
+
+        self._name_keys = None
+        return True
+
+    def _has_rows(self):
+        return self._connection().execute('SELECT 1 FROM corp_codes LIMIT 1').fetchone() is not None
+
+    def ensure_loaded(self):
+        """Refresh the index when it is empty or was fetched on an earlier day"""
+        self.refresh(force=False)
+
+    def get_by_corp_code(self, corp_code):
+        """Look up a company by its 8-digit DART corp code"""
+        self.ensure_loaded()
+        row = self._connection().execute('SELECT * FROM corp_codes WHERE corp_code = ?', (corp_code,)).fetchone()
+        return self._to_record(row)
+
+    def get_by_stock_code(self, stock_code):
+        """Look up a listed company by its 6-digit stock code"""
+        self.ensure_loaded()
+        row = self._connection().execute('SELECT * FROM corp_codes WHERE stock_code = ?', (stock_code,)).fetchone()
+        return self._to_record(row)
+
+    def search(self, name, limit=10, fuzzy=True):
+        """
+        Search companies by Korean or English name
+
+        Exact matches come first, then prefix and substring matches, then
+        (optionally) fuzzy matches. Listed companies are ranked ahead of unlisted ones.
+
+        Args:
+            name: Full or partial company name
+            limit: Maximum number of results
+            fuzzy: Whether to fall back to similarity matching
+
+        Returns:
+            list: Company records ordered by relevance
+        """
+        self.ensure_loaded()
+        key = normalize_company_name(name)
+        if not key:
+            return []
+
+        conn = self._connection()
+        results = {}
+        order = 'ORDER BY stock_code IS NULL, length(name_key), corp_name'
+
+        for query, params in (
+            (f'SELECT * FROM corp_codes WHERE name_key = ? OR eng_key = ? {order}', (key, key)),
+            (f'SELECT * FROM corp_codes WHERE (name_key >= ? AND name_key < ?) OR (eng_key >= ? AND eng_key < ?) '
+             f'{order} LIMIT ?', (key, key + '\uffff', key, key + '\uffff', limit)),
+            (f'SELECT * FROM corp_codes WHERE instr(name_key, ?) > 0 OR instr(eng_key, ?) > 0 {order} LIMIT ?',
+             (key, key, limit)),
+        ):
+            for row in conn.execute(query, params):
+                results.setdefault(row['corp_code'], self._to_record(row))
+            if len(results) >= limit:
+                return list(results.values())[:limit]
+
+        if fuzzy:
+            for match in difflib.get_close_matches(key, self._get_name_keys(), n=limit, cutoff=0.6):
+                for row in conn.execute(f'SELECT * FROM corp_codes WHERE name_key = ? {order}', (match,)):
+                    results.setdefault(row['corp_code'], self._to_record(row))
+
+        return list(results.values())[:limit]
+
+    def resolve(self, query):
+        """
+        Resolve a company name, stock code or corp code to a single company record
+
+        Args:
+            query: Company name, 6-digit stock code or 8-digit corp code
+
+        Returns:
+            dict: Best matching company record or None
+        """
+        query = (query or '').strip()
+        if re.fullmatch(r'\d{8}', query):
+            return self.get_by_corp_code(query)
+        if re.fullmatch(r'\d{6}', query):
+            return self.get_by_stock_code(query)
+
+        matches = self.search(query, limit=1)
+        return matches[0] if matches else None
+
+    def _get_name_keys(self):
+        # Distinct normalized Korean names, kept in memory for fuzzy matching
+        if self._name_keys is None:
+            self._name_keys = [row[0] for row in self._connection().execute('SELECT DISTINCT name_key FROM corp_codes')]
+        return self._name_keys
+
+    @staticmethod
+    def _to_record(row):
+        if row is None:
+            return None
+        return {column: row[column] or '' for column in CORP_CODE_COLUMNS}
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_corp_code_index():
+    """
+    Return the process-wide CorpCodeIndex, creating it on first use
+
+    Returns:
+        CorpCodeIndex: Shared index instance
+    """
+    global _default_index
+    if _default_index is None:
+        with _default_index_lock:
+            if _default_index is None:
+                _default_index = CorpCodeIndex()
+    return _default_index
+
+
+def find_corp_code(company_name):
+    """
+    Resolve a company name (or stock code) to its DART corp code
+
+    Args:
+        company_name: Company name such as '삼성전자', or a 6-digit stock code
+
+    Returns:
+        str: 8-digit corp code, or None if no company matched
+    """
+    record = get_corp_code_index().resolve(company_name)
+    return record['corp_code'] if record else None
@@ -0,0 +1,76 @@
+"""
+Asynchronous DART API Service Layer
+
+This module provides asyncio versions of the dart_service helpers. All
+date windows of a range are requested concurrently through an
+AsyncDartClient instead of one after another.
+"""
+
+import asyncio
+
+from api.dart_async_api import AsyncDartClient, DEFAULT_MAX_CONCURRENCY
+from utils.date_utils import split_date_range
+
+
+async def get_disclosure_list_by_date_range_async(corp_code, start_date, end_date, page_count=100, pblntf_ty=None,
+                                                  client=None, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    """
+    Fetch a list of disclosures for a specific company over a date range,
+    issuing every weekly window at once with bounded concurrency.
+
+    Args:
+        corp_code: Company code
+        start_date: Start date in YYYYMMDD format
+        end_date: End date in YYYYMMDD format
+        page_count: Number of results per list.json page (default: 100)
+        pblntf_ty: 공시 유형
+        client: AsyncDartClient to use (optional, a temporary one is created otherwise)
+        max_concurrency: Concurrency limit for the temporary client
+
+    Returns:
+        List of all disclosure documents from start_date to end_date, in date order
+
+    Raises:
+        DartAPIError: If any window could not be fetched
+    """
+    windows = split_date_range(start_date, end_date, days=7)
+    print(f"Fetching disclosures from {start_date} to {end_date} ({len(windows)} weekly windows concurrently)...")
+
+    owns_client = client is None
+    if owns_client:
+        client = AsyncDartClient(max_concurrency=max_concurrency)
+
+    try:
+        results = await asyncio.gather(
+            *(client.get_disclosure_list(corp_code=corp_code, start_date=week_start, end_date=week_end,
+                                         page_count=page_count, pblntf_ty=pblntf_ty)
+              for week_start, week_end in windows),
+            return_exceptions=True
+        )
+    finally:
+        if owns_client:
+            await client.close()
+
+    all_disclosures = []
+    for result in results:
+        # A failed window is an error, not an empty week; transient failures were already retried
+        if isinstance(result, BaseException):
+            raise result
+        all_disclosures.extend(result)
+
+    print(f"Total disclosures collected: {len(all_disclosures)}")
+    return all_disclosures
+
+
+def get_disclosure_list_by_date_range_concurrent(corp_code, start_date, end_date, page_count=100, pblntf_ty=None,
+                                                 max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    """
+    Synchronous entry point that runs get_disclosure_list_by_date_range_async
+    on a fresh event loop.
+
+    Returns:
+        List of all disclosure documents from start_date to end_date
+    """
+    return asyncio.run(get_disclosure_list_by_date_range_async(
+        corp_code, start_date, end_date, page_count=page_count, pblntf_ty=pblntf_ty,
+        max_concurrency=max_concurrency))
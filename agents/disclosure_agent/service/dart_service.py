@@ -5,92 +5,62 @@ This module provides higher-level services on top of the basic DART API function
 such as date range based fetching with optimized API calls.
 """
 
-import time
 import os
-from datetime import datetime, timedelta
 from pathlib import Path
-from api.dart_api import get_disclosure_list, download_document, DartAPIError
+from api.dart_api import download_document, open_document, DartCircuitOpenError, DartQuotaExceededError
+from service.document_store import get_document_store
+from service.window_planner import AdaptiveWindowPlanner, DEFAULT_MAX_PAGES_PER_WINDOW
+from utils.path_utils import ensure_download_directory
 
-def get_disclosure_list_by_date_range(corp_code, start_date, end_date, page_count=100, pblntf_ty=None):
+def get_disclosure_list_by_date_range(corp_code, start_date, end_date, page_count=100, pblntf_ty=None,
+                                      max_pages=DEFAULT_MAX_PAGES_PER_WINDOW):
     """
-    Fetch a list of disclosures for a specific company over a date range,
-    collecting them week by week to ensure comprehensive results.
+    Fetch a list of disclosures for a specific company over a date range.
+
+    The range is requested as one wide window first and only the windows
+    whose results overflow the page budget are bisected, so companies that
+    file rarely need a single request instead of one per week.
 
     Args:
         corp_code: Company code
         start_date: Start date in YYYYMMDD format
         end_date: End date in YYYYMMDD format
-        page_count: Maximum number of results per week (default: 100)
+        page_count: Number of results per list.json page (default: 100)
+        pblntf_ty: 공시 유형
+        max_pages: Windows needing more list.json pages than this are bisected
 
     Returns:
         List of all disclosure documents from start_date to end_date
-    """
-    # Convert date strings to datetime objects for iteration
-    start_dt = datetime.strptime(str(start_date), '%Y%m%d')
-    end_dt = datetime.strptime(str(end_date), '%Y%m%d')
-
-    # Initialize list to collect all disclosures
-    all_disclosures = []
-
-    # Create a timedelta of 7 days (one week) to iterate through each week
-    one_week = timedelta(days=7)
-    current_dt = start_dt
-
-    print(f"Fetching disclosures from {start_date} to {end_date} week by week...")
 
-    # Iterate through the date range by weekly chunks
-    while current_dt <= end_dt:
-        # Calculate end date for this week (either 7 days later or the final end date, whichever is sooner)
-        week_end_dt = min(current_dt + one_week - timedelta(days=1), end_dt)
-
-        # Format dates to YYYYMMDD string format
-        week_start_str = current_dt.strftime('%Y%m%d')
-        week_end_str = week_end_dt.strftime('%Y%m%d')
+    Raises:
+        DartAPIError: If a window still fails after the client's retries, instead of
+            returning a list with a silent gap
+    """
+    print(f"Fetching disclosures from {start_date} to {end_date}...")
 
-        try:
-            # Fetch disclosures for this specific week
-            print(f" - Fetching disclosures for week {week_start_str} to {week_end_str}...")
-
-            weekly_disclosures = get_disclosure_list(
-                corp_code=corp_code,
-                start_date=week_start_str,
-                end_date=week_end_str,
-                page_count=page_count,
-                pblntf_ty=pblntf_ty
-            )
-
-            # If we got any results, add them to our collection
-            if weekly_disclosures:
-                # print(f"Found {len(weekly_disclosures)} disclosures for week {week_start_str} to {week_end_str}")
-                all_disclosures.extend(weekly_disclosures)
-            else:
-                # print(f"No disclosures found for week {week_start_str} to {week_end_str}")
-                pass
-
-            # Add a small delay to avoid hitting API rate limits
-            time.sleep(0.5)
-
-        except DartAPIError as e:
-            # print(f"Error fetching disclosures for week {week_start_str} to {week_end_str}: {str(e)}")
-            # Continue to the next week even if there's an error
-            pass
-
-        # Move to the next week
-        current_dt += one_week
+    planner = AdaptiveWindowPlanner(page_count=page_count, max_pages=max_pages)
+    all_disclosures = list(planner.iter_disclosures(corp_code, start_date, end_date, pblntf_ty=pblntf_ty))
 
+    stats = planner.stats
+    print(f" - API requests: {stats['requests']}, cached empty windows skipped: {stats['windows_skipped']}, "
+          f"windows split: {stats['windows_bisected']}")
     print(f"Total disclosures collected: {len(all_disclosures)}")
     return all_disclosures
 
 
-def download_disclosure_document(rcept_no, download_dir=None, filename=None):
+def download_disclosure_document(rcept_no, download_dir=None, filename=None, use_store=True):
     """
     Download disclosure document by receipt number with enhanced directory handling.
     This is a service-layer wrapper around the dart_api.download_document function.
 
+    Documents are served from the local document store when available, so a
+    filing is transferred from OpenDART only once.
+
     Args:
         rcept_no: Receipt number of the disclosure to download
         download_dir: Custom directory to save the document (optional)
         filename: Custom filename for the downloaded document (optional)
+        use_store: Whether to go through the local document store (default: True)
 
     Returns:
         str: Path to the downloaded file or None if download failed
@@ -128,8 +98,17 @@ def download_disclosure_document(rcept_no, download_dir=None, filename=None):
             # If only filename is provided, use default directory
             save_path = filename
 
-        # Call the API function to download the document
-        result = download_document(rcept_no=rcept_no, save_path=save_path)
+        if use_store:
+            # Download into the store once, then hand out a local copy of the archive
+            store = get_document_store()
+            if save_path is None:
+                save_path = ensure_download_directory() / f"disclosure_{rcept_no}.zip"
+            elif not Path(save_path).is_absolute():
+                save_path = ensure_download_directory() / save_path
+            result = store.copy_archive(rcept_no, save_path) if store.fetch(rcept_no) else None
+        else:
+            # Call the API function to download the document
+            result = download_document(rcept_no=rcept_no, save_path=save_path)
 
         if result:
             # print(f"Document downloaded successfully: {result}")
@@ -138,6 +117,40 @@ def download_disclosure_document(rcept_no, download_dir=None, filename=None):
             print(f"Failed to download document for receipt number: {rcept_no}")
             return None
 
+    except (DartQuotaExceededError, DartCircuitOpenError):
+        raise
     except Exception as e:
         print(f"Error downloading disclosure document: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+
+
+def open_disclosure_document(rcept_no, use_store=True):
+    """
+    Open a disclosure document as an in-memory archive whose members are read lazily.
+
+    Unlike download_disclosure_document this never writes the zip to the
+    download directory nor extracts it; XML members are read straight from
+    the archive.
+
+    Args:
+        rcept_no: Receipt number of the disclosure
+        use_store: Serve the archive from the local document store when available,
+            and add newly downloaded archives to it without extracting them (default: True)
+
+    Returns:
+        DisclosureArchive: Archive to be closed by the caller
+    """
+    if use_store:
+        store = get_document_store()
+        archive = store.open_archive(rcept_no)
+        if archive is not None:
+            return archive
+
+    archive = open_document(rcept_no)
+    if use_store:
+        try:
+            get_document_store().put_chunks(rcept_no, archive.iter_bytes(), extract=False)
+        except Exception as e:
+            # The archive is still readable; a failed store write (e.g. disk full) only costs the local copy
+            print(f"Error storing disclosure document {rcept_no}: {str(e)}")
+    return archive
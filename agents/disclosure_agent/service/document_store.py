@@ -0,0 +1,294 @@
+"""
+Disclosure Document Store
+
+This module keeps downloaded disclosure documents in a local,
+content-addressed store so that a filing is only ever transferred once.
+
+Layout (under download/.store):
+    blobs/<sha256[:2]>/<sha256>.zip      original zip archive as returned by document.xml
+    documents/<rcept_no>/<member>        extracted archive members
+    manifest.sqlite3                     rcept_no -> content hash, size and member list
+
+Every file is written to a temporary path first and moved into place with an
+atomic rename, so concurrent workers never observe half-written documents.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+from api.dart_api import download_document
+from utils.file_utils import COPY_CHUNK_SIZE, DisclosureArchive
+from utils.path_utils import ensure_download_directory
+
+
+class DocumentStore:
+    """
+    Local store of disclosure documents keyed by rcept_no.
+
+    Example:
+        store = DocumentStore()
+        entry = store.fetch('20250801000123')
+        xml_paths = store.member_paths(entry['rcept_no'], extensions=['.xml'])
+    """
+
+    def __init__(self, root=None):
+        """
+        Args:
+            root: Store directory (default: download/.store)
+        """
+        self.root = Path(root) if root else ensure_download_directory() / '.store'
+        self.blob_dir = self.root / 'blobs'
+        self.document_dir = self.root / 'documents'
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.document_dir.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            ' rcept_no TEXT PRIMARY KEY, sha256 TEXT NOT NULL, size INTEGER NOT NULL,'
+            ' members TEXT NOT NULL, stored_at REAL NOT NULL)'
+        )
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.root / 'manifest.sqlite3'), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def blob_path(self, sha256):
+        """Path of the original archive with the given content hash"""
+        return self.blob_dir / sha256[:2] / f'{sha256}.zip'
+
+    def members_dir(self, rcept_no):
+        """Directory holding the extracted members of a document"""
+        return self.document_dir / str(rcept_no)
+
+    def get(self, rcept_no):
+        """
+        Look up a stored document
+
+        Args:
+            rcept_no: Receipt number of the disclosure
+
+        Returns:
+            dict: Manifest entry (rcept_no, sha256, size, members, archive_path, members_dir) or None
+        """
+        row = self._connection().execute(
+            'SELECT rcept_no, sha256, size, members, stored_at FROM documents WHERE rcept_no = ?', (str(rcept_no),)
+        ).fetchone()
+        if row is None:
+            return None
+
+        entry = {
+            'rcept_no': row[0],
+            'sha256': row[1],
+            'size': row[2],
+            'members': json.loads(row[3]),
+            'stored_at': row[4],
+            'archive_path': str(self.blob_path(row[1])),
+            'members_dir': str(self.members_dir(row[0])),
+        }
+        # A manifest row without its archive (e.g. removed by hand) counts as missing
+        if not Path(entry['archive_path']).exists():
+            return None
+        return entry
+
+    def has(self, rcept_no):
+        """Check whether a document is available locally"""
+        return self.get(rcept_no) is not None
+
+    def put(self, rcept_no, archive_bytes, extract=True):
+        """
+        Store a document archive and its extracted members
+
+        Args:
+            rcept_no: Receipt number of the disclosure
+            archive_bytes: Zip archive as returned by the document.xml endpoint
+            extract: Whether to extract the members now (otherwise on first member_paths call)
+
+        Returns:
+            dict: Manifest entry of the stored document
+        """
+        return self.put_chunks(rcept_no, [archive_bytes], extract=extract)
+
+    def put_chunks(self, rcept_no, chunks, extract=True):
+        """
+        Store a document archive given as consecutive byte blocks
+
+        The blocks are written to a temporary blob and hashed as they arrive,
+        so large archives are never held in memory as a whole.
+
+        Args:
+            rcept_no: Receipt number of the disclosure
+            chunks: Iterable of bytes making up the zip archive
+            extract: Whether to extract the members now (otherwise on first member_paths call)
+
+        Returns:
+            dict: Manifest entry of the stored document
+
+        Raises:
+            zipfile.BadZipFile: If the data is not a zip archive (nothing is stored)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.blob_dir, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+
+            with zipfile.ZipFile(tmp_path) as archive:
+                members = [info.filename for info in archive.infolist() if not info.is_dir()]
+
+            sha256 = digest.hexdigest()
+            blob_path = self.blob_path(sha256)
+            if not blob_path.exists():
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, blob_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._connection().execute(
+            'INSERT OR REPLACE INTO documents (rcept_no, sha256, size, members, stored_at) VALUES (?, ?, ?, ?, ?)',
+            (str(rcept_no), sha256, size, json.dumps(members, ensure_ascii=False), time.time())
+        )
+
+        entry = self.get(rcept_no)
+        if extract:
+            self._ensure_extracted(entry)
+        return entry
+
+    def _ensure_extracted(self, entry):
+        """Extract the members of a stored document unless that already happened"""
+        members_dir = Path(entry['members_dir'])
+        if members_dir.is_dir():
+            return
+
+        # Extract next to the final location, then rename the whole directory into place
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.document_dir, prefix=f".tmp-{entry['rcept_no']}-"))
+        try:
+            with zipfile.ZipFile(entry['archive_path']) as archive:
+                archive.extractall(path=tmp_dir)
+            os.rename(tmp_dir, members_dir)
+        except OSError:
+            # Another worker extracted the same document first
+            if not members_dir.is_dir():
+                raise
+        finally:
+            if tmp_dir.exists():
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def put_file(self, rcept_no, zip_path):
+        """Store a document from a zip file on disk"""
+        with open(zip_path, 'rb') as f:
+            return self.put_chunks(rcept_no, iter(lambda: f.read(COPY_CHUNK_SIZE), b''))
+
+    def fetch(self, rcept_no, downloader=download_document):
+        """
+        Return a stored document, downloading it only if it is not in the store yet
+
+        Args:
+            rcept_no: Receipt number of the disclosure
+            downloader: Function with the signature of dart_api.download_document
+
+        Returns:
+            dict: Manifest entry or None if the download failed
+        """
+        entry = self.get(rcept_no)
+        if entry is not None:
+            self._ensure_extracted(entry)
+            return entry
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=f'.download-{rcept_no}-', suffix='.zip')
+        os.close(fd)
+        try:
+            if not downloader(rcept_no=rcept_no, save_path=tmp_path):
+                return None
+            return self.put_file(rcept_no, tmp_path)
+        except zipfile.BadZipFile:
+            print(f"Error: The downloaded document is not a valid ZIP file: {rcept_no}")
+            return None
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def member_paths(self, rcept_no, extensions=None):
+        """
+        List the extracted member files of a stored document
+
+        Args:
+            rcept_no: Receipt number of the disclosure
+            extensions: Optional list of extensions to filter by (e.g. ['.xml'])
+
+        Returns:
+            list: Absolute paths of the matching members
+        """
+        entry = self.get(rcept_no)
+        if entry is None:
+            return []
+        self._ensure_extracted(entry)
+        members_dir = Path(entry['members_dir'])
+        return [
+            str(members_dir / name) for name in entry['members']
+            if not extensions or any(name.lower().endswith(ext.lower()) for ext in extensions)
+        ]
+
+    def open_archive(self, rcept_no):
+        """
+        Open the original archive of a stored document for lazy member reads
+
+        Returns:
+            DisclosureArchive: Archive to be closed by the caller, or None if the document is not stored
+        """
+        entry = self.get(rcept_no)
+        if entry is None:
+            return None
+        return DisclosureArchive.from_path(entry['archive_path'])
+
+    def copy_archive(self, rcept_no, save_path):
+        """
+        Copy the original archive of a stored document to save_path
+
+        Returns:
+            str: save_path, or None if the document is not stored
+        """
+        entry = self.get(rcept_no)
+        if entry is None:
+            return None
+        save_path = Path(save_path)
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(entry['archive_path'], save_path)
+        return str(save_path)
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_document_store():
+    """
+    Return the process-wide DocumentStore, creating it on first use
+
+    Returns:
+        DocumentStore: Shared store instance
+    """
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = DocumentStore()
+    return _default_store
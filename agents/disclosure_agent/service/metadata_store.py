@@ -0,0 +1,304 @@
+"""
+Disclosure Metadata Store
+
+This module keeps a local, indexed copy of the list.json rows (공시검색
+결과) so that range and keyword queries over a company's disclosures are
+answered from SQLite instead of OpenDART.
+
+Rows are deduplicated on rcept_no. For every (corp_code, pblntf_ty) the
+store remembers the contiguous date range already synced; its end is the
+high-water mark. A sync only asks OpenDART for the dates outside that
+range, so a daily run fetches a single day instead of the whole history.
+
+Example:
+    store = get_metadata_store()
+    store.sync('00126380', '20240101', pblntf_ty='I')
+    store.query('00126380', '20240101', '20241231', keyword='공급계약')
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from api.dart_api import get_disclosure_page
+from service.window_planner import AdaptiveWindowPlanner
+from utils.date_utils import get_current_date
+from utils.path_utils import ensure_cache_directory
+
+DISCLOSURE_COLUMNS = ('rcept_no', 'corp_code', 'corp_name', 'corp_cls', 'stock_code',
+                      'report_nm', 'flr_nm', 'rcept_dt', 'rm', 'pblntf_ty')
+
+# Rows are written to SQLite in batches of this size while a sync is running
+SYNC_BATCH_SIZE = 500
+
+
+def _shift_date(date_str, days):
+    return (datetime.strptime(str(date_str), '%Y%m%d') + timedelta(days=days)).strftime('%Y%m%d')
+
+
+class DisclosureMetadataStore:
+    """
+    SQLite-backed store of disclosure list rows with incremental sync.
+
+    Only closed days (before today) count towards the high-water mark, since
+    filings can still appear on the current day; today is fetched again on
+    every sync and the duplicates are merged on rcept_no.
+    """
+
+    def __init__(self, db_path=None, page_fetcher=get_disclosure_page):
+        """
+        Args:
+            db_path: SQLite database path (default: download/.cache/disclosure_metadata.sqlite3)
+            page_fetcher: Function with the signature of dart_api.get_disclosure_page
+        """
+        self.db_path = db_path or ensure_cache_directory() / 'disclosure_metadata.sqlite3'
+        self.page_fetcher = page_fetcher
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.executescript(
+            'CREATE TABLE IF NOT EXISTS disclosures ('
+            ' rcept_no TEXT PRIMARY KEY, corp_code TEXT NOT NULL, corp_name TEXT, corp_cls TEXT,'
+            ' stock_code TEXT, report_nm TEXT NOT NULL, flr_nm TEXT, rcept_dt TEXT NOT NULL, rm TEXT,'
+            ' pblntf_ty TEXT NOT NULL);'
+            'CREATE INDEX IF NOT EXISTS idx_disclosures_corp_code ON disclosures (corp_code, rcept_dt);'
+            'CREATE INDEX IF NOT EXISTS idx_disclosures_report_nm ON disclosures (report_nm);'
+            'CREATE INDEX IF NOT EXISTS idx_disclosures_pblntf_ty ON disclosures (pblntf_ty);'
+            'CREATE TABLE IF NOT EXISTS sync_state ('
+            ' corp_code TEXT NOT NULL, pblntf_ty TEXT NOT NULL, synced_from TEXT NOT NULL,'
+            ' synced_to TEXT NOT NULL, synced_at TEXT NOT NULL, PRIMARY KEY (corp_code, pblntf_ty));'
+        )
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def get_sync_state(self, corp_code, pblntf_ty=None):
+        """
+        Date range already synced for a company and disclosure type
+
+        Returns:
+            dict: synced_from, synced_to (the high-water mark) and synced_at, or None if never synced
+        """
+        row = self._connection().execute(
+            'SELECT synced_from, synced_to, synced_at FROM sync_state WHERE corp_code = ? AND pblntf_ty = ?',
+            (corp_code or '', pblntf_ty or '')
+        ).fetchone()
+        return dict(row) if row else None
+
+    def upsert(self, disclosures, pblntf_ty=None):
+        """
+        Insert or update list.json rows, deduplicated on rcept_no
+
+        A row fetched without a disclosure type keeps the type it was stored
+        with by an earlier, typed sync.
+
+        Args:
+            disclosures: Iterable of list.json rows
+            pblntf_ty: Disclosure type the rows were queried with (list.json does not return it)
+
+        Returns:
+            int: Number of rows written
+        """
+        rows = [
+            tuple(str(disclosure.get(column) or '') for column in DISCLOSURE_COLUMNS[:-1]) + (pblntf_ty or '',)
+            for disclosure in disclosures
+            if disclosure.get('rcept_no')
+        ]
+        if not rows:
+            return 0
+
+        updates = ', '.join(f'{column} = excluded.{column}' for column in DISCLOSURE_COLUMNS[1:-1])
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f'INSERT INTO disclosures ({", ".join(DISCLOSURE_COLUMNS)}) '
+                f'VALUES ({", ".join("?" * len(DISCLOSURE_COLUMNS))}) '
+                f'ON CONFLICT (rcept_no) DO UPDATE SET {updates}, '
+                f"pblntf_ty = CASE WHEN excluded.pblntf_ty != '' THEN excluded.pblntf_ty ELSE pblntf_ty END",
+                rows
+            )
+        return len(rows)
+
+    def plan_sync(self, corp_code, start_date, end_date=None, pblntf_ty=None):
+        """
+        Date windows that still have to be fetched from OpenDART
+
+        The synced range is kept contiguous: a request before it is fetched up
+        to its start, a request after it from the day after the high-water mark.
+
+        Args:
+            corp_code: Company code
+            start_date: Start date in YYYYMMDD format
+            end_date: End date in YYYYMMDD format (default and maximum: today)
+            pblntf_ty: 공시 유형
+
+        Returns:
+            list: (start_date, end_date) windows in date order
+        """
+        today = get_current_date()
+        start_date = str(start_date)
+        end_date = min(str(end_date or today), today)
+        if start_date > end_date:
+            return []
+
+        state = self.get_sync_state(corp_code, pblntf_ty)
+        if state is None:
+            return [(start_date, end_date)]
+
+        windows = []
+        if start_date < state['synced_from']:
+            windows.append((start_date, _shift_date(state['synced_from'], -1)))
+        resume_date = _shift_date(state['synced_to'], 1)
+        if end_date >= resume_date:
+            windows.append((resume_date, end_date))
+        return windows
+
+    def sync(self, corp_code, start_date, end_date=None, pblntf_ty=None, page_count=100):
+        """
+        Fetch the disclosures the store does not have yet for a date range
+
+        Args:
+            corp_code: Company code
+            start_date: Start date in YYYYMMDD format
+            end_date: End date in YYYYMMDD format (default: today)
+            pblntf_ty: 공시 유형
+            page_count: Number of results per list.json page (default: 100)
+
+        Returns:
+            dict: windows (fetched date windows), fetched (rows received), requests (list.json calls)
+
+        Raises:
+            DartAPIError: If a window could not be fetched; the high-water mark is not advanced
+        """
+        today = get_current_date()
+        start_date = str(start_date)
+        end_date = min(str(end_date or today), today)
+        windows = self.plan_sync(corp_code, start_date, end_date, pblntf_ty)
+
+        planner = AdaptiveWindowPlanner(page_count=page_count, page_fetcher=self.page_fetcher)
+        fetched = 0
+        for window_start, window_end in windows:
+            batch = []
+            for disclosure in planner.iter_disclosures(corp_code, window_start, window_end, pblntf_ty=pblntf_ty):
+                batch.append(disclosure)
+                if len(batch) >= SYNC_BATCH_SIZE:
+                    fetched += self.upsert(batch, pblntf_ty)
+                    batch = []
+            fetched += self.upsert(batch, pblntf_ty)
+
+        # Today stays open, so the high-water mark stops at the last closed day
+        closed_end = min(end_date, _shift_date(today, -1))
+        state = self.get_sync_state(corp_code, pblntf_ty)
+        if state is not None:
+            synced_from = min(start_date, state['synced_from'])
+            synced_to = max(closed_end, state['synced_to'])
+        else:
+            synced_from, synced_to = start_date, closed_end
+
+        if synced_from <= synced_to:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO sync_state (corp_code, pblntf_ty, synced_from, synced_to, synced_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (corp_code or '', pblntf_ty or '', synced_from, synced_to,
+                     datetime.now().strftime('%Y%m%d%H%M%S'))
+                )
+
+        print(f" - Metadata sync {corp_code} ({pblntf_ty or 'all'}): windows {windows or 'none'}, "
+              f"rows fetched: {fetched}, API requests: {planner.stats['requests']}")
+        return {'windows': windows, 'fetched': fetched, 'requests': planner.stats['requests']}
+
+    def query(self, corp_code=None, start_date=None, end_date=None, keyword=None, pblntf_ty=None, limit=None):
+        """
+        Query stored disclosures, newest first
+
+        Args:
+            corp_code: Company code (optional)
+            start_date: Start date in YYYYMMDD format (optional)
+            end_date: End date in YYYYMMDD format (optional)
+            keyword: Case-insensitive substring of report_nm (optional)
+            pblntf_ty: 공시 유형 (optional)
+            limit: Maximum number of rows (optional)
+
+        Returns:
+            list: Disclosure rows in list.json form
+        """
+        conditions, params = [], []
+        if corp_code:
+            conditions.append('corp_code = ?')
+            params.append(corp_code)
+        if start_date:
+            conditions.append('rcept_dt >= ?')
+            params.append(str(start_date))
+        if end_date:
+            conditions.append('rcept_dt <= ?')
+            params.append(str(end_date))
+        if pblntf_ty:
+            conditions.append('pblntf_ty = ?')
+            params.append(pblntf_ty)
+        if keyword:
+            conditions.append("report_nm LIKE ? ESCAPE '\\'")
+            escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params.append(f'%{escaped}%')
+
+        sql = 'SELECT * FROM disclosures'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY rcept_dt DESC, rcept_no DESC'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(int(limit))
+
+        return [self._to_record(row) for row in self._connection().execute(sql, params)]
+
+    def get_disclosures(self, corp_code, start_date, end_date=None, pblntf_ty=None, keyword=None):
+        """
+        Sync the missing dates from OpenDART, then answer the query locally
+
+        Args:
+            corp_code: Company code
+            start_date: Start date in YYYYMMDD format
+            end_date: End date in YYYYMMDD format (default: today)
+            pblntf_ty: 공시 유형
+            keyword: Case-insensitive substring of report_nm (optional)
+
+        Returns:
+            list: Disclosure rows in list.json form, newest first
+        """
+        self.sync(corp_code, start_date, end_date, pblntf_ty=pblntf_ty)
+        return self.query(corp_code, start_date, end_date, keyword=keyword, pblntf_ty=pblntf_ty)
+
+    def count(self):
+        """Number of stored disclosures"""
+        return self._connection().execute('SELECT COUNT(*) FROM disclosures').fetchone()[0]
+
+    @staticmethod
+    def _to_record(row):
+        # list.json rows carry no pblntf_ty; it is only kept for filtering
+        return {column: row[column] or '' for column in DISCLOSURE_COLUMNS[:-1]}
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_metadata_store():
+    """
+    Return the process-wide DisclosureMetadataStore, creating it on first use
+
+    Returns:
+        DisclosureMetadataStore: Shared store instance
+    """
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = DisclosureMetadataStore()
+    return _default_store
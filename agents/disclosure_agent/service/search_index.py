@@ -0,0 +1,452 @@
+"""
+Disclosure Search Index
+
+This module keeps a local full-text index over the disclosure XML files and
+the generated Markdown under the download directory, so filings that were
+already downloaded can be searched in milliseconds without calling OpenDART
+or the LLM again.
+
+Korean has no spaces between most morphemes ('공급계약을' vs '공급계약'), so
+Hangul and Hanja runs are indexed as overlapping character bigrams in a
+SQLite FTS5 table and every query term is matched as a phrase of bigrams.
+Latin words and numbers are indexed as whole (lower-cased) words.
+
+Example:
+    index = get_search_index()
+    index.update()
+    index.search('공급계약 애플', limit=5)
+"""
+
+import html
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from utils.path_utils import ensure_cache_directory, ensure_download_directory
+from utils.xml_utils import extract_document_info, iter_sections, iter_xml_text, read_xml_text, strip_tags
+
+# File types that are indexed, by suffix
+INDEXED_SUFFIXES = {'.xml': 'xml', '.md': 'markdown'}
+
+# Characters of context on each side of the first match in a snippet
+DEFAULT_SNIPPET_CHARS = 80
+
+# Markers placed around matched terms by highlight()
+HIGHLIGHT_MARKERS = ('**', '**')
+
+DOCUMENT_COLUMNS = ('path', 'kind', 'rcept_no', 'corp_code', 'corp_name', 'rcept_dt', 'report_nm')
+
+# Bumped whenever to_ngrams changes; older indexes are re-tokenized on open
+TOKENIZER_VERSION = 2
+
+# Hangul jamo, compatibility jamo and syllables, and CJK ideographs (Hanja)
+_CJK_RANGES = r'\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff'
+_CJK_PATTERN = rf'[{_CJK_RANGES}]'
+# Other words stop where Hangul/Hanja starts, so 'LG전자' and '10억원' split at the script boundary
+_TOKEN_PATTERN = re.compile(rf'{_CJK_PATTERN}+|[^\W_{_CJK_RANGES}]+')
+_CJK_RUN_PATTERN = re.compile(rf'{_CJK_PATTERN}+')
+_RCEPT_NO_PATTERN = re.compile(r'(?<!\d)(\d{14})(?!\d)')
+
+
+def to_ngrams(text):
+    """
+    Tokenize text for the index
+
+    Runs of Hangul/Hanja become overlapping character bigrams ('공급계약' ->
+    '공급 급계 계약'); a single character stays a unigram. Other words are lower-cased
+    and end at the next Hangul/Hanja character ('LG전자' -> 'lg 전자').
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        list: Tokens in text order
+    """
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(text):
+        word = match.group(0)
+        if _CJK_RUN_PATTERN.fullmatch(word):
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word.lower())
+    return tokens
+
+
+def parse_query(query):
+    """
+    Split a search query into terms
+
+    Args:
+        query: Space separated search terms (all terms must match)
+
+    Returns:
+        list: Terms that produce at least one index token
+    """
+    return [term for term in (query or '').split() if to_ngrams(term)]
+
+
+def build_match_expression(terms):
+    """
+    Build an FTS5 MATCH expression that requires every term
+
+    Args:
+        terms: Terms from parse_query
+
+    Returns:
+        str: MATCH expression, each term a quoted phrase of its tokens
+    """
+    phrases = []
+    for term in terms:
+        phrase = ' '.join(to_ngrams(term)).replace('"', '""')
+        phrases.append(f'"{phrase}"')
+    return ' AND '.join(phrases)
+
+
+def highlight(text, terms, markers=HIGHLIGHT_MARKERS):
+    """
+    Wrap every occurrence of the search terms in markers
+
+    Args:
+        text: Text to mark
+        terms: Terms from parse_query
+        markers: (opening, closing) marker strings
+
+    Returns:
+        str: Text with matched terms marked
+    """
+    if not terms:
+        return text
+    pattern = re.compile('|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.I)
+    return pattern.sub(lambda match: f'{markers[0]}{match.group(0)}{markers[1]}', text)
+
+
+def make_snippet(text, terms, width=DEFAULT_SNIPPET_CHARS, markers=HIGHLIGHT_MARKERS):
+    """
+    Cut a highlighted excerpt around the first matched term
+
+    Args:
+        text: Full document text
+        terms: Terms from parse_query
+        width: Characters of context on each side of the match
+        markers: (opening, closing) marker strings
+
+    Returns:
+        str: Excerpt with '…' where text was cut off
+    """
+    positions = [match.start() for match in (re.search(re.escape(term), text, re.I) for term in terms) if match]
+    center = min(positions) if positions else 0
+    start = max(0, center - width)
+    end = min(len(text), center + width * 2)
+    excerpt = ' '.join(text[start:end].split())
+    return ('…' if start > 0 else '') + highlight(excerpt, terms, markers) + ('…' if end < len(text) else '')
+
+
+def extract_text(path):
+    """
+    Read the searchable text and header metadata of an XML or Markdown file
+
+    XML is read section by section with its tags removed, so large reports
+    are never held in memory as markup.
+
+    Args:
+        path: XML or Markdown file path
+
+    Returns:
+        tuple: (text, info) where info holds document_name, company_name and corp_code
+    """
+    path = Path(path)
+    if INDEXED_SUFFIXES.get(path.suffix.lower()) != 'xml':
+        return read_xml_text(path), {'document_name': '', 'company_name': '', 'corp_code': ''}
+
+    parts = []
+    info = None
+    for fragment in iter_sections(iter_xml_text(path)):
+        if info is None:
+            # The document header is at the start of the first fragment
+            info = extract_document_info(fragment)
+        text = html.unescape(strip_tags(fragment))
+        if text:
+            parts.append(text)
+    return ' '.join(parts), info or {'document_name': '', 'company_name': '', 'corp_code': ''}
+
+
+class DisclosureSearchIndex:
+    """
+    SQLite FTS5 index over downloaded disclosure files.
+
+    Files are re-indexed only when their size or modification time changes,
+    and entries for deleted files are dropped, so update() on an unchanged
+    download directory costs one stat per file.
+
+    Example:
+        index = DisclosureSearchIndex()
+        index.update()
+        for hit in index.search('공급계약 애플', corp_code='00126380', limit=3):
+            print(hit['rcept_no'], hit['report_nm'], hit['snippet'])
+    """
+
+    def __init__(self, db_path=None, root=None):
+        """
+        Args:
+            db_path: SQLite database path (default: download/.cache/search_index.sqlite3)
+            root: Directory scanned by update() (default: the download directory)
+        """
+        self.db_path = db_path or ensure_cache_directory() / 'search_index.sqlite3'
+        self.root = Path(root) if root else ensure_download_directory()
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.executescript(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            ' id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE, kind TEXT NOT NULL, rcept_no TEXT,'
+            ' corp_code TEXT, corp_name TEXT, rcept_dt TEXT, report_nm TEXT,'
+            ' size INTEGER NOT NULL, mtime REAL NOT NULL, body TEXT NOT NULL);'
+            'CREATE INDEX IF NOT EXISTS idx_documents_rcept_no ON documents (rcept_no);'
+            'CREATE INDEX IF NOT EXISTS idx_documents_corp_code ON documents (corp_code, rcept_dt);'
+            'CREATE INDEX IF NOT EXISTS idx_documents_rcept_dt ON documents (rcept_dt);'
+            'CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(tokens);'
+        )
+        if conn.execute('PRAGMA user_version').fetchone()[0] < TOKENIZER_VERSION:
+            self.rebuild()
+
+    def rebuild(self):
+        """
+        Re-tokenize every indexed document from its stored text
+
+        Used when the tokenizer changes; files are not read again, so metadata
+        set from the disclosure list is kept.
+
+        Returns:
+            int: Number of documents re-tokenized
+        """
+        conn = self._connection()
+        with self._write_lock, conn:
+            conn.execute('DELETE FROM documents_fts')
+            # One body at a time; the stored text of all filings does not fit in memory
+            ids = [row['id'] for row in conn.execute('SELECT id FROM documents')]
+            for document_id in ids:
+                row = conn.execute('SELECT corp_name, report_nm, body FROM documents WHERE id = ?',
+                                   (document_id,)).fetchone()
+                tokens = to_ngrams(f"{row['report_nm'] or ''} {row['corp_name'] or ''} {row['body']}")
+                conn.execute('INSERT INTO documents_fts (rowid, tokens) VALUES (?, ?)',
+                             (document_id, ' '.join(tokens)))
+            conn.execute(f'PRAGMA user_version = {TOKENIZER_VERSION}')
+        return len(ids)
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def index_file(self, path, metadata=None, force=False):
+        """
+        Add or refresh a single XML or Markdown file
+
+        Metadata comes from the file itself (receipt number in the file or
+        directory name, filer and report name from the XML header); values in
+        metadata override it, e.g. a row of the disclosure list.
+
+        Args:
+            path: File path
+            metadata: Optional dict with rcept_no, corp_code, corp_name, rcept_dt, report_nm
+            force: Re-index even if the file is unchanged
+
+        Returns:
+            bool: True if the file was (re-)indexed, False if it was unchanged
+        """
+        path = Path(path).resolve()
+        kind = INDEXED_SUFFIXES.get(path.suffix.lower())
+        if kind is None:
+            raise ValueError(f"Unsupported file type for indexing: {path}")
+
+        stat = path.stat()
+        conn = self._connection()
+        row = conn.execute('SELECT id, size, mtime FROM documents WHERE path = ?', (str(path),)).fetchone()
+        if row and not force and row['size'] == stat.st_size and row['mtime'] == stat.st_mtime:
+            if metadata:
+                self._update_metadata(row['id'], metadata)
+            return False
+
+        text, info = extract_text(path)
+        rcept_no = _RCEPT_NO_PATTERN.search(path.name) or _RCEPT_NO_PATTERN.search(path.parent.name)
+        values = {
+            'rcept_no': rcept_no.group(1) if rcept_no else '',
+            'corp_code': info['corp_code'],
+            'corp_name': info['company_name'],
+            'report_nm': info['document_name'],
+        }
+        values['rcept_dt'] = values['rcept_no'][:8]
+        if kind == 'markdown' and values['rcept_no']:
+            # Generated Markdown has no header attributes; borrow them from the filing's XML
+            source = conn.execute(
+                "SELECT corp_code, corp_name, report_nm FROM documents WHERE rcept_no = ? AND kind = 'xml' LIMIT 1",
+                (values['rcept_no'],)
+            ).fetchone()
+            if source:
+                values.update({key: source[key] for key in source.keys() if source[key] and not values[key]})
+        values.update({key: value for key, value in (metadata or {}).items() if key in values and value})
+
+        with self._write_lock, conn:
+            if row:
+                conn.execute('DELETE FROM documents_fts WHERE rowid = ?', (row['id'],))
+                conn.execute('DELETE FROM documents WHERE id = ?', (row['id'],))
+            cursor = conn.execute(
+                'INSERT INTO documents (path, kind, rcept_no, corp_code, corp_name, rcept_dt, report_nm, size, mtime, body)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (str(path), kind, values['rcept_no'], values['corp_code'], values['corp_name'], values['rcept_dt'],
+                 values['report_nm'], stat.st_size, stat.st_mtime, text)
+            )
+            conn.execute('INSERT INTO documents_fts (rowid, tokens) VALUES (?, ?)',
+                         (cursor.lastrowid, ' '.join(to_ngrams(f"{values['report_nm']} {values['corp_name']} {text}"))))
+        return True
+
+    def _update_metadata(self, document_id, metadata):
+        columns = [column for column in ('rcept_no', 'corp_code', 'corp_name', 'rcept_dt', 'report_nm')
+                   if metadata.get(column)]
+        if not columns:
+            return
+        conn = self._connection()
+        with self._write_lock, conn:
+            conn.execute(
+                f"UPDATE documents SET {', '.join(f'{column} = ?' for column in columns)} WHERE id = ?",
+                [metadata[column] for column in columns] + [document_id]
+            )
+
+    def remove(self, path):
+        """Drop a file from the index"""
+        conn = self._connection()
+        with self._write_lock, conn:
+            row = conn.execute('SELECT id FROM documents WHERE path = ?', (str(Path(path).resolve()),)).fetchone()
+            if row:
+                conn.execute('DELETE FROM documents_fts WHERE rowid = ?', (row['id'],))
+                conn.execute('DELETE FROM documents WHERE id = ?', (row['id'],))
+
+    def update(self, root=None):
+        """
+        Incrementally index every XML and Markdown file under a directory
+
+        Hidden directories (the caches under download/.cache and .store) are skipped.
+
+        Args:
+            root: Directory to scan (default: the index root)
+
+        Returns:
+            dict: Counts of indexed, unchanged, removed and failed files
+        """
+        root = Path(root).resolve() if root else self.root.resolve()
+        stats = {'indexed': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+        seen = set()
+
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+            # XML first, so Markdown generated from it can borrow its metadata
+            for filename in sorted(filenames, key=lambda name: (not name.lower().endswith('.xml'), name)):
+                if Path(filename).suffix.lower() not in INDEXED_SUFFIXES:
+                    continue
+                path = Path(directory) / filename
+                seen.add(str(path))
+                try:
+                    stats['indexed' if self.index_file(path) else 'unchanged'] += 1
+                except Exception as e:
+                    print(f"Error indexing {path}: {str(e)}")
+                    stats['failed'] += 1
+
+        # Files deleted since the last update
+        prefix = str(root) + os.sep
+        for row in self._connection().execute('SELECT path FROM documents').fetchall():
+            if row['path'].startswith(prefix) and row['path'] not in seen:
+                self.remove(row['path'])
+                stats['removed'] += 1
+
+        return stats
+
+    def search(self, query, corp_code=None, start_date=None, end_date=None, kind=None, limit=10,
+               snippet_chars=DEFAULT_SNIPPET_CHARS):
+        """
+        Find the filings that contain every query term, best matches first
+
+        Args:
+            query: Space separated search terms, e.g. '공급계약 애플'
+            corp_code: Restrict to one company
+            start_date: Earliest receipt date (YYYYMMDD)
+            end_date: Latest receipt date (YYYYMMDD)
+            kind: 'xml' or 'markdown' to search only one file type
+            limit: Maximum number of filings returned (top-k)
+            snippet_chars: Characters of context around the first match
+
+        Returns:
+            list: One dict per filing with path, kind, rcept_no, corp_code, corp_name,
+                rcept_dt, report_nm, score (lower is better) and a highlighted snippet
+        """
+        terms = parse_query(query)
+        if not terms:
+            return []
+
+        conditions = ['documents_fts MATCH ?']
+        params = [build_match_expression(terms)]
+        for column, operator, value in (('corp_code', '=', corp_code), ('rcept_dt', '>=', start_date),
+                                        ('rcept_dt', '<=', end_date), ('kind', '=', kind)):
+            if value:
+                conditions.append(f'd.{column} {operator} ?')
+                params.append(value)
+
+        # The XML and Markdown of one filing may both match, so fetch extra rows and keep the best per filing
+        rows = self._connection().execute(
+            'SELECT d.*, bm25(documents_fts) AS score FROM documents_fts'
+            ' JOIN documents d ON d.id = documents_fts.rowid'
+            f' WHERE {" AND ".join(conditions)} ORDER BY score LIMIT ?',
+            params + [limit * 4]
+        ).fetchall()
+
+        results = {}
+        for row in rows:
+            key = row['rcept_no'] or row['path']
+            if key in results:
+                continue
+            hit = {column: row[column] or '' for column in DOCUMENT_COLUMNS}
+            hit['score'] = row['score']
+            hit['snippet'] = make_snippet(row['body'], terms, snippet_chars)
+            results[key] = hit
+            if len(results) >= limit:
+                break
+        return list(results.values())
+
+    def get_text(self, path):
+        """Indexed plain text of a file, or None if it is not indexed"""
+        row = self._connection().execute(
+            'SELECT body FROM documents WHERE path = ?', (str(Path(path).resolve()),)
+        ).fetchone()
+        return row['body'] if row else None
+
+    def count(self):
+        """Number of indexed files"""
+        return self._connection().execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_search_index():
+    """
+    Return the process-wide DisclosureSearchIndex, creating it on first use
+
+    Returns:
+        DisclosureSearchIndex: Shared index instance
+    """
+    global _default_index
+    if _default_index is None:
+        with _default_index_lock:
+            if _default_index is None:
+                _default_index = DisclosureSearchIndex()
+    return _default_index
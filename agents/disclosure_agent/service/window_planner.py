@@ -0,0 +1,162 @@
+"""
+Adaptive Date Window Planner
+
+This module plans list.json requests for a date range. Instead of fixed
+7-day windows it first asks for the widest window OpenDART allows, reads
+total_count from the first page and only bisects windows whose results do
+not fit into the page budget. Windows that turned out to be empty are
+remembered on disk and never requested again.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from api.dart_api import get_disclosure_page
+from utils.date_utils import get_current_date, split_date_range
+from utils.path_utils import ensure_cache_directory
+
+# list.json limits searches without corp_code to a three month range
+MAX_WINDOW_DAYS_WITHOUT_CORP_CODE = 90
+
+# A window is bisected when it needs more than this many list.json pages
+DEFAULT_MAX_PAGES_PER_WINDOW = 2
+
+
+class EmptyWindowCache:
+    """
+    Persisted set of date windows known to contain no disclosures.
+
+    Only closed windows (ending before today) are stored, since filings can
+    still appear in a window that includes today.
+    """
+
+    def __init__(self, db_path=None):
+        """
+        Args:
+            db_path: SQLite database path (default: download/.cache/empty_windows.sqlite3)
+        """
+        self.db_path = db_path or ensure_cache_directory() / 'empty_windows.sqlite3'
+        self._local = threading.local()
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS empty_windows ('
+            ' corp_code TEXT NOT NULL, pblntf_ty TEXT NOT NULL, bgn_de TEXT NOT NULL, end_de TEXT NOT NULL,'
+            ' PRIMARY KEY (corp_code, pblntf_ty, bgn_de, end_de))'
+        )
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def is_empty(self, corp_code, pblntf_ty, start_date, end_date):
+        """Check whether the window lies inside a window already known to be empty"""
+        row = self._connection().execute(
+            'SELECT 1 FROM empty_windows WHERE corp_code = ? AND pblntf_ty = ? AND bgn_de <= ? AND end_de >= ? LIMIT 1',
+            (corp_code or '', pblntf_ty or '', str(start_date), str(end_date))
+        ).fetchone()
+        return row is not None
+
+    def add(self, corp_code, pblntf_ty, start_date, end_date):
+        """Remember an empty window if it is already closed"""
+        if str(end_date) >= get_current_date():
+            return
+        self._connection().execute(
+            'INSERT OR IGNORE INTO empty_windows (corp_code, pblntf_ty, bgn_de, end_de) VALUES (?, ?, ?, ?)',
+            (corp_code or '', pblntf_ty or '', str(start_date), str(end_date))
+        )
+
+
+def _bisect_window(start_date, end_date):
+    start_dt = datetime.strptime(str(start_date), '%Y%m%d')
+    end_dt = datetime.strptime(str(end_date), '%Y%m%d')
+    mid_dt = start_dt + (end_dt - start_dt) / 2
+    left = (start_dt.strftime('%Y%m%d'), mid_dt.strftime('%Y%m%d'))
+    right = ((mid_dt + timedelta(days=1)).strftime('%Y%m%d'), end_dt.strftime('%Y%m%d'))
+    return left, right
+
+
+class AdaptiveWindowPlanner:
+    """
+    Fetch disclosures over a date range with as few list.json requests as possible.
+
+    Example:
+        planner = AdaptiveWindowPlanner()
+        disclosures = list(planner.iter_disclosures('00126380', '20240101', '20241231', pblntf_ty='I'))
+        print(planner.stats)
+    """
+
+    def __init__(self, page_count=100, max_pages=DEFAULT_MAX_PAGES_PER_WINDOW, empty_cache=None,
+                 page_fetcher=get_disclosure_page):
+        """
+        Args:
+            page_count: Number of results per list.json page (max 100)
+            max_pages: Windows needing more pages than this are bisected
+            empty_cache: EmptyWindowCache to use (default: the on-disk cache)
+            page_fetcher: Function with the signature of dart_api.get_disclosure_page
+        """
+        self.page_count = page_count
+        self.max_pages = max(1, max_pages)
+        self.empty_cache = empty_cache or EmptyWindowCache()
+        self.page_fetcher = page_fetcher
+        self.stats = {'requests': 0, 'windows_skipped': 0, 'windows_bisected': 0}
+
+    def initial_windows(self, corp_code, start_date, end_date):
+        """Widest windows OpenDART accepts for the given query"""
+        if corp_code:
+            return [(str(start_date), str(end_date))]
+        return split_date_range(start_date, end_date, days=MAX_WINDOW_DAYS_WITHOUT_CORP_CODE)
+
+    def _fetch_page(self, corp_code, start_date, end_date, page_no, pblntf_ty):
+        self.stats['requests'] += 1
+        return self.page_fetcher(corp_code, start_date, end_date, page_no=page_no,
+                                 page_count=self.page_count, pblntf_ty=pblntf_ty)
+
+    def iter_disclosures(self, corp_code, start_date, end_date, pblntf_ty=None):
+        """
+        Yield every disclosure in the range, window by window in date order
+
+        Args:
+            corp_code: Company code (optional, None searches all companies)
+            start_date: Start date in YYYYMMDD format
+            end_date: End date in YYYYMMDD format
+            pblntf_ty: 공시 유형
+
+        Yields:
+            dict: One disclosure document at a time
+
+        Raises:
+            DartAPIError: If a window could not be fetched
+        """
+        # Depth-first over the windows; the stack is kept so the earliest window is processed first
+        stack = list(reversed(self.initial_windows(corp_code, start_date, end_date)))
+
+        while stack:
+            window_start, window_end = stack.pop()
+
+            if self.empty_cache.is_empty(corp_code, pblntf_ty, window_start, window_end):
+                self.stats['windows_skipped'] += 1
+                continue
+
+            # Errors propagate: transient failures were already retried by the client and a
+            # skipped window would silently leave a gap in the results
+            first_page = self._fetch_page(corp_code, window_start, window_end, 1, pblntf_ty)
+
+            total_page = int(first_page.get('total_page') or 0)
+            if int(first_page.get('total_count') or 0) == 0:
+                self.empty_cache.add(corp_code, pblntf_ty, window_start, window_end)
+                continue
+
+            # Too many results for this window: split it and try each half on its own
+            if total_page > self.max_pages and window_start != window_end:
+                self.stats['windows_bisected'] += 1
+                left, right = _bisect_window(window_start, window_end)
+                stack.append(right)
+                stack.append(left)
+                continue
+
+            yield from first_page['list']
+            for page_no in range(2, total_page + 1):
+                yield from self._fetch_page(corp_code, window_start, window_end, page_no, pblntf_ty)['list']
@@ -0,0 +1,19 @@
+import pytest
+
+from service.corp_code_service import normalize_company_name
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('Incheon Airport', 'incheonairport'),
+    ('Principal Corp', 'principal'),
+    ('Incross', 'incross'),
+    ('Corporate Bank Inc.', 'corporatebank'),
+    ('Samsung Electronics Co., Ltd.', 'samsungelectronics'),
+    ('SK hynix Co.,Ltd', 'skhynix'),
+    ('Apple Inc', 'apple'),
+    ('삼성전자(주)', '삼성전자'),
+    ('주식회사 카카오', '카카오'),
+    ('㈜LG', 'lg'),
+])
+def test_normalize_company_name_strips_only_whole_legal_suffixes(name, expected):
+    assert normalize_company_name(name) == expected
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from api.dart_api import DartAPIError, DartQuotaExceededError
+from api.dart_async_api import AsyncDartClient
+
+DISCLOSURES = [{'rcept_no': f'2024010100000{i}', 'report_nm': f'보고서 {i}'} for i in range(5)]
+
+
+class RecordingRateLimiter:
+    """Stand-in for DartRateLimiter that counts requests and quota exhaustion"""
+
+    def __init__(self):
+        self.acquired = 0
+        self.exhausted = False
+
+    async def acquire_async(self):
+        self.acquired += 1
+
+    def mark_exhausted(self):
+        self.exhausted = True
+
+
+async def list_json(request):
+    """list.json stub: paginates DISCLOSURES, or answers with the status given as corp_code"""
+    corp_code = request.query.get('corp_code', '')
+    if corp_code in ('011', '013', '020'):
+        return web.json_response({'status': corp_code, 'message': f'stub status {corp_code}'})
+
+    page_no = int(request.query['page_no'])
+    page_count = int(request.query['page_count'])
+    total_page = -(-len(DISCLOSURES) // page_count)
+    return web.json_response({
+        'status': '000',
+        'page_no': page_no,
+        'page_count': page_count,
+        'total_count': len(DISCLOSURES),
+        'total_page': total_page,
+        'list': DISCLOSURES[(page_no - 1) * page_count:page_no * page_count],
+    })
+
+
+def run_against_stub(scenario):
+    """Start a local stub server, run scenario(client, limiter) and return its result"""
+    async def main():
+        app = web.Application()
+        app.router.add_get('/list.json', list_json)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        limiter = RecordingRateLimiter()
+        client = AsyncDartClient(api_key='test-key', base_url=f'http://127.0.0.1:{port}', max_concurrency=2,
+                                 rate_limiter=limiter, use_cache=False, use_retry=False)
+        try:
+            return await scenario(client, limiter)
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_disclosure_list_follows_every_page_in_order():
+    async def scenario(client, limiter):
+        disclosures = await client.get_disclosure_list('00126380', '20240101', '20240131', page_count=2)
+        return disclosures, limiter.acquired
+
+    disclosures, requests = run_against_stub(scenario)
+    assert disclosures == DISCLOSURES
+    assert requests == 3
+
+
+def test_status_013_returns_an_empty_page():
+    async def scenario(client, limiter):
+        return await client.get_disclosure_page('013', '20240101', '20240131')
+
+    page = run_against_stub(scenario)
+    assert page['list'] == []
+    assert page['total_count'] == 0
+
+
+def test_status_020_raises_without_exhausting_the_quota():
+    async def scenario(client, limiter):
+        with pytest.raises(DartAPIError) as excinfo:
+            await client.get_disclosure_page('020', '20240101', '20240131')
+        return excinfo.value, limiter.exhausted
+
+    error, exhausted = run_against_stub(scenario)
+    assert '[020]' in str(error)
+    assert not isinstance(error, DartQuotaExceededError)
+    assert not exhausted
+
+
+def test_status_011_marks_the_quota_exhausted():
+    async def scenario(client, limiter):
+        with pytest.raises(DartQuotaExceededError):
+            await client.get_disclosure_page('011', '20240101', '20240131')
+        return limiter.exhausted
+
+    assert run_against_stub(scenario)
@@ -0,0 +1,43 @@
+import sqlite3
+
+from service.search_index import DisclosureSearchIndex, to_ngrams
+
+
+def test_to_ngrams_splits_latin_and_digits_from_hangul():
+    assert to_ngrams('LG전자의 공급') == ['lg', '전자', '자의', '공급']
+    assert to_ngrams('계약금액10억원') == ['계약', '약금', '금액', '10', '억원']
+    assert to_ngrams('2024년') == ['2024', '년']
+
+
+def test_to_ngrams_keeps_words_and_bigrams():
+    assert to_ngrams('Apple Inc. 공급계약') == ['apple', 'inc', '공급', '급계', '계약']
+    assert to_ngrams('_') == []
+
+
+def test_search_matches_terms_at_script_boundaries(tmp_path):
+    document = tmp_path / 'disclosure_20240101000001' / 'report.md'
+    document.parent.mkdir()
+    document.write_text('LG전자의 공급계약 계약금액10억원 (2024년)', encoding='utf-8')
+
+    index = DisclosureSearchIndex(db_path=tmp_path / 'index.sqlite3', root=tmp_path)
+    index.update()
+
+    for query in ('LG전자', '억원', '2024', '공급계약 LG'):
+        assert [hit['rcept_no'] for hit in index.search(query)] == ['20240101000001'], query
+
+
+def test_outdated_index_is_retokenized_on_open(tmp_path):
+    db_path = tmp_path / 'index.sqlite3'
+    document = tmp_path / 'report.md'
+    document.write_text('LG전자 공급계약', encoding='utf-8')
+    DisclosureSearchIndex(db_path=db_path, root=tmp_path).update()
+
+    # Simulate an index written by the previous tokenizer
+    conn = sqlite3.connect(str(db_path))
+    with conn:
+        conn.execute("UPDATE documents_fts SET tokens = 'lg전자 공급 급계 계약'")
+        conn.execute('PRAGMA user_version = 1')
+    conn.close()
+
+    index = DisclosureSearchIndex(db_path=db_path, root=tmp_path)
+    assert len(index.search('LG전자')) == 1
@@ -11,12 +11,21 @@ import json
 from pathlib import Path
 from config.api_config import SAMSUNG_CORP_CODE
 from api import dart_api
-from service import dart_service, analysis_service
-from utils import date_utils, display, csv_utils, file_utils
+from service import dart_service, analysis_service, corp_code_service, search_index, contract_extractor, metadata_store
+from utils import date_utils, display, csv_utils, file_utils, xml_utils
+from utils.path_utils import ensure_download_directory
 
-def search_and_download_disclosure(start_date, end_date, corp_code, filter_keyword='공급'):
+def search_and_download_disclosure(start_date, end_date, corp_code, filter_keyword='공급', in_memory=False,
+                                   export_csv=True):
     """
     Main function to demonstrate Samsung Electronics disclosure retrieval
+
+    With in_memory=True the disclosure archive is never written to the
+    download directory or extracted; the XML is read straight from the
+    in-memory archive and only the Markdown result is saved.
+
+    The fetched list is filtered in memory; with export_csv=True it is also
+    saved to CSV on a background thread, off the request's critical path.
     """
     try:
         print("==== Run DART Disclosure Tool ====\n")
@@ -27,14 +36,15 @@ def search_and_download_disclosure(start_date, end_date, corp_code, filter_keywo
             print("Please check your API key in api_config.py")
             return
 
+        # 로컬 메타데이터 저장소에 없는 날짜만 API로 가져오고 목록은 로컬에서 조회
         print(f"# 공시 리스트 가져오기 - 날짜: {start_date}~{end_date}")
-        disclosures = dart_service.get_disclosure_list_by_date_range(
+        disclosures = metadata_store.get_metadata_store().get_disclosures(
             corp_code=corp_code,
             start_date=start_date,
             end_date=end_date,
-            page_count=100,
             pblntf_ty='I'
         )
+        print(f"Total disclosures collected: {len(disclosures)}")
         print()
         
         # Display the results using the display module
@@ -42,21 +52,23 @@ def search_and_download_disclosure(start_date, end_date, corp_code, filter_keywo
         display.display_recent_disclosures(disclosures)
         print()
 
-        # Download the results using the csv module
-        current_time = datetime.now().strftime("%Y%m%d")
-        filename = f"disclosures_{current_time}_{start_date}_{end_date}"
-        disc_list_file_path = csv_utils.save_disclosures_to_csv(disclosures=disclosures, filename=filename)
+        # Save the results using the csv module (background side-output)
+        if export_csv:
+            current_time = datetime.now().strftime("%Y%m%d")
+            filename = f"disclosures_{current_time}_{start_date}_{end_date}"
+            csv_utils.save_disclosures_to_csv_in_background(disclosures=disclosures, filename=filename)
 
-        # Get filtered row 
+        # Get filtered rows and the latest row in one pass
         filter_column_name = 'report_nm'
         # filter_keyword = '공급'
-        filtered_disc=csv_utils.read_csv_filter_to_json(
-            file_path=disc_list_file_path,
+        filtered_disc = csv_utils.filter_disclosures(
+            disclosures=disclosures,
             column_name=filter_column_name,
             keyword=filter_keyword)
-        
-        # Get latest row
-        latest_disc = csv_utils.get_latest_by_rcept_dt(data=filtered_disc)
+        latest_disc = filtered_disc['latest']
+        if not latest_disc:
+            print(f"No disclosures matching '{filter_keyword}' between {start_date} and {end_date}")
+            return
 
         # Print JSON with nice formatting (indent=2)
         print(f"# 최신 공시 출력 - 날짜: {start_date}~{end_date}, 키워드: {filter_keyword} ")
@@ -67,6 +79,9 @@ def search_and_download_disclosure(start_date, end_date, corp_code, filter_keywo
         print(f"# 공시 번호")
         print(f" - rcept_no: {rcept_no}\n")
 
+        if in_memory:
+            return convert_disclosure_in_memory(rcept_no, disclosure=latest_disc)
+
         print(f"# 공시 다운로드 ")
         saved_path = dart_service.download_disclosure_document(rcept_no=rcept_no)
         print(f" - path: {saved_path}\n")
@@ -79,33 +94,134 @@ def search_and_download_disclosure(start_date, end_date, corp_code, filter_keywo
 
         print(f"# 공시 xml 파일을 markdown으로 변경")
         xml_path = xml_files[0]
-        markdown_content = analysis_service.convert_to_markdown({'raw_content': read_file_content(xml_path)['content']})
 
-        # 마크다운 파일 경로 생성 및 저장
-        markdown_path = xml_path.replace('.xml', '.md')
-        save_file_content(markdown_path, markdown_content)
+        # 변환 결과를 도착하는 대로 마크다운 파일에 이어 씀
+        markdown_path = str(analysis_service.markdown_output_path(xml_path))
+        for _ in analysis_service.stream_xml_to_markdown(xml_path):
+            pass
 
         print(f" - XML path: {xml_path}")
         print(f" - Markdown path: {markdown_path}\n")
+
+        # 다음 검색부터는 API/LLM 호출 없이 로컬 색인에서 찾을 수 있도록 등록
+        index_disclosure_files([xml_path, markdown_path], latest_disc)
         
-        print(f"✅ [Tool 1 Success] XML file downloaded at: {xml_path}")
-        return {
+        result = {
             "xml_path": xml_path,
             "markdown_path": markdown_path
         }
+
+        # 단일판매ㆍ공급계약체결 공시는 서식에서 주요 항목을 바로 추출 (LLM 호출 없음)
+        if '공급계약' in latest_disc.get('report_nm', ''):
+            contract = contract_extractor.extract_supply_contract(xml_path, use_llm=False)
+            if contract['source'] == 'form':
+                result["supply_contract"] = contract_extractor.to_json_record(contract)
+                print(f"# 공급계약 주요 항목")
+                print(json.dumps(result["supply_contract"], indent=2, ensure_ascii=False))
+                print()
+
+        print(f"✅ [Tool 1 Success] XML file downloaded at: {xml_path}")
+        return result
         
     except dart_api.DartAPIError as e:
         print(f'API Error: {e}')
     except Exception as e:
         print(f'Error: {e}')
 
+def convert_disclosure_in_memory(rcept_no, disclosure=None):
+    """
+    공시 원문 압축 파일을 디스크에 풀지 않고 메모리에서 XML을 읽어 markdown으로 변환합니다.
+
+    disclosure(공시 목록의 행)를 주면 회사 코드와 보고서명을 검색 색인에 함께 등록합니다.
+    이 경로에는 메타데이터를 빌려 올 XML 파일이 색인에 없기 때문입니다.
+    """
+    print(f"# 공시 다운로드 (in-memory)")
+    with dart_service.open_disclosure_document(rcept_no) as archive:
+        xml_name = archive.namelist(extensions=['.xml'])[0]
+        print(f" - member: {xml_name}\n")
+
+        # 압축 파일 멤버를 조금씩 읽으며 변환 (문서 전체를 문자열로 만들지 않음)
+        print(f"# 공시 xml 파일을 markdown으로 변경")
+        markdown_path = str(ensure_download_directory() / f"disclosure_{rcept_no}" / (Path(xml_name).stem + '.md'))
+        with archive.open(xml_name) as member:
+            markdown_chunks = analysis_service.iter_markdown({'stream': member})
+            for _ in analysis_service.stream_markdown_to_file(markdown_chunks, markdown_path):
+                pass
+    print(f" - Markdown path: {markdown_path}\n")
+    index_disclosure_files([markdown_path], dict(disclosure or {}, rcept_no=rcept_no))
+
+    print(f"✅ [Tool 1 Success] Disclosure converted in memory: {rcept_no}")
+    return {
+        "rcept_no": rcept_no,
+        "xml_member": xml_name,
+        "markdown_path": markdown_path
+    }
+
+
+def index_disclosure_files(file_paths, disclosure=None):
+    """
+    다운로드/변환한 공시 파일을 로컬 검색 색인에 등록합니다. 색인 실패는 도구 결과에 영향을 주지 않습니다.
+    """
+    metadata = {key: (disclosure or {}).get(key) for key in ('rcept_no', 'corp_code', 'corp_name', 'rcept_dt', 'report_nm')}
+    for file_path in file_paths:
+        try:
+            search_index.get_search_index().index_file(file_path, metadata=metadata)
+        except Exception as e:
+            print(f"🔥 Error indexing {file_path}: {e}")
+
+
+def search_local_disclosures(query: str, corp_code: str = None, start_date: str = None, end_date: str = None,
+                             limit: int = 5) -> dict:
+    """
+    이미 다운로드한 공시 원문(XML)과 변환된 마크다운에서 검색어가 모두 포함된 공시를 찾아 반환합니다.
+    DART API나 LLM을 호출하지 않습니다.
+    """
+    try:
+        index = search_index.get_search_index()
+        stats = index.update()
+        if stats['indexed'] or stats['removed']:
+            print(f" - 검색 색인 갱신: 추가 {stats['indexed']}개, 삭제 {stats['removed']}개")
+        results = index.search(query, corp_code=corp_code or None, start_date=start_date or None,
+                               end_date=end_date or None, limit=limit)
+        print(f"✅ [Local Search] '{query}': {len(results)} filings")
+        return {"query": query, "results": results}
+    except Exception as e:
+        error_message = f"🔥 Error searching local disclosures for {query}: {e}"
+        print(error_message)
+        return error_message
+
+
+def find_corp_code(company_name: str) -> dict:
+    """
+    회사명(또는 6자리 종목코드)으로 DART 고유번호(corp_code)를 로컬 인덱스에서 찾아 반환합니다.
+    """
+    try:
+        index = corp_code_service.get_corp_code_index()
+        query = (company_name or '').strip()
+        if query.isdigit() and len(query) in (6, 8):
+            # 종목코드/고유번호는 이름 검색 대신 바로 조회
+            record = index.resolve(query)
+            matches = [record] if record else []
+        else:
+            matches = index.search(query, limit=5)
+        if not matches:
+            print(f"🔥 No company found for: {company_name}")
+            return {"matches": []}
+        print(f"✅ [Corp Code] {company_name} -> {matches[0]['corp_code']} ({matches[0]['corp_name']})")
+        return {"corp_code": matches[0]['corp_code'], "matches": matches}
+    except Exception as e:
+        error_message = f"🔥 Error resolving corp code for {company_name}: {e}"
+        print(error_message)
+        return error_message
+
+
 def read_file_content(file_path: str) -> str:
     """
     주어진 파일 경로(file_path)에 있는 텍스트 파일의 내용을 읽어서 반환합니다.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # EUC-KR/CP949로 저장된 공시 파일도 읽을 수 있도록 인코딩을 감지
+        content = xml_utils.read_xml_text(file_path)
         print(f"✅ [Tool 2 Success] Successfully read file: {file_path}")
         return {"content": content}
     except Exception as e:
@@ -0,0 +1,144 @@
+"""
+Cache Utility Module
+
+This module provides a small persistent key/value cache on top of SQLite.
+Entries carry an optional expiry time, the total size is capped with
+least-recently-used eviction, and WAL mode plus a busy timeout make the
+cache safe to share between concurrent processes.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+
+
+def make_cache_key(*parts):
+    """
+    Build a stable cache key from arbitrary string parts
+
+    Args:
+        *parts: Values that identify the cached entry
+
+    Returns:
+        str: SHA-256 hex digest of the parts
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class SqliteLRUCache:
+    """
+    Size-capped persistent cache with TTL and LRU eviction.
+
+    Values are stored as bytes. A ttl of None means the entry never expires
+    and is only removed by LRU eviction.
+    """
+
+    def __init__(self, db_path, max_bytes):
+        """
+        Args:
+            db_path: SQLite database path
+            max_bytes: Maximum total size of the cached values
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            ' key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,'
+            ' expires_at REAL, last_access REAL NOT NULL)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache (last_access)')
+
+    def _connection(self):
+        # SQLite connections must not be shared between threads
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        """
+        Return the cached value for a key, or None if it is missing or expired
+        """
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute('SELECT value, expires_at FROM cache WHERE key = ?', (key,)).fetchone()
+
+        if row is None or (row[1] is not None and row[1] <= now):
+            if row is not None:
+                conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+            self.misses += 1
+            return None
+
+        conn.execute('UPDATE cache SET last_access = ? WHERE key = ?', (now, key))
+        self.hits += 1
+        return row[0]
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value and evict least recently used entries beyond max_bytes
+
+        Args:
+            key: Cache key
+            value: Value as bytes
+            ttl: Seconds until the entry expires, or None to keep it until evicted
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        conn = self._connection()
+        conn.execute(
+            'INSERT OR REPLACE INTO cache (key, value, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)',
+            (key, value, len(value), expires_at, now)
+        )
+        self.evict()
+
+    def delete(self, key):
+        """Remove a single entry"""
+        self._connection().execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def evict(self):
+        """Drop expired entries, then the least recently used ones until the size cap is met"""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?', (time.time(),))
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM cache').fetchone()[0]
+            if total > self.max_bytes:
+                freed = 0
+                stale_keys = []
+                for key, size in conn.execute('SELECT key, size FROM cache ORDER BY last_access'):
+                    if total - freed <= self.max_bytes:
+                        break
+                    stale_keys.append((key,))
+                    freed += size
+                conn.executemany('DELETE FROM cache WHERE key = ?', stale_keys)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def clear(self):
+        """Remove every entry"""
+        self._connection().execute('DELETE FROM cache')
+
+    def stats(self):
+        """
+        Return hit/miss counters for this process and the current cache size
+
+        Returns:
+            dict: hits, misses, entries and size_bytes
+        """
+        entries, size = self._connection().execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache').fetchone()
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries, 'size_bytes': size}
@@ -8,6 +8,8 @@ and for reading and processing CSV data with filtering capabilities.
 import os
 import csv
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -59,6 +61,74 @@ def save_disclosures_to_csv(disclosures, filename=None):
         return None
 
 
+# Single worker so background exports are written one at a time, in submission order
+_export_executor = None
+_export_lock = threading.Lock()
+
+
+def save_disclosures_to_csv_in_background(disclosures, filename=None):
+    """
+    Save a disclosure list to CSV on a background thread
+
+    The caller does not wait for the file to be written; the export thread
+    is not a daemon, so pending exports still finish before the interpreter exits.
+
+    Args:
+        disclosures: List of disclosure documents (not modified afterwards by the caller)
+        filename: Optional filename (without path or extension)
+
+    Returns:
+        Future: Resolves to the path of the saved CSV file (None on failure)
+    """
+    global _export_executor
+    if _export_executor is None:
+        with _export_lock:
+            if _export_executor is None:
+                _export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='csv-export')
+    return _export_executor.submit(save_disclosures_to_csv, list(disclosures), filename)
+
+
+def filter_disclosures(disclosures, column_name, keyword):
+    """
+    Filter fetched disclosure records in memory and pick the latest match, in one pass
+
+    Same matching as read_csv_filter_to_json (case-insensitive substring of
+    the column) without writing and re-reading a CSV file.
+
+    Args:
+        disclosures: Disclosure records as returned by the DART list API
+        column_name: Name of the field to search in
+        keyword: Keyword to search for in the field
+
+    Returns:
+        dict: {
+            "filtered_rows": [row1, row2, ...],
+            "total_rows": number of records scanned,
+            "matched_rows": number of records that matched the filter,
+            "latest": matched record with the most recent rcept_dt ({} if none)
+        }
+    """
+    keyword = keyword.lower()
+    filtered_rows = []
+    latest = {}
+    total_rows = 0
+
+    for row in disclosures:
+        total_rows += 1
+        if keyword in str(row.get(column_name) or '').lower():
+            filtered_rows.append(row)
+            # Strictly greater keeps the first of equal dates, like get_latest_by_rcept_dt
+            if not latest or row.get('rcept_dt', '') > latest.get('rcept_dt', ''):
+                latest = row
+
+    return {
+        "filtered_rows": filtered_rows,
+        "total_rows": total_rows,
+        "matched_rows": len(filtered_rows),
+        "latest": latest
+    }
+
+
 def read_csv_filter_to_json(file_path, column_name, keyword):
     """
     Read a CSV file and filter rows where the specified column contains the keyword.
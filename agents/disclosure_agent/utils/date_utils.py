@@ -111,4 +111,29 @@ def is_date_between(date_str, start_date_str, end_date_str):
         end_date = datetime.strptime(end_date_str, '%Y%m%d')
         return start_date <= date <= end_date
     except ValueError:
-        return False
\ No newline at end of file
+        return False
+
+
+def split_date_range(start_date, end_date, days=7):
+    """
+    Split a date range into consecutive windows of at most N days
+
+    Args:
+        start_date: Start date in YYYYMMDD format
+        end_date: End date in YYYYMMDD format
+        days: Maximum number of days per window (default: 7)
+
+    Returns:
+        List: (window_start, window_end) tuples in YYYYMMDD format
+    """
+    start_dt = datetime.strptime(str(start_date), '%Y%m%d')
+    end_dt = datetime.strptime(str(end_date), '%Y%m%d')
+    step = timedelta(days=days)
+
+    windows = []
+    current_dt = start_dt
+    while current_dt <= end_dt:
+        window_end_dt = min(current_dt + step - timedelta(days=1), end_dt)
+        windows.append((current_dt.strftime('%Y%m%d'), window_end_dt.strftime('%Y%m%d')))
+        current_dt += step
+    return windows
@@ -7,6 +7,7 @@ such as extracting ZIP files and handling file paths.
 
 import os
 import shutil
+import tempfile
 import zipfile
 from pathlib import Path
 
@@ -105,4 +106,123 @@ def list_extracted_files(extract_path, extensions=None):
 
     except Exception as e:
         print(f"Error listing files: {str(e)}")
-        return []
\ No newline at end of file
+        return []
+
+# Archives larger than this are spilled from memory to a temporary file
+DEFAULT_SPOOL_THRESHOLD = 32 * 1024 * 1024
+
+# Block size used when copying archive bytes without loading them at once
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class DisclosureArchive:
+    """
+    ZIP archive held in memory whose members are opened lazily.
+
+    The archive bytes live in a SpooledTemporaryFile, which stays in memory
+    until spool_threshold bytes and transparently spills to a temporary file
+    beyond that. Members are read straight from the archive without
+    extracting anything to disk.
+
+    Example:
+        with DisclosureArchive.from_chunks(response.iter_content(65536)) as archive:
+            xml_content = archive.read_text(archive.namelist(['.xml'])[0])
+    """
+
+    def __init__(self, fileobj):
+        """
+        Args:
+            fileobj: Seekable binary file object containing a ZIP archive
+        """
+        self._file = fileobj
+        self._zip = zipfile.ZipFile(fileobj)
+
+    @classmethod
+    def from_chunks(cls, chunks, spool_threshold=DEFAULT_SPOOL_THRESHOLD):
+        """
+        Build an archive from an iterable of byte chunks (e.g. an HTTP response body)
+
+        Args:
+            chunks: Iterable of bytes
+            spool_threshold: Size in bytes above which the data is spilled to a temporary file
+
+        Returns:
+            DisclosureArchive
+        """
+        spooled = tempfile.SpooledTemporaryFile(max_size=spool_threshold)
+        try:
+            for chunk in chunks:
+                if chunk:
+                    spooled.write(chunk)
+            spooled.seek(0)
+            return cls(spooled)
+        except Exception:
+            spooled.close()
+            raise
+
+    @classmethod
+    def from_path(cls, zip_path):
+        """Open an archive that already exists on disk"""
+        return cls(open(zip_path, 'rb'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release the archive and its backing buffer"""
+        self._zip.close()
+        self._file.close()
+
+    def namelist(self, extensions=None):
+        """
+        List member names, optionally filtered by extensions
+
+        Args:
+            extensions (list, optional): File extensions to filter by (e.g. ['.xml'])
+
+        Returns:
+            list: Member names in archive order
+        """
+        names = [info.filename for info in self._zip.infolist() if not info.is_dir()]
+        if extensions:
+            names = [name for name in names if any(name.lower().endswith(ext.lower()) for ext in extensions)]
+        return names
+
+    def open(self, name):
+        """Open a member as a binary file object without extracting it"""
+        return self._zip.open(name)
+
+    def read_text(self, name, encoding='utf-8'):
+        """Read a member and decode it as text"""
+        with self._zip.open(name) as member:
+            return member.read().decode(encoding)
+
+    def iter_bytes(self, chunk_size=COPY_CHUNK_SIZE):
+        """
+        Yield the raw archive bytes block by block, without holding the whole archive in memory
+
+        Args:
+            chunk_size: Block size in bytes
+
+        Yields:
+            bytes: Consecutive blocks of the archive
+        """
+        self._file.seek(0)
+        try:
+            while True:
+                chunk = self._file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            self._file.seek(0)
+
+    def getvalue(self):
+        """Return the raw archive bytes"""
+        self._file.seek(0)
+        data = self._file.read()
+        self._file.seek(0)
+        return data
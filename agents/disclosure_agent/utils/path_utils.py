@@ -19,4 +19,22 @@ def ensure_download_directory():
         data_dir.mkdir()
         print(f"Created data directory at {data_dir}")
 
-    return data_dir
\ No newline at end of file
+    return data_dir
+
+
+def ensure_cache_directory(name=None):
+    """
+    Ensure that the local cache directory (inside the data directory) exists
+
+    Args:
+        name: Optional sub-directory name within the cache directory
+
+    Returns:
+        Path: Path to the cache directory
+    """
+    cache_dir = ensure_download_directory() / '.cache'
+    if name:
+        cache_dir = cache_dir / name
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
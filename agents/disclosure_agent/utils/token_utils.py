@@ -0,0 +1,55 @@
+"""
+Token Utility Module
+
+This module estimates how many LLM tokens a text will use without calling
+a tokenizer. The estimate is meant for sizing prompts and reporting, not
+for exact billing: ASCII text averages about four characters per token,
+while Hangul and other non-ASCII characters use far more tokens per
+character.
+"""
+
+import math
+
+# Average characters per token by script
+ASCII_CHARS_PER_TOKEN = 4.0
+NON_ASCII_CHARS_PER_TOKEN = 1.5
+
+
+def estimate_tokens(text):
+    """
+    Estimate the number of tokens in a text
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        int: Estimated token count
+    """
+    if not text:
+        return 0
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    non_ascii_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / ASCII_CHARS_PER_TOKEN + non_ascii_chars / NON_ASCII_CHARS_PER_TOKEN)
+
+
+def compare_sizes(before, after):
+    """
+    Compare two versions of a text by characters and estimated tokens
+
+    Args:
+        before: Original text
+        after: Reduced text
+
+    Returns:
+        dict: chars_before, chars_after, tokens_before, tokens_after and reduction
+            (fraction of estimated tokens removed, 0.0 ~ 1.0)
+    """
+    tokens_before = estimate_tokens(before)
+    tokens_after = estimate_tokens(after)
+    return {
+        'chars_before': len(before),
+        'chars_after': len(after),
+        'tokens_before': tokens_before,
+        'tokens_after': tokens_after,
+        'reduction': 1 - tokens_after / tokens_before if tokens_before else 0.0,
+    }
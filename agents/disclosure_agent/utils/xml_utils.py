@@ -0,0 +1,423 @@
+"""
+XML Utility Module
+
+This module provides text-level helpers for DART disclosure XML. DART
+documents are frequently not well-formed (unescaped '&', unclosed <P> and
+<BR> tags), so these helpers work on the raw markup with regular expressions
+instead of a strict XML parser.
+
+Large documents can be read as a stream of decoded text pieces
+(iter_xml_text) and cut into sections (iter_sections) and conversion chunks
+(iter_chunks) without ever holding the whole file in memory.
+"""
+
+import codecs
+import re
+
+# Chunks of a document converted in one LLM call are kept below this many characters
+DEFAULT_CHUNK_CHARS = 30000
+# Characters decoded per read when streaming a document
+DEFAULT_READ_CHARS = 1024 * 1024
+# A streamed section larger than this is passed on in pieces cut at tag boundaries
+DEFAULT_MAX_SECTION_CHARS = 8 * DEFAULT_CHUNK_CHARS
+# Bytes inspected to detect the encoding of a document
+ENCODING_SNIFF_BYTES = 4096
+
+# Korean encoding names that are decoded as cp949 (a superset of EUC-KR)
+KOREAN_ENCODINGS = ('euc-kr', 'euckr', 'euc_kr', 'ks_c_5601-1987', 'ksc5601', 'cp949', 'ms949', 'uhc')
+
+# Presentation-only attributes removed by minify_xml (COLSPAN/ROWSPAN and codes are kept)
+STYLE_ATTRIBUTES = (
+    'ACLASS', 'AALIGN', 'ALIGN', 'VALIGN', 'WIDTH', 'HEIGHT', 'BORDER', 'USERMARK', 'ATOC', 'ATOCID',
+    'AASSOCNOTE', 'APARTSOURCE', 'ADELETETABLE', 'ADELETECONT', 'AUPDATECONT', 'AFIXTABLE', 'ACOPY', 'ACOPYCOL',
+)
+
+_STYLE_ATTRIBUTE_PATTERN = re.compile(
+    r'\s+(?:' + '|'.join(STYLE_ATTRIBUTES) + r')\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+)', re.I
+)
+_DECLARATION_PATTERN = re.compile(r'<\?.*?\?>|<!--.*?-->', re.S)
+# Elements whose content is never needed for conversion (table of contents, column widths, page breaks)
+_DROPPED_ELEMENT_PATTERN = re.compile(r'<(TOC|COLGROUP)\b[^>]*>.*?</\1\s*>|<(?:COL|PGBRK)\b[^>]*/?>', re.S | re.I)
+_SPAN_TAG_PATTERN = re.compile(r'</?SPAN\b[^>]*>', re.I)
+_EMPTY_ELEMENT_PATTERN = re.compile(r'<(P|TITLE)>\s*</\1>|<P\s*/>', re.I)
+_EMPTY_CELL_PATTERN = re.compile(r'<(TD|TH|TE|TU)\b([^>]*)>\s*</\1>', re.I)
+_LAYOUT_WHITESPACE_PATTERN = re.compile(r'>\s*\n\s*<')
+_WHITESPACE_PATTERN = re.compile(r'[ \t\r\n\u3000]+')
+
+_DOCUMENT_NAME_PATTERN = re.compile(r'<DOCUMENT-NAME\b[^>]*>(.*?)</DOCUMENT-NAME>', re.S)
+_COMPANY_NAME_PATTERN = re.compile(r'<COMPANY-NAME\b[^>]*>(.*?)</COMPANY-NAME>', re.S)
+# The DART corp code of the filer is kept in the AREGCIK attribute of COMPANY-NAME
+_CORP_CODE_PATTERN = re.compile(r'<COMPANY-NAME\b[^>]*\bAREGCIK\s*=\s*["\']?(\d{8})', re.I)
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_ENCODING_DECLARATION_PATTERN = re.compile(rb'<\?xml[^>]*?encoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']', re.I)
+
+
+def detect_encoding(head):
+    """
+    Detect the text encoding of a DART document from its first bytes
+
+    A byte order mark wins, then the XML declaration. Korean names are
+    mapped to cp949, and a declaration of UTF-8 that the bytes contradict
+    falls back to cp949, which older filings use without saying so.
+
+    Args:
+        head: First bytes of the document (ENCODING_SNIFF_BYTES is enough)
+
+    Returns:
+        str: Codec name usable with bytes.decode
+    """
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+
+    declared = _ENCODING_DECLARATION_PATTERN.search(head)
+    if declared:
+        name = declared.group(1).decode('ascii').lower()
+        if name in KOREAN_ENCODINGS:
+            return 'cp949'
+        try:
+            name = codecs.lookup(name).name
+        except LookupError:
+            name = 'utf-8'
+        if name != 'utf-8':
+            return name
+
+    try:
+        head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the end of the sample is still valid UTF-8
+        if e.start < len(head) - 3:
+            return 'cp949'
+    return 'utf-8'
+
+
+def iter_xml_text(source, read_chars=DEFAULT_READ_CHARS, encoding=None):
+    """
+    Read a DART document as a stream of decoded text pieces
+
+    Only one piece is held in memory at a time. Bytes that are invalid in
+    the detected encoding are replaced instead of aborting the read.
+
+    Args:
+        source: File path, or a binary file object such as an archive member (read to the end, not closed)
+        read_chars: Approximate size of each piece in characters
+        encoding: Codec to use instead of detect_encoding
+
+    Yields:
+        str: Consecutive pieces of the document text
+    """
+    if not hasattr(source, 'read'):
+        with open(source, 'rb') as f:
+            yield from iter_xml_text(f, read_chars=read_chars, encoding=encoding)
+        return
+
+    head = source.read(ENCODING_SNIFF_BYTES)
+    decoder = codecs.getincrementaldecoder(encoding or detect_encoding(head))(errors='replace')
+    data = head
+    while data:
+        text = decoder.decode(data)
+        if text:
+            yield text.replace('\r\n', '\n')
+        data = source.read(read_chars)
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+def read_xml_text(source, encoding=None):
+    """
+    Read a whole DART document with encoding detection
+
+    Args:
+        source: File path or binary file object
+        encoding: Codec to use instead of detect_encoding
+
+    Returns:
+        str: Document text
+    """
+    return ''.join(iter_xml_text(source, encoding=encoding))
+
+
+def strip_tags(markup):
+    """
+    Remove every tag from a markup fragment and collapse whitespace
+
+    Args:
+        markup: XML fragment
+
+    Returns:
+        str: Plain text of the fragment
+    """
+    return ' '.join(_TAG_PATTERN.sub(' ', markup).split())
+
+
+def extract_document_info(xml_content):
+    """
+    Read the document name, company name and corp code from the header of a DART document
+
+    Args:
+        xml_content: Raw DART XML
+
+    Returns:
+        dict: {"document_name": str, "company_name": str, "corp_code": str} (empty strings if missing)
+    """
+    document_name = _DOCUMENT_NAME_PATTERN.search(xml_content)
+    company_name = _COMPANY_NAME_PATTERN.search(xml_content)
+    corp_code = _CORP_CODE_PATTERN.search(xml_content)
+    return {
+        'document_name': strip_tags(document_name.group(1)) if document_name else '',
+        'company_name': strip_tags(company_name.group(1)) if company_name else '',
+        'corp_code': corp_code.group(1) if corp_code else '',
+    }
+
+
+def split_sections(xml_content, level=1):
+    """
+    Split markup on its <SECTION-n> elements of the given level
+
+    Nested sections of the same level are kept inside their outer section.
+    Text between two sections is attached to the preceding section.
+
+    Args:
+        xml_content: Raw DART XML or a fragment of it
+        level: Section level to split on (1 for SECTION-1, 2 for SECTION-2, ...)
+
+    Returns:
+        tuple: (preamble, sections, trailer) where sections is a list of complete
+            <SECTION-n>...</SECTION-n> fragments in document order
+    """
+    pattern = re.compile(rf'<SECTION-{level}\b[^>]*>|</SECTION-{level}\s*>')
+    sections = []
+    depth = 0
+    start = None
+    last_end = None
+    preamble_end = None
+
+    for match in pattern.finditer(xml_content):
+        if not match.group(0).startswith('</'):
+            if depth == 0:
+                if preamble_end is None:
+                    preamble_end = match.start()
+                elif sections and match.start() > last_end:
+                    # Loose markup between two sections belongs to the previous one
+                    sections[-1] += xml_content[last_end:match.start()]
+                start = match.start()
+            depth += 1
+        elif depth > 0:
+            depth -= 1
+            if depth == 0:
+                last_end = match.end()
+                sections.append(xml_content[start:last_end])
+
+    if not sections:
+        return xml_content, [], ''
+
+    # An unclosed last section runs to the end of the document
+    if depth > 0:
+        sections.append(xml_content[start:])
+        return xml_content[:preamble_end], sections, ''
+
+    return xml_content[:preamble_end], sections, xml_content[last_end:]
+
+
+def _section_heading(section):
+    """Opening tag plus the TITLE of a section, repeated as context for its split parts"""
+    title = re.search(r'<TITLE\b[^>]*>.*?</TITLE>', section, re.S)
+    if title is None:
+        return ''
+    return section[:section.index('>') + 1] + title.group(0)
+
+
+def _pack(fragments, max_chars):
+    """Greedily merge consecutive fragments into chunks of at most max_chars"""
+    chunks = []
+    current = ''
+    for fragment in fragments:
+        if current and len(current) + len(fragment) > max_chars:
+            chunks.append(current)
+            current = ''
+        current += fragment
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _split_oversized(section, level, max_chars):
+    """Split a section larger than max_chars on its sub-sections"""
+    if len(section) <= max_chars:
+        return [section]
+
+    head, subsections, tail = split_sections(section, level=level + 1)
+    if not subsections:
+        return [section]
+
+    fragments = [head]
+    for subsection in subsections:
+        fragments.extend(_split_oversized(subsection, level + 1, max_chars))
+    fragments[-1] += tail
+
+    parts = _pack(fragments, max_chars)
+    # Later parts lose the section title, so repeat it in front of them
+    heading = _section_heading(section)
+    return parts[:1] + [heading + part for part in parts[1:]]
+
+
+def split_into_chunks(xml_content, max_chars=DEFAULT_CHUNK_CHARS):
+    """
+    Split a DART document into ordered chunks that can be converted independently
+
+    The document is cut on its SECTION-1 boundaries; consecutive small
+    sections are merged and sections larger than max_chars are split further
+    on SECTION-2 (and deeper) boundaries.
+
+    Args:
+        xml_content: Raw DART XML
+        max_chars: Target maximum chunk size in characters
+
+    Returns:
+        list: XML chunks in document order (a single chunk if the document has no sections)
+    """
+    preamble, sections, trailer = split_sections(xml_content, level=1)
+    if not sections:
+        return [xml_content]
+
+    fragments = [preamble]
+    for section in sections:
+        fragments.extend(_split_oversized(section, 1, max_chars))
+    fragments[-1] += trailer
+    return _pack(fragments, max_chars)
+
+
+def _cut_at_tag(text, max_chars):
+    """Length of the longest prefix of text, at most max_chars long, that ends right after a tag"""
+    cut = text.rfind('>', 0, max_chars) + 1
+    return cut or max_chars
+
+
+def iter_sections(text_pieces, level=1, max_chars=DEFAULT_MAX_SECTION_CHARS):
+    """
+    Cut a streamed document into consecutive fragments on its <SECTION-n> boundaries
+
+    Each complete <SECTION-n>...</SECTION-n> element of the given level is
+    yielded as one fragment; markup before, between and after the sections is
+    yielded as separate fragments. A fragment that grows beyond max_chars is
+    passed on in pieces cut after a tag, so memory stays bounded by max_chars
+    however large the document or a single section is. Joining the fragments
+    gives back the document unchanged.
+
+    Args:
+        text_pieces: Iterable of document text pieces (e.g. from iter_xml_text)
+        level: Section level to cut on
+        max_chars: Largest fragment held in memory
+
+    Yields:
+        str: Document fragments in order
+    """
+    pattern = re.compile(rf'<SECTION-{level}\b[^>]*>|</SECTION-{level}\s*>')
+    buffer = ''
+    scan_from = 0
+    depth = 0
+
+    def bounded(fragment):
+        while len(fragment) > max_chars:
+            cut = _cut_at_tag(fragment, max_chars)
+            yield fragment[:cut]
+            fragment = fragment[cut:]
+        if fragment:
+            yield fragment
+
+    for piece in text_pieces:
+        buffer += piece
+        # A tag may be cut off at the end of the piece, so only scan up to the last complete tag
+        scan_to = buffer.rfind('>') + 1
+        start = 0
+        for match in pattern.finditer(buffer, scan_from, scan_to):
+            if not match.group(0).startswith('</'):
+                if depth == 0 and match.start() > start:
+                    yield from bounded(buffer[start:match.start()])
+                    start = match.start()
+                depth += 1
+            elif depth > 0:
+                depth -= 1
+                if depth == 0:
+                    yield from bounded(buffer[start:match.end()])
+                    start = match.end()
+
+        # Pass on the scanned part of an oversized open fragment, keeping only the unfinished tag
+        if len(buffer) - start > max_chars:
+            yield from bounded(buffer[start:scan_to])
+            start = scan_to
+
+        buffer = buffer[start:]
+        scan_from = max(0, scan_to - start)
+
+    yield from bounded(buffer)
+
+
+def iter_chunks(fragments, max_chars=DEFAULT_CHUNK_CHARS):
+    """
+    Streaming counterpart of split_into_chunks
+
+    Consecutive small fragments are merged, sections larger than max_chars
+    are split on their sub-sections, and anything still too large is cut
+    after a tag.
+
+    Args:
+        fragments: Document fragments from iter_sections (optionally minified one by one)
+        max_chars: Target maximum chunk size in characters
+
+    Yields:
+        str: XML chunks in document order
+    """
+    current = ''
+    for fragment in fragments:
+        if fragment.startswith('<SECTION-1'):
+            parts = _split_oversized(fragment, 1, max_chars)
+        else:
+            parts = [fragment]
+
+        for part in parts:
+            while len(part) > max_chars:
+                cut = _cut_at_tag(part, max_chars)
+                if current:
+                    yield current
+                    current = ''
+                yield part[:cut]
+                part = part[cut:]
+            if current and len(current) + len(part) > max_chars:
+                yield current
+                current = ''
+            current += part
+
+    if current:
+        yield current
+
+
+def minify_xml(xml_content):
+    """
+    Strip presentation-only markup from a DART document
+
+    Removes the XML declaration and comments, styling attributes, the table
+    of contents, column width definitions, page breaks, SPAN wrappers and
+    empty paragraphs, and collapses whitespace (empty table cells keep their
+    position so row and column spans still line up). Text, headings, table structure (including COLSPAN and
+    ROWSPAN) and data codes are preserved, so the result converts to the
+    same Markdown with far fewer prompt tokens.
+
+    Args:
+        xml_content: Raw DART XML
+
+    Returns:
+        str: Minified XML
+    """
+    text = _DECLARATION_PATTERN.sub('', xml_content)
+    text = _DROPPED_ELEMENT_PATTERN.sub('', text)
+    text = _STYLE_ATTRIBUTE_PATTERN.sub('', text)
+    text = _SPAN_TAG_PATTERN.sub('', text)
+    # Indentation between tags carries no content; other whitespace runs become one space
+    text = _LAYOUT_WHITESPACE_PATTERN.sub('><', text)
+    text = _WHITESPACE_PATTERN.sub(' ', text)
+    text = _EMPTY_CELL_PATTERN.sub(r'<\1\2></\1>', text)
+    text = _EMPTY_ELEMENT_PATTERN.sub('', text)
+    return text.strip()